@@ -43,6 +43,8 @@ func execute(method: String, params: Dictionary) -> Dictionary:
 			return _count_nodes(params)
 		"get_children":
 			return _get_children(params)
+		"batch":
+			return {"result": {"results": execute_batch(params.get("requests", []), true)}}
 
 		# Input operations
 		"click":
@@ -262,6 +264,58 @@ func _get_children(params: Dictionary) -> Dictionary:
 	return {"result": {"children": children}}
 
 
+# Batch operations
+
+## Run several node operations in one request and return their results in order.
+##
+## Each request is a Dictionary with an "op" key ("get_property", "set_property",
+## "call_method", "node_exists" or "get_node") plus that operation's params.
+## Each result is {"value": ...} or {"error": message}. Only synchronous
+## operations are supported so the whole batch completes within one frame.
+## serialize converts Vector2/Color/Object values for JSON transports; native
+## callers pass false to receive Variants unchanged.
+func execute_batch(requests: Array, serialize: bool = false) -> Array:
+	var results: Array = []
+	for request in requests:
+		if not request is Dictionary:
+			results.append({"error": "Invalid batch request"})
+			continue
+		results.append(_execute_batch_op(request, serialize))
+	return results
+
+
+func _execute_batch_op(request: Dictionary, serialize: bool) -> Dictionary:
+	var op: String = request.get("op", "")
+	var path: String = request.get("path", "")
+	var node = get_tree().root.get_node_or_null(path)
+
+	if op == "node_exists":
+		return {"value": node != null}
+
+	if node == null:
+		return {"error": "Node not found: " + path}
+
+	var value = null
+	match op:
+		"get_property":
+			value = node.get(request.get("property", ""))
+		"set_property":
+			var property: String = request.get("property", "")
+			node.set(property, _deserialize_value(request.get("value"), node.get(property)))
+			value = true
+		"call_method":
+			var method: String = request.get("method", "")
+			if not node.has_method(method):
+				return {"error": "Method not found: " + method}
+			value = node.callv(method, request.get("args", []))
+		"get_node":
+			return {"value": _serialize_node(node)}
+		_:
+			return {"error": "Unsupported batch op: " + op}
+
+	return {"value": _serialize_value(value) if serialize else value}
+
+
 # Waiting operations
 
 func _wait_signal(params: Dictionary) -> Dictionary:
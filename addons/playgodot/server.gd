@@ -6,13 +6,25 @@ extends Node
 const Commands = preload("res://addons/playgodot/commands.gd")
 const DEFAULT_PORT = 9999
 
+## Emitted every frame while a watch's condition holds, until clear_watch().
+## Clients wait on it with wait_signal, so a watch satisfied before the wait
+## request arrives is still reported on the next frame.
+signal watch_triggered(watch_id: int, value: Variant)
+
+enum WatchType { PROPERTY, NODE, SIGNAL }
+
 var _server: TCPServer = null
 var _peers: Array[WebSocketPeer] = []
 var _commands: Commands = null
 var _port: int = DEFAULT_PORT
+var _watches: Dictionary = {}  # Dictionary[int, Dictionary] - active watches by id
+var _next_watch_id: int = 1
 
 
 func _ready() -> void:
+	# Keep serving automation and watches while the game is paused
+	process_mode = Node.PROCESS_MODE_ALWAYS
+
 	_commands = Commands.new(self)
 	add_child(_commands)
 
@@ -69,6 +81,9 @@ func _start_server() -> void:
 
 
 func _process(_delta: float) -> void:
+	if not _watches.is_empty():
+		_update_watches()
+
 	if _server == null:
 		return
 
@@ -134,6 +149,110 @@ func _handle_message(peer: WebSocketPeer, message: String) -> void:
 		_send_result(peer, id, result.get("result", null))
 
 
+## Run several node operations in one call (see Commands.execute_batch).
+## Called through the native protocol's call_method on /root/PlayGodotServer,
+## so a whole batch costs a single round-trip.
+func batch(requests: Array) -> Array:
+	return _commands.execute_batch(requests)
+
+
+# Watches (event-driven waits)
+
+## Watch until a node property equals expected. Returns the watch id.
+func watch_property(path: String, property: String, expected: Variant) -> int:
+	return _add_watch({"type": WatchType.PROPERTY, "path": path, "property": property, "expected": expected})
+
+
+## Watch until a node exists at path. Returns the watch id.
+func watch_node(path: String) -> int:
+	var watch_id := _add_watch({"type": WatchType.NODE, "path": path})
+	# node_added fires for every node in the tree, so only listen while needed
+	if not get_tree().node_added.is_connected(_on_node_added):
+		get_tree().node_added.connect(_on_node_added)
+	return watch_id
+
+
+## Watch until a node emits a signal (up to four arguments). The signal
+## arguments become the triggered value. Returns the watch id, or -1 if the
+## signal doesn't exist.
+func watch_signal(path: String, signal_name: String) -> int:
+	var node := get_tree().root.get_node_or_null(path)
+	if node == null or not node.has_signal(signal_name):
+		return -1
+
+	var arg_count := 0
+	for sig in node.get_signal_list():
+		if sig["name"] == signal_name:
+			arg_count = sig["args"].size()
+			break
+
+	var watch_id := _add_watch({"type": WatchType.SIGNAL, "path": path})
+	var on_signal := func(a = null, b = null, c = null, d = null) -> void:
+		if _watches.has(watch_id):
+			_watches[watch_id]["satisfied"] = true
+			_watches[watch_id]["value"] = [a, b, c, d].slice(0, arg_count)
+	node.connect(signal_name, on_signal, CONNECT_ONE_SHOT)
+	return watch_id
+
+
+## Stop a watch and its per-frame notifications.
+func clear_watch(watch_id: int) -> void:
+	_watches.erase(watch_id)
+	var has_node_watch := _watches.values().any(func(w): return w["type"] == WatchType.NODE)
+	if not has_node_watch and get_tree().node_added.is_connected(_on_node_added):
+		get_tree().node_added.disconnect(_on_node_added)
+
+
+func _add_watch(watch: Dictionary) -> int:
+	var watch_id := _next_watch_id
+	_next_watch_id += 1
+	watch["satisfied"] = false
+	watch["value"] = null
+	_watches[watch_id] = watch
+	_check_watch(watch)
+	return watch_id
+
+
+func _update_watches() -> void:
+	for watch_id in _watches.keys():
+		var watch: Dictionary = _watches[watch_id]
+		if not watch["satisfied"]:
+			_check_watch(watch)
+		if watch["satisfied"]:
+			watch_triggered.emit(watch_id, watch["value"])
+
+
+func _check_watch(watch: Dictionary) -> void:
+	match watch["type"]:
+		WatchType.PROPERTY:
+			var node := get_tree().root.get_node_or_null(watch["path"])
+			if node:
+				var value = node.get(watch["property"])
+				if _values_equal(value, watch["expected"]):
+					watch["satisfied"] = true
+					watch["value"] = value
+		WatchType.NODE:
+			if get_tree().root.get_node_or_null(watch["path"]) != null:
+				watch["satisfied"] = true
+				watch["value"] = true
+
+
+func _on_node_added(_node: Node) -> void:
+	for watch in _watches.values():
+		if watch["type"] == WatchType.NODE and not watch["satisfied"]:
+			_check_watch(watch)
+
+
+func _values_equal(a: Variant, b: Variant) -> bool:
+	## Compare values from the client, treating int and float as the same type
+	var numeric := [TYPE_INT, TYPE_FLOAT]
+	if typeof(a) in numeric and typeof(b) in numeric:
+		return a == b
+	if typeof(a) != typeof(b):
+		return false
+	return a == b
+
+
 func _send_result(peer: WebSocketPeer, id: Variant, result: Variant) -> void:
 	var response = {
 		"jsonrpc": "2.0",
@@ -759,7 +759,7 @@ func save_chunk(chunk_coord: Vector2i, modified_tiles: Dictionary) -> bool:
 		push_error("[SaveManager] Failed to open chunk file for writing: %s" % path)
 		return false
 
-	# Store with compression
+	# true = full_objects (not compression), matching get_var(true) in load_chunk
 	file.store_var(modified_tiles, true)
 	file.close()
 	return true
@@ -0,0 +1,66 @@
+class_name MinerVariants
+## Swing animations for every tool x helmet combination.
+##
+## Frames come from the packed atlas written by
+## scripts/tools/generate_miner_variants.py: miner_variants.tres holds one
+## AtlasTexture per frame in its "regions" metadata, named
+## "<tool_id>/<helmet_id>/<frame>" (helmet "none" = default hardhat).
+## Trim margins keep every frame at the full 128x128 size.
+##
+## Usage:
+##   var frames := MinerVariants.get_frames("iron_pickaxe", "miners_helmet")
+##   if frames:
+##       sprite.sprite_frames = frames
+
+const ATLAS_PATH := "res://resources/sprites/variants/miner_variants.tres"
+const NO_HELMET := "none"
+const ANIMATION := &"swing"
+const FRAME_COUNT := 8
+const ANIMATION_SPEED := 10.0
+
+## "<tool_id>/<helmet_id>" -> SpriteFrames, built on first use
+static var _frames_cache: Dictionary = {}
+static var _regions: Dictionary = {}
+static var _loaded: bool = false
+
+
+## SpriteFrames with the "swing" animation for a tool and helmet.
+## Returns null if the atlas or the combination is missing, so callers keep
+## their default frames.
+static func get_frames(tool_id: String, helmet_id: String) -> SpriteFrames:
+	var helmet: String = helmet_id if helmet_id != "" else NO_HELMET
+	var key: String = "%s/%s" % [tool_id, helmet]
+	if _frames_cache.has(key):
+		return _frames_cache[key]
+
+	var regions: Dictionary = _get_regions()
+	if not regions.has("%s/0" % key):
+		return null
+
+	var frames := SpriteFrames.new()
+	if frames.has_animation(&"default"):
+		frames.remove_animation(&"default")
+	frames.add_animation(ANIMATION)
+	frames.set_animation_speed(ANIMATION, ANIMATION_SPEED)
+	frames.set_animation_loop(ANIMATION, false)
+	for i in FRAME_COUNT:
+		var texture: Texture2D = regions.get("%s/%d" % [key, i])
+		if texture == null:
+			return null
+		frames.add_frame(ANIMATION, texture)
+
+	_frames_cache[key] = frames
+	return frames
+
+
+static func _get_regions() -> Dictionary:
+	if _loaded:
+		return _regions
+	_loaded = true
+	if not ResourceLoader.exists(ATLAS_PATH):
+		push_warning("[MinerVariants] Atlas not found: %s" % ATLAS_PATH)
+		return _regions
+	var atlas: Resource = load(ATLAS_PATH)
+	if atlas and atlas.has_meta("regions"):
+		_regions = atlas.get_meta("regions")
+	return _regions
@@ -5,6 +5,7 @@ extends CharacterBody2D
 ## Supports tap-to-dig: tap or hold on adjacent blocks to mine them.
 
 const TileTypesScript = preload("res://scripts/world/tile_types.gd")
+const EquipmentDataClass = preload("res://resources/equipment/equipment_data.gd")
 
 signal block_destroyed(grid_pos: Vector2i)
 signal depth_changed(depth: int)
@@ -112,6 +113,9 @@ signal heat_damage_warning(damage_per_second: float)
 # Squash/stretch animation state
 var _scale_tween: Tween
 
+# Scene SpriteFrames, used when no tool/helmet variant is packed
+var _default_frames: SpriteFrames
+
 @onready var sprite: AnimatedSprite2D = $AnimatedSprite2D
 @onready var camera: Camera2D = $GameCamera
 
@@ -122,6 +126,12 @@ func _ready() -> void:
 
 	grid_position = _world_to_grid(position)
 	sprite.animation_finished.connect(_on_animation_finished)
+	# Swing frames for the equipped tool and helmet (scene frames are the fallback)
+	_default_frames = sprite.sprite_frames
+	if PlayerData:
+		PlayerData.tool_changed.connect(_on_tool_changed)
+		PlayerData.equipment_changed.connect(_on_equipment_changed)
+	_update_miner_frames()
 	# Emit initial HP state
 	hp_changed.emit(current_hp, MAX_HP)
 
@@ -380,6 +390,26 @@ func _show_blocked_feedback(target_block: Vector2i) -> void:
 	)
 
 
+## Show the swing frames for PlayerData's equipped tool and helmet
+func _update_miner_frames() -> void:
+	var frames: SpriteFrames = null
+	if PlayerData:
+		frames = MinerVariants.get_frames(PlayerData.equipped_tool_id, PlayerData.equipped_helmet_id)
+	if frames == null:
+		frames = _default_frames
+	if frames and sprite.sprite_frames != frames:
+		sprite.sprite_frames = frames
+
+
+func _on_tool_changed(_tool) -> void:
+	_update_miner_frames()
+
+
+func _on_equipment_changed(slot: int, _equipment) -> void:
+	if slot == EquipmentDataClass.EquipmentSlot.HELMET:
+		_update_miner_frames()
+
+
 func _on_animation_finished() -> void:
 	if current_state != State.MINING:
 		return
@@ -0,0 +1,24 @@
+class_name SpriteAtlas
+## Item icons and building sprites from the packed texture atlas.
+##
+## scripts/tools/atlas_packer.py packs them onto a few power-of-two pages and
+## writes atlas.tres, whose "regions" metadata maps "items/<item_id>" and
+## "buildings/<shop_type_name>" to AtlasTextures. Trim margins keep each
+## texture at its original size, so it can replace the separate PNG as-is.
+
+## Preloaded so web exports pack the atlas pages
+const ATLAS := preload("res://resources/sprites/atlas/atlas.tres")
+
+
+## The region's texture, or null if the atlas has no sprite by that name.
+static func get_texture(region_name: String) -> Texture2D:
+	var regions: Dictionary = ATLAS.get_meta("regions", {})
+	return regions.get(region_name)
+
+
+static func get_item_icon(item_id: String) -> Texture2D:
+	return get_texture("items/" + item_id)
+
+
+static func get_building(shop_type_name: String) -> Texture2D:
+	return get_texture("buildings/" + shop_type_name)
@@ -32,20 +32,6 @@ signal player_exited(shop_type: ShopType)
 @onready var label: Label = $Label
 @onready var building_sprite: Sprite2D = $BuildingSprite
 
-## Preloaded building sprite textures for each shop type
-const BUILDING_SPRITES = {
-	ShopType.GENERAL_STORE: preload("res://resources/sprites/buildings/general_store.png"),
-	ShopType.SUPPLY_STORE: preload("res://resources/sprites/buildings/supply_store.png"),
-	ShopType.BLACKSMITH: preload("res://resources/sprites/buildings/blacksmith.png"),
-	ShopType.EQUIPMENT_SHOP: preload("res://resources/sprites/buildings/equipment_shop.png"),
-	ShopType.GEM_APPRAISER: preload("res://resources/sprites/buildings/gem_appraiser.png"),
-	ShopType.WAREHOUSE: preload("res://resources/sprites/buildings/warehouse.png"),
-	ShopType.GADGET_SHOP: preload("res://resources/sprites/buildings/gadget_shop.png"),
-	ShopType.ELEVATOR: preload("res://resources/sprites/buildings/elevator.png"),
-	ShopType.REST_STATION: preload("res://resources/sprites/buildings/rest_station.png"),
-	ShopType.RESEARCH_LAB: preload("res://resources/sprites/buildings/research_lab.png"),
-}
-
 var player_nearby: bool = false
 
 func _ready() -> void:
@@ -107,8 +93,9 @@ func _update_building_sprite() -> void:
 	if not building_sprite:
 		return
 
-	if BUILDING_SPRITES.has(shop_type):
-		building_sprite.texture = BUILDING_SPRITES[shop_type]
+	var texture: Texture2D = SpriteAtlas.get_building(get_shop_type_name())
+	if texture != null:
+		building_sprite.texture = texture
 
 
 func set_shop_type(new_type: ShopType) -> void:
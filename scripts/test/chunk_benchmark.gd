@@ -0,0 +1,145 @@
+extends Node
+## Measures chunk generation throughput for the PlayGodot benchmarks, with
+## DirtGrid's threaded generation (ThreadedChunkGenerator) on and off.
+##
+## Each run loads a width x height block of chunks at one depth, far from the
+## player, with player-driven streaming paused. Synchronous runs generate the
+## whole block in one frame through DirtGrid._generate_chunk. Threaded runs
+## queue the block at once and record get_pending_count() every frame until
+## every chunk has been applied. Chunks are unloaded between runs.
+
+signal finished(results: Array)
+
+const CHUNK_SIZE := 16  # Matches DirtGrid.CHUNK_SIZE
+
+## Column of the first benchmark chunk, well clear of the player's chunks
+const ORIGIN_CHUNK_X := 1000
+
+## Give up on a threaded run after this long (ms)
+const RUN_TIMEOUT_MS := 60000
+
+var running: bool = false
+var done: bool = false
+var results: Array = []  # Array[Dictionary] - one entry per (mode, depth) run
+
+var _dirt_grid: Node = null
+var _runs: Array = []  # Array[Dictionary] - {"threaded": bool, "depth": int} left to run
+var _width: int = 0
+var _height: int = 0
+
+# Current run
+var _current: Dictionary = {}
+var _chunks: Array[Vector2i] = []
+var _submit_usec: Dictionary = {}  # Dictionary[Vector2i, int]
+var _latencies_ms: Array[float] = []
+var _queue_depth: Array = []  # Array[Array] - [elapsed_ms, pending count]
+var _run_start_usec: int = 0
+
+
+## Start benchmarking. Each depth is run synchronously, then threaded.
+## Returns false if a run is active or the grid has no threaded generator.
+func start(dirt_grid: Node, depths: Array, width: int, height: int) -> bool:
+	if running or dirt_grid._threaded_generator == null:
+		return false
+
+	_dirt_grid = dirt_grid
+	_width = width
+	_height = height
+	_runs.clear()
+	for depth in depths:
+		_runs.append({"threaded": false, "depth": int(depth)})
+		_runs.append({"threaded": true, "depth": int(depth)})
+	results.clear()
+	_current = {}
+	done = false
+	running = true
+
+	_dirt_grid.test_streaming_paused = true
+	var generator: Node = _dirt_grid._threaded_generator
+	if not generator.chunk_generated.is_connected(_on_chunk_generated):
+		# Connected after DirtGrid, so a chunk counts once it has been applied
+		generator.chunk_generated.connect(_on_chunk_generated)
+	return true
+
+
+func _process(_delta: float) -> void:
+	if not running:
+		return
+
+	if _current.is_empty():
+		if _runs.is_empty():
+			_finish()
+			return
+		_begin_run(_runs.pop_front())
+		return
+
+	# Threaded run in progress
+	var elapsed_ms := (Time.get_ticks_usec() - _run_start_usec) / 1000.0
+	_queue_depth.append([elapsed_ms, _dirt_grid._threaded_generator.get_pending_count()])
+	if _submit_usec.is_empty() or elapsed_ms > RUN_TIMEOUT_MS:
+		_end_run()
+
+
+func _begin_run(run: Dictionary) -> void:
+	_current = run
+	_chunks.clear()
+	_submit_usec.clear()
+	_latencies_ms.clear()
+	_queue_depth.clear()
+
+	var origin_y := int(floor(float(GameManager.SURFACE_ROW + run["depth"]) / CHUNK_SIZE))
+	for x in range(_width):
+		for y in range(_height):
+			_chunks.append(Vector2i(ORIGIN_CHUNK_X + x, origin_y + y))
+
+	_run_start_usec = Time.get_ticks_usec()
+	if run["threaded"]:
+		for chunk_pos in _chunks:
+			var submitted := Time.get_ticks_usec()
+			if _dirt_grid.test_generate_chunk(chunk_pos, true):
+				_submit_usec[chunk_pos] = submitted
+		_queue_depth.append([0.0, _dirt_grid._threaded_generator.get_pending_count()])
+		return
+
+	for chunk_pos in _chunks:
+		var chunk_start := Time.get_ticks_usec()
+		if _dirt_grid.test_generate_chunk(chunk_pos, false):
+			_latencies_ms.append((Time.get_ticks_usec() - chunk_start) / 1000.0)
+	_end_run()
+
+
+func _on_chunk_generated(chunk_pos: Vector2i, _result) -> void:
+	if not _submit_usec.has(chunk_pos):
+		return
+	_latencies_ms.append((Time.get_ticks_usec() - _submit_usec[chunk_pos]) / 1000.0)
+	_submit_usec.erase(chunk_pos)
+
+
+func _end_run() -> void:
+	var elapsed_ms := (Time.get_ticks_usec() - _run_start_usec) / 1000.0
+	var completed := _latencies_ms.size()
+	results.append({
+		"mode": "threaded" if _current["threaded"] else "sync",
+		"depth": _current["depth"],
+		"chunks": _chunks.size(),
+		"completed": completed,
+		"elapsed_ms": elapsed_ms,
+		"chunks_per_sec": completed / (elapsed_ms / 1000.0) if elapsed_ms > 0 else 0.0,
+		"latencies_ms": _latencies_ms.duplicate(),
+		"queue_depth": _queue_depth.duplicate(),
+	})
+
+	for chunk_pos in _submit_usec:
+		_dirt_grid._threaded_generator.cancel_chunk_generation(chunk_pos)
+		_dirt_grid._pending_threaded_chunks.erase(chunk_pos)
+	for chunk_pos in _chunks:
+		_dirt_grid.test_unload_chunk(chunk_pos)
+	_submit_usec.clear()
+	_current = {}
+
+
+func _finish() -> void:
+	running = false
+	_dirt_grid.test_streaming_paused = false
+	done = true
+	finished.emit(results)
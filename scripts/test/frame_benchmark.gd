@@ -0,0 +1,118 @@
+extends Node
+## Drives the player through a scripted route and records per-frame metrics
+## from PerformanceMonitor, for the PlayGodot frame-time benchmarks.
+##
+## Each frame the player advances one tile along the scenario's route,
+## clearing the block in front of it, so every frame pays for chunk loading,
+## unloading and ore effects exactly as real digging would. Movement is a
+## direct teleport (no tween) so runs are frame-for-frame reproducible.
+
+signal finished(result: Dictionary)
+
+## Scenario routes: start depth below the surface, start column and step.
+const SCENARIOS := {
+	# Straight down from the surface through every layer
+	"deep_shaft": {"depth": 0, "x": 4, "step": Vector2i(0, 1)},
+	# Sideways at a shallow, ore-poor depth: pure chunk streaming
+	"long_tunnel": {"depth": 40, "x": 4, "step": Vector2i(1, 0)},
+	# Below depth 100 the cave threshold is at its lowest (most caves)
+	"cave_dense": {"depth": 150, "x": 4, "step": Vector2i(1, 0)},
+	# Below 600 every ore except void crystal can spawn
+	"ore_dense": {"depth": 650, "x": 4, "step": Vector2i(1, 0)},
+}
+
+## Frames to let chunk generation settle after the teleport to the start
+const WARMUP_FRAMES := 30
+
+var running: bool = false
+var done: bool = false
+var result: Dictionary = {}
+
+var _dirt_grid: Node = null
+var _player: Node = null
+var _step := Vector2i.ZERO
+var _position := Vector2i.ZERO
+var _steps_left: int = 0
+var _warmup_left: int = 0
+var _frame_times: Array[float] = []
+var _spikes_start: int = 0
+var _chunks_max: int = 0
+var _memory_peak_mb: float = 0.0
+var _start_usec: int = 0
+
+
+## Start a scenario. Returns false if the name is unknown or a run is active.
+func start(scenario: String, steps: int, dirt_grid: Node, player: Node) -> bool:
+	if running or not SCENARIOS.has(scenario):
+		return false
+
+	var route: Dictionary = SCENARIOS[scenario]
+	_dirt_grid = dirt_grid
+	_player = player
+	_step = route["step"]
+	_position = Vector2i(route["x"], GameManager.SURFACE_ROW + route["depth"])
+	_steps_left = steps
+	_warmup_left = WARMUP_FRAMES
+	_frame_times.clear()
+	_chunks_max = 0
+	_memory_peak_mb = 0.0
+	result = {"scenario": scenario, "steps": steps}
+	done = false
+	running = true
+
+	_teleport(_position)
+	return true
+
+
+func _process(_delta: float) -> void:
+	if not running:
+		return
+
+	if _warmup_left > 0:
+		_warmup_left -= 1
+		if _warmup_left == 0:
+			_spikes_start = PerformanceMonitor.frame_spikes
+			_start_usec = Time.get_ticks_usec()
+		return
+
+	_sample()
+
+	if _steps_left <= 0:
+		_finish()
+		return
+
+	var target := _position + _step
+	if _dirt_grid.has_block(target):
+		_dirt_grid.hit_block(target, INF)
+	_position = target
+	_teleport(target)
+	_steps_left -= 1
+
+
+func _teleport(grid_pos: Vector2i) -> void:
+	_player.grid_position = grid_pos
+	_player.target_grid_position = grid_pos
+	_player.position = _player._grid_to_world(grid_pos)
+	_player.velocity = Vector2.ZERO
+
+
+func _sample() -> void:
+	# The overlay normally feeds chunk metrics; it may not be visible here
+	var pending: int = _dirt_grid.debug_threaded_stats().get("pending_chunks", 0)
+	PerformanceMonitor.update_chunk_metrics(_dirt_grid.debug_chunk_count(), pending)
+
+	var stats := PerformanceMonitor.get_stats()
+	_frame_times.append(stats["frame_time_ms"])
+	_chunks_max = maxi(_chunks_max, stats["chunks_loaded"])
+	_memory_peak_mb = maxf(_memory_peak_mb, stats["memory_static_mb"])
+
+
+func _finish() -> void:
+	running = false
+	result["frame_times_ms"] = _frame_times.duplicate()
+	result["frame_spikes"] = PerformanceMonitor.frame_spikes - _spikes_start
+	result["chunks_loaded_max"] = _chunks_max
+	result["memory_peak_mb"] = _memory_peak_mb
+	result["elapsed_ms"] = (Time.get_ticks_usec() - _start_usec) / 1000.0
+	done = true
+	finished.emit(result)
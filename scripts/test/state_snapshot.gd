@@ -0,0 +1,57 @@
+extends RefCounted
+## Captures and restores the script state of nodes for PlayGodot test resets.
+##
+## A snapshot stores every script variable of a node. Arrays and dictionaries
+## are deep-copied, and script-backed RefCounted objects inside them (e.g.
+## InventoryManager.InventorySlot) have their own variables recorded, so a
+## restore puts both the containers and the objects back. Node references,
+## Resources and engine objects are kept by reference.
+
+
+## Capture the script variables of a node (or script-backed object).
+static func capture(target: Object) -> Dictionary:
+	var values := {}
+	var objects: Array = []
+	for prop in target.get_property_list():
+		if not (prop["usage"] & PROPERTY_USAGE_SCRIPT_VARIABLE):
+			continue
+		var value = target.get(prop["name"])
+		if value is Node:
+			continue  # Scene references stay valid; don't restore them
+		values[prop["name"]] = _copy(value)
+		_collect_objects(value, objects)
+
+	var object_states: Array = []
+	for obj in objects:
+		object_states.append([obj, capture(obj)])
+
+	return {"values": values, "objects": object_states}
+
+
+## Restore a snapshot taken with capture(). The snapshot is left intact so it
+## can be restored again.
+static func restore(target: Object, snapshot: Dictionary) -> void:
+	var values: Dictionary = snapshot["values"]
+	for prop_name in values:
+		target.set(prop_name, _copy(values[prop_name]))
+	for entry in snapshot["objects"]:
+		restore(entry[0], entry[1])
+
+
+static func _copy(value: Variant) -> Variant:
+	if value is Array or value is Dictionary:
+		return value.duplicate(true)  # Keeps typed arrays typed
+	return value
+
+
+static func _collect_objects(value: Variant, out: Array) -> void:
+	## Find script-backed RefCounted objects whose fields must be restored in place
+	if value is Array:
+		for item in value:
+			_collect_objects(item, out)
+	elif value is Dictionary:
+		for key in value:
+			_collect_objects(value[key], out)
+	elif value is RefCounted and not value is Resource:
+		if value.get_script() != null and not out.has(value):
+			out.append(value)
@@ -8,6 +8,9 @@ const BlockParticlesScene := preload("res://scenes/effects/block_particles.tscn"
 const FTUEOverlayScene := preload("res://scenes/ui/ftue_overlay.tscn")
 const JackpotBurstScene := preload("res://scenes/effects/jackpot_burst.tscn")
 const ScreenFlashScene := preload("res://scenes/effects/screen_flash.tscn")
+const StateSnapshotScript := preload("res://scripts/test/state_snapshot.gd")
+const FrameBenchmarkScript := preload("res://scripts/test/frame_benchmark.gd")
+const ChunkBenchmarkScript := preload("res://scripts/test/chunk_benchmark.gd")
 
 ## FTUE (First Time User Experience) overlay reference
 var ftue_overlay: CanvasLayer = null
@@ -1840,3 +1843,163 @@ func _on_load_completed(success: bool) -> void:
 		if placed_data and not placed_data.is_empty():
 			dirt_grid.load_placed_objects_dict(placed_data)
 			print("[TestLevel] Loaded %d placed objects from save" % placed_data.size())
+
+
+# ============================================
+# TESTING HELPERS (for PlayGodot automation)
+# ============================================
+
+## Autoloads that keep their live state across test resets
+const TEST_RESET_EXCLUDED_AUTOLOADS := ["PlayGodotServer"]
+
+## Baseline snapshots taken by test_capture_baseline()
+var _test_autoload_baseline: Dictionary = {}  # Dictionary[String autoload name, Dictionary snapshot]
+var _test_player_baseline: Dictionary = {}
+var _test_player_position: Vector2 = Vector2.ZERO
+
+
+## Snapshot autoload and player state as the baseline for test_reset_state().
+## Called by the test harness right after the scene has loaded.
+func test_capture_baseline() -> bool:
+	_test_autoload_baseline.clear()
+	for autoload_name in _test_get_autoload_names():
+		var node := get_tree().root.get_node_or_null(NodePath(autoload_name))
+		if node:
+			_test_autoload_baseline[autoload_name] = StateSnapshotScript.capture(node)
+
+	_test_player_baseline = StateSnapshotScript.capture(player)
+	_test_player_position = player.position
+	print("[TestLevel] Captured test baseline for %d autoloads" % _test_autoload_baseline.size())
+	return true
+
+
+## Restore autoloads, the player and DirtGrid to the captured baseline in place.
+## Lets tests share one Godot process without reloading the scene.
+## Returns {"success": bool, "elapsed_ms": float}
+func test_reset_state() -> Dictionary:
+	if _test_autoload_baseline.is_empty():
+		return {"success": false, "error": "No baseline captured"}
+
+	var start_usec := Time.get_ticks_usec()
+
+	# Stop in-flight movement/UI tweens and undo pause or hitstop
+	for tween in get_tree().get_processed_tweens():
+		tween.kill()
+	get_tree().paused = false
+	Engine.time_scale = 1.0
+
+	for autoload_name: String in _test_autoload_baseline:
+		var node := get_tree().root.get_node_or_null(NodePath(autoload_name))
+		if node:
+			StateSnapshotScript.restore(node, _test_autoload_baseline[autoload_name])
+
+	StateSnapshotScript.restore(player, _test_player_baseline)
+	player.position = _test_player_position
+	player.velocity = Vector2.ZERO
+	dirt_grid.test_reset()
+
+	# Push restored values to the HUD and other listeners
+	GameManager.coins_changed.emit(GameManager.coins)
+	GameManager.depth_updated.emit(GameManager.current_depth)
+	InventoryManager.inventory_changed.emit()
+	PlayerData.tool_changed.emit(PlayerData.get_equipped_tool())
+	player.hp_changed.emit(player.current_hp, player.MAX_HP)
+
+	var elapsed_ms := (Time.get_ticks_usec() - start_usec) / 1000.0
+	return {"success": true, "elapsed_ms": elapsed_ms}
+
+
+func _test_get_autoload_names() -> Array[String]:
+	var names: Array[String] = []
+	for prop in ProjectSettings.get_property_list():
+		var key: String = prop["name"]
+		if not key.begins_with("autoload/"):
+			continue
+		var autoload_name := key.trim_prefix("autoload/")
+		if autoload_name not in TEST_RESET_EXCLUDED_AUTOLOADS:
+			names.append(autoload_name)
+	return names
+
+
+## Start a frame-time benchmark scenario (see frame_benchmark.gd SCENARIOS).
+## Runs over the following frames; poll or watch FrameBenchmark.done.
+func test_start_benchmark(scenario: String, steps: int) -> bool:
+	var benchmark := get_node_or_null("FrameBenchmark")
+	if benchmark == null:
+		benchmark = FrameBenchmarkScript.new()
+		benchmark.name = "FrameBenchmark"
+		add_child(benchmark)
+	return benchmark.start(scenario, steps, dirt_grid, player)
+
+
+## Result of the last finished benchmark run, or {} while running.
+func test_get_benchmark_result() -> Dictionary:
+	var benchmark := get_node_or_null("FrameBenchmark")
+	if benchmark == null or not benchmark.done:
+		return {}
+	return benchmark.result
+
+
+## Start the chunk generation benchmark (see chunk_benchmark.gd): a
+## width x height block of chunks at each depth, synchronous then threaded.
+## Runs over the following frames; poll or watch ChunkBenchmark.done.
+func test_start_chunk_benchmark(depths: Array, width: int, height: int) -> bool:
+	var benchmark := get_node_or_null("ChunkBenchmark")
+	if benchmark == null:
+		benchmark = ChunkBenchmarkScript.new()
+		benchmark.name = "ChunkBenchmark"
+		add_child(benchmark)
+	return benchmark.start(dirt_grid, depths, width, height)
+
+
+## Results of the last finished chunk benchmark, or [] while running.
+func test_get_chunk_benchmark_results() -> Array:
+	var benchmark := get_node_or_null("ChunkBenchmark")
+	if benchmark == null or not benchmark.done:
+		return []
+	return benchmark.results
+
+
+## Generate chunks through ThreadedChunkGenerator.generate_chunk_data() without
+## applying them to the grid. Used by the world-generation parity test against
+## scripts/tools/worldgen_sim.py. chunks is an Array of [x, y] chunk coordinates;
+## returns one ChunkGenerationResult.to_dict() per chunk, or [] with no generator.
+func test_export_chunks(chunks: Array) -> Array:
+	var generator: Node = dirt_grid._threaded_generator
+	if generator == null:
+		return []
+
+	var exported := []
+	for chunk in chunks:
+		var context := {
+			"chunk_pos": Vector2i(int(chunk[0]), int(chunk[1])),
+			"surface_row": GameManager.SURFACE_ROW,
+			"world_seed": SaveManager.get_world_seed(),
+			"dug_tiles": {},
+		}
+		exported.append(generator.generate_chunk_data(context).to_dict())
+	return exported
+
+
+## Write Variants with FileAccess.store_var(value, true), as SaveManager.save_chunk()
+## does, and return each file's bytes as base64. Used by the chunk save test against
+## scripts/tools/godot_variant.py. The last sample is a chunk's modified_tiles.
+func test_store_var_samples() -> Array:
+	var samples := [
+		null, true, 7, -(1 << 40), 0.5, 0.1, "grün", &"ore",
+		Vector2i(3, -4), Vector2(1.5, -2.0), Color(1.0, 0.5, 0.0, 1.0),
+		[1, "x", [2.0]], {Vector2i(1, 2): "a", "n": 3},
+		PackedByteArray([1, 2, 3]), PackedInt32Array([-1, 65536]), PackedStringArray(["a", "bc"]),
+		{"0,5": true, "0,6": true, "1,5": true},
+	]
+	var path := "user://test_store_var.dat"
+	var encoded := []
+	for value in samples:
+		var file := FileAccess.open(path, FileAccess.WRITE)
+		if file == null:
+			return []
+		file.store_var(value, true)
+		file.close()
+		encoded.append(Marshalls.raw_to_base64(FileAccess.get_file_as_bytes(path)))
+	DirAccess.remove_absolute(path)
+	return encoded
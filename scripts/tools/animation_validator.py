@@ -16,6 +16,9 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
 import json
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent))
 
 
 class ValidationResult(Enum):
@@ -266,29 +269,30 @@ def save_validation_config(output_path: Path):
     print(f"Validation config saved to: {output_path}")
 
 
+def frame_files() -> list[Path]:
+    """Animation frames (frame_*.png) in the components directory, in order."""
+    components_dir = Path(__file__).parent.parent.parent / "resources" / "sprites" / "components"
+    return sorted(components_dir.glob("frame_*.png"))
+
+
 def analyze_frame_metrics():
-    """Analyze numeric metrics for animation frames."""
-    from PIL import Image
+    """Analyze numeric metrics for animation frames (None with fewer than 2)."""
+    from image_analysis import alpha_mask, load_rgba, unique_color_count
     import statistics
 
-    PROJECT_ROOT = Path(__file__).parent.parent.parent
-    COMPONENTS_DIR = PROJECT_ROOT / "resources" / "sprites" / "components"
-
-    frames = sorted(COMPONENTS_DIR.glob("frame_*.png"))
+    frames = frame_files()
 
     if len(frames) < 2:
-        print("Not enough frames to analyze")
         return None
 
     pixel_counts = []
     color_counts = []
 
     for frame_path in frames:
-        img = Image.open(frame_path).convert('RGBA')
-        opaque = [p for p in img.getdata() if p[3] > 0]
-        pixel_counts.append(len(opaque))
-        colors = set(p[:3] for p in opaque)
-        color_counts.append(len(colors))
+        rgba = load_rgba(frame_path)
+        opaque = alpha_mask(rgba, threshold=0)
+        pixel_counts.append(int(opaque.sum()))
+        color_counts.append(unique_color_count(rgba, opaque))
 
     # Calculate consistency metrics
     mean_pixels = statistics.mean(pixel_counts)
@@ -334,33 +338,20 @@ def analyze_frame_metrics():
 
 
 def analyze_motion():
-    """Analyze motion between consecutive frames."""
-    from PIL import Image
-    import statistics
+    """Analyze motion between consecutive frames.
 
-    PROJECT_ROOT = Path(__file__).parent.parent.parent
-    COMPONENTS_DIR = PROJECT_ROOT / "resources" / "sprites" / "components"
+    Frames are streamed two at a time (see motion_analysis.py), so long
+    animations are analyzed in constant memory.
+    """
+    from motion_analysis import iter_frame_files, iter_motion, summarize_motion
 
-    frames = sorted(COMPONENTS_DIR.glob("frame_*.png"))
+    summary = summarize_motion(iter_motion(iter_frame_files(frame_files())))
 
-    if len(frames) < 2:
+    if summary is None:
         return None
 
-    images = [Image.open(f).convert('RGBA') for f in frames]
-    diffs = []
-
-    for i in range(len(images) - 1):
-        changed = 0
-        total = 0
-        for p1, p2 in zip(images[i].getdata(), images[i + 1].getdata()):
-            if p1[3] > 0 or p2[3] > 0:
-                total += 1
-                if p1 != p2:
-                    changed += 1
-        diffs.append(changed / total if total > 0 else 0)
-
-    avg_diff = statistics.mean(diffs)
-    min_diff = min(diffs)
+    avg_diff = summary['avg_change']
+    min_diff = summary['min_change']
 
     if min_diff < 0.02:
         motion_score = 0.5
@@ -374,7 +365,9 @@ def analyze_motion():
     return {
         'avg_change': avg_diff,
         'min_change': min_diff,
-        'max_change': max(diffs),
+        'max_change': summary['max_change'],
+        'max_bbox_travel': summary['max_bbox_travel'],
+        'avg_centroid_speed': summary['avg_centroid_speed'],
         'motion_score': motion_score
     }
 
@@ -385,6 +378,7 @@ def print_frame_metrics():
     motion = analyze_motion()
 
     if not metrics:
+        print("Not enough frames to analyze")
         return
 
     print()
@@ -409,6 +403,8 @@ def print_frame_metrics():
         print(f"  Avg change: {motion['avg_change']*100:.1f}%")
         print(f"  Min change: {motion['min_change']*100:.1f}%")
         print(f"  Max change: {motion['max_change']*100:.1f}%")
+        print(f"  Max bbox travel: {motion['max_bbox_travel']}px")
+        print(f"  Avg centroid speed: {motion['avg_centroid_speed']:.1f}px/frame")
 
     print("=" * 60)
 
@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""
+Pack generated sprites into power-of-two texture atlas pages.
+
+Collects the item icons and building sprites, trims their transparent
+borders and packs them with MaxRects (best short side fit) onto power-of-two
+pages (up to --max-size) with the least total area, splitting across pages
+when that beats one larger page. Sprites whose trimmed pixels are identical
+share one region. The game draws icons (InventorySlot) and buildings
+(ShopBuilding) from atlas.tres through SpriteAtlas; miner swing frames are
+packed separately by generate_miner_variants.py.
+
+Writes, in the output directory:
+    atlas_<n>.png   one image per page
+    atlas.json      region map: {"pages": [...], "regions": {name: {...}}}
+    atlas.tres      the same regions as AtlasTextures, in the resource's
+                    "regions" metadata: load(...).get_meta("regions")[name]
+
+The atlas is only written when its pages take no more VRAM than the source
+textures (--allow-larger overrides this).
+
+Each region records its page, rect, and the trim offset and original size,
+so an AtlasTexture margin restores the sprite's untrimmed bounds. The
+terrain atlas is not packed: the TileSet addresses it as a fixed grid.
+
+Run: python3 scripts/tools/atlas_packer.py [--max-size 2048] [--padding 0]
+Output: resources/sprites/atlas/
+"""
+
+from PIL import Image
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Optional
+import hashlib
+import json
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent))
+from build_graph import Target
+from indexed_png import save_png
+import generate_item_icons
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+OUTPUT_DIR = PROJECT_ROOT / "resources" / "sprites" / "atlas"
+
+# Region name prefix -> (directory, glob, files to skip)
+SOURCES = {
+    "items": (PROJECT_ROOT / "resources" / "icons" / "items", "*.png", ()),
+    "buildings": (PROJECT_ROOT / "resources" / "sprites" / "buildings", "*.png", ("buildings_atlas.png",)),
+}
+
+MAX_PAGE_SIZE = 2048
+MIN_PAGE_SIZE = 64
+
+# Page fills the page-size search may spend before settling for greedy packing
+SEARCH_BUDGET = 400
+
+# Transparent pixels between packed sprites. The game draws these sprites
+# nearest-filtered, so nothing bleeds across region edges; pass 2 or more
+# for linear filtering or mipmaps, at the cost of larger pages
+PADDING = 0
+
+
+@dataclass
+class Sprite:
+    """A trimmed sprite ready for packing."""
+    name: str
+    image: Image.Image
+    offset: tuple  # (left, top) trimmed from the source
+    source_size: tuple  # (width, height) before trimming
+
+    @property
+    def size(self) -> tuple:
+        return self.image.size
+
+
+@dataclass
+class Page:
+    """One atlas page and the sprites placed on it."""
+    width: int
+    height: int
+    placements: dict = field(default_factory=dict)  # name -> (x, y)
+
+
+def trim(img: Image.Image) -> tuple:
+    """Crop away fully transparent borders.
+
+    Returns:
+        (cropped image, (left, top) offset). A fully transparent image is
+        kept as a single transparent pixel.
+    """
+    img = img.convert('RGBA')
+    bbox = img.getchannel('A').getbbox() or (0, 0, 1, 1)
+    return img.crop(bbox), (bbox[0], bbox[1])
+
+
+def source_files() -> dict:
+    """Region name -> source PNG, for every sprite the atlas packs."""
+    files = {}
+    for prefix, (directory, pattern, skip) in SOURCES.items():
+        for path in sorted(directory.glob(pattern)):
+            if path.name not in skip:
+                files[f"{prefix}/{path.stem}"] = path
+    return files
+
+
+def load_sprites(files: dict) -> list[Sprite]:
+    sprites = []
+    for name, path in files.items():
+        with Image.open(path) as img:
+            trimmed, offset = trim(img)
+            sprites.append(Sprite(name, trimmed, offset, img.size))
+    return sprites
+
+
+class MaxRectsBin:
+    """MaxRects bin packer (best short side fit, no rotation).
+
+    Keeps the list of maximal free rectangles; each placement splits every
+    free rectangle it overlaps and drops the ones contained in another.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.free = [(0, 0, width, height)]
+
+    def insert(self, width: int, height: int) -> Optional[tuple]:
+        """Place a width x height rect, returning its (x, y) or None if it doesn't fit."""
+        best = None
+        best_score = None
+        for fx, fy, fw, fh in self.free:
+            if width <= fw and height <= fh:
+                leftover_x, leftover_y = fw - width, fh - height
+                score = (min(leftover_x, leftover_y), max(leftover_x, leftover_y))
+                if best_score is None or score < best_score:
+                    best, best_score = (fx, fy), score
+        if best is not None:
+            self._split(best[0], best[1], width, height)
+        return best
+
+    def _split(self, x: int, y: int, width: int, height: int):
+        remaining = []
+        for fx, fy, fw, fh in self.free:
+            if x >= fx + fw or x + width <= fx or y >= fy + fh or y + height <= fy:
+                remaining.append((fx, fy, fw, fh))
+                continue
+            if x > fx:
+                remaining.append((fx, fy, x - fx, fh))
+            if x + width < fx + fw:
+                remaining.append((x + width, fy, fx + fw - x - width, fh))
+            if y > fy:
+                remaining.append((fx, fy, fw, y - fy))
+            if y + height < fy + fh:
+                remaining.append((fx, y + height, fw, fy + fh - y - height))
+        self.free = [
+            rect for i, rect in enumerate(remaining)
+            if not any(
+                i != j and _contains(other, rect) and (other != rect or j < i)
+                for j, other in enumerate(remaining)
+            )
+        ]
+
+
+def _contains(outer: tuple, inner: tuple) -> bool:
+    ox, oy, ow, oh = outer
+    ix, iy, iw, ih = inner
+    return ox <= ix and oy <= iy and ix + iw <= ox + ow and iy + ih <= oy + oh
+
+
+def _is_page_size(side: int) -> bool:
+    return side >= MIN_PAGE_SIZE and side & (side - 1) == 0
+
+
+def _page_sizes(max_size: int) -> list[tuple]:
+    """Power-of-two page sizes up to max_size, smallest area first (wide before tall)."""
+    sides = []
+    side = MIN_PAGE_SIZE
+    while side <= max_size:
+        sides.append(side)
+        side *= 2
+    return sorted(
+        ((w, h) for w in sides for h in sides if h <= w * 2 and w <= h * 2),
+        key=lambda size: (size[0] * size[1], -size[0]),
+    )
+
+
+def _fill(sprites: list[Sprite], width: int, height: int, padding: int) -> Page:
+    """Place as many sprites as fit on a width x height page."""
+    # The bin is padded too, so sprites can sit flush with the right/bottom edge
+    packer = MaxRectsBin(width + padding, height + padding)
+    page = Page(width, height)
+    for sprite in sprites:
+        position = packer.insert(sprite.size[0] + padding, sprite.size[1] + padding)
+        if position is not None:
+            page.placements[sprite.name] = position
+    return page
+
+
+def _area(pages: list[Page]) -> int:
+    return sum(page.width * page.height for page in pages)
+
+
+class _PageSearch:
+    """Depth-first search for the page sizes with the least total area.
+
+    For each set of remaining sprites, compares the greedy packing with
+    filling each smaller page size, wide and tall (largest first), and
+    searching the rest, e.g. 1024x512 + 256x256 instead of 1024x1024.
+    Splits that can't beat the best so far are pruned, and after
+    SEARCH_BUDGET page fills the rest of the search settles for greedy
+    packings, so large sprite sets stay fast.
+    """
+
+    def __init__(self, max_size: int, padding: int):
+        self.max_size = max_size
+        self.padding = padding
+        self.sizes = _page_sizes(max_size)
+        self.budget = SEARCH_BUDGET
+        self.memo: dict = {}
+
+    def fill(self, sprites: list[Sprite], width: int, height: int) -> Page:
+        self.budget -= 1
+        return _fill(sprites, width, height, self.padding)
+
+    def sprite_area(self, sprites: list[Sprite]) -> int:
+        return sum((s.size[0] + self.padding) * (s.size[1] + self.padding) for s in sprites)
+
+    def greedy(self, remaining: list[Sprite]) -> list[Page]:
+        """The smallest single page that holds everything, else full max-size pages."""
+        pages = []
+        while remaining:
+            area = self.sprite_area(remaining)
+            for width, height in self.sizes:
+                if width * height < area:
+                    continue
+                page = self.fill(remaining, width, height)
+                if len(page.placements) == len(remaining):
+                    return pages + [page]
+            page = self.fill(remaining, self.max_size, self.max_size)
+            pages.append(page)
+            remaining = [s for s in remaining if s.name not in page.placements]
+        return pages
+
+    def search(self, remaining: list[Sprite]) -> list[Page]:
+        if not remaining:
+            return []
+        key = tuple(s.name for s in remaining)
+        if key in self.memo:
+            return self.memo[key]
+
+        best = self.greedy(remaining)
+        smaller = [size for size in self.sizes if size[0] * size[1] < _area(best)]
+        for size in reversed(smaller):
+            if self.budget <= 0 or size[0] * size[1] >= _area(best):
+                continue
+            page = self.fill(remaining, *size)
+            if not page.placements:
+                continue
+            rest = [s for s in remaining if s.name not in page.placements]
+            # The rest needs at least its own area
+            if size[0] * size[1] + max(self.sprite_area(rest), MIN_PAGE_SIZE ** 2) >= _area(best):
+                continue
+            split = [page] + self.search(rest)
+            if _area(split) < _area(best):
+                best = split
+        self.memo[key] = best
+        return best
+
+
+def pack(sprites: list[Sprite], max_size: int = MAX_PAGE_SIZE, padding: int = PADDING) -> list[Page]:
+    """Pack sprites onto power-of-two pages with the least total area."""
+    if not _is_page_size(max_size):
+        raise ValueError(f"max_size must be a power of two from {MIN_PAGE_SIZE}, got {max_size}")
+    for sprite in sprites:
+        if sprite.size[0] > max_size or sprite.size[1] > max_size:
+            raise ValueError(f"{sprite.name} {sprite.size} is larger than a {max_size}px page")
+
+    # Tallest/widest first packs tightest with MaxRects
+    remaining = sorted(sprites, key=lambda s: (max(s.size), min(s.size), s.name), reverse=True)
+    pages = _PageSearch(max_size, padding).search(remaining)
+    return sorted(pages, key=lambda page: (page.width * page.height, page.width), reverse=True)
+
+
+def _dedupe(sprites: list[Sprite]) -> tuple:
+    """Split sprites into unique images and aliases (name -> name of identical sprite)."""
+    unique = []
+    aliases = {}
+    seen = {}
+    for sprite in sprites:
+        digest = hashlib.sha256(sprite.image.tobytes() + repr(sprite.size).encode()).hexdigest()
+        if digest in seen:
+            aliases[sprite.name] = seen[digest]
+        else:
+            seen[digest] = sprite.name
+            unique.append(sprite)
+    return unique, aliases
+
+
+def _res_path(path: Path) -> str:
+    """res:// path inside the project, else the file name (relative to the .tres)."""
+    path = Path(path).resolve()
+    if path.is_relative_to(PROJECT_ROOT.resolve()):
+        return "res://" + path.relative_to(PROJECT_ROOT.resolve()).as_posix()
+    return path.name
+
+
+def write_tres(path: Path, page_paths: list[Path], regions: dict):
+    """Write the regions as AtlasTextures in a resource's "regions" metadata."""
+    lines = [
+        f'[gd_resource type="Resource" load_steps={len(page_paths) + len(regions) + 1} format=3]',
+        "",
+    ]
+    for i, page_path in enumerate(page_paths):
+        lines.append(f'[ext_resource type="Texture2D" path="{_res_path(page_path)}" id="page_{i}"]')
+    lines.append("")
+
+    ids = {}
+    for i, (name, region) in enumerate(regions.items()):
+        ids[name] = f"AtlasTexture_{i}"
+        x, y, w, h = region["rect"]
+        left, top = region["offset"]
+        source_w, source_h = region["source_size"]
+        lines += [
+            f'[sub_resource type="AtlasTexture" id="{ids[name]}"]',
+            f'atlas = ExtResource("page_{region["page"]}")',
+            f"region = Rect2({x}, {y}, {w}, {h})",
+            f"margin = Rect2({left}, {top}, {source_w - w}, {source_h - h})",
+            "",
+        ]
+
+    entries = ", ".join(f'"{name}": SubResource("{ids[name]}")' for name in regions)
+    lines += ["[resource]", f"metadata/regions = {{{entries}}}", ""]
+    Path(path).write_text("\n".join(lines))
+
+
+def build_atlas(output_dir: Path = OUTPUT_DIR, max_size: int = MAX_PAGE_SIZE,
+                padding: int = PADDING, tres: bool = True, allow_larger: bool = False) -> dict:
+    """Pack every source sprite and write the pages and region maps.
+
+    Returns:
+        The region map written to atlas.json
+
+    Raises:
+        ValueError: if the pages would take more VRAM than the source
+            textures and allow_larger is False (nothing is written)
+    """
+    files = source_files()
+    sprites = load_sprites(files)
+    unique, aliases = _dedupe(sprites)
+    pages = pack(unique, max_size, padding)
+
+    source_bytes = sum(w * h * 4 for w, h in (s.source_size for s in sprites))
+    atlas_bytes = sum(page.width * page.height * 4 for page in pages)
+    if atlas_bytes > source_bytes and not allow_larger:
+        raise ValueError(
+            f"Atlas needs {atlas_bytes / 1024:.0f} KiB of VRAM, more than the "
+            f"{source_bytes / 1024:.0f} KiB of source textures; keeping the source sprites "
+            f"(lower --padding, or pass --allow-larger)"
+        )
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for stale in output_dir.glob("atlas_*.png"):
+        stale.unlink()
+
+    by_name = {sprite.name: sprite for sprite in sprites}
+    page_paths = []
+    placed = {}
+    for index, page in enumerate(pages):
+        image = Image.new('RGBA', (page.width, page.height), (0, 0, 0, 0))
+        for name, (x, y) in page.placements.items():
+            image.paste(by_name[name].image, (x, y))
+            placed[name] = (index, x, y)
+        page_path = output_dir / f"atlas_{index}.png"
+        save_png(image, page_path)
+        page_paths.append(page_path)
+
+    regions = {}
+    for sprite in sprites:
+        index, x, y = placed[aliases.get(sprite.name, sprite.name)]
+        regions[sprite.name] = {
+            "page": index,
+            "rect": [x, y, sprite.size[0], sprite.size[1]],
+            "offset": list(sprite.offset),
+            "source_size": list(sprite.source_size),
+        }
+
+    region_map = {
+        "pages": [
+            {"image": path.name, "size": [page.width, page.height]}
+            for path, page in zip(page_paths, pages)
+        ],
+        "regions": regions,
+    }
+    (output_dir / "atlas.json").write_text(json.dumps(region_map, indent=2) + "\n")
+    if tres:
+        write_tres(output_dir / "atlas.tres", page_paths, regions)
+
+    used = sum(s.size[0] * s.size[1] for s in unique)
+    print(f"Packed {len(sprites)} sprites ({len(aliases)} duplicates) onto {len(pages)} page(s):")
+    for path, page in zip(page_paths, pages):
+        print(f"  {path.name}: {page.width}x{page.height}, {len(page.placements)} sprites")
+    print(f"  Occupancy: {used / (atlas_bytes // 4):.0%}")
+    print(f"  Textures: {len(sprites)} -> {len(pages)}")
+    print(f"  VRAM (RGBA8): {source_bytes / 1024:.0f} KiB -> {atlas_bytes / 1024:.0f} KiB")
+    return region_map
+
+
+def page_outputs(output_dir: Path = OUTPUT_DIR) -> list[Path]:
+    """Page images listed in the last atlas.json (atlas_0.png before the first build)."""
+    try:
+        pages = json.loads((Path(output_dir) / "atlas.json").read_text())["pages"]
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        return [Path(output_dir) / "atlas_0.png"]
+    return [Path(output_dir) / page["image"] for page in pages]
+
+
+def build_targets() -> list[Target]:
+    """Build graph target for the packed atlas (after the icons).
+
+    The page count depends on the packing, so the outputs are the pages the
+    last build wrote; a missing one marks the atlas stale.
+    """
+    return [Target(
+        name="atlas:packed",
+        action=build_atlas,
+        inputs=list(source_files().values()),
+        outputs=[OUTPUT_DIR / "atlas.json", OUTPUT_DIR / "atlas.tres"] + page_outputs(),
+        deps=[target.name for target in generate_item_icons.build_targets()],
+    )]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    def page_size(value: str) -> int:
+        side = int(value)
+        if not _is_page_size(side):
+            raise argparse.ArgumentTypeError(
+                f"must be a power of two from {MIN_PAGE_SIZE}, got {value}")
+        return side
+
+    parser = argparse.ArgumentParser(description="Pack sprites into power-of-two atlas pages")
+    parser.add_argument("--output", type=Path, default=OUTPUT_DIR, help="Output directory")
+    parser.add_argument("--max-size", type=page_size, default=MAX_PAGE_SIZE,
+                        help="Largest page side in pixels (power of two)")
+    parser.add_argument("--padding", type=int, default=PADDING, help="Pixels between sprites")
+    parser.add_argument("--no-tres", action="store_true", help="Only write atlas.json")
+    parser.add_argument("--allow-larger", action="store_true",
+                        help="Write the atlas even if it takes more VRAM than the sources")
+
+    args = parser.parse_args()
+    try:
+        build_atlas(args.output, args.max_size, args.padding, tres=not args.no_tres,
+                    allow_larger=args.allow_larger)
+    except ValueError as e:
+        parser.exit(1, f"{e}\n")
@@ -0,0 +1,69 @@
+#!/opt/homebrew/bin/python3.11
+"""Incremental asset build - regenerates only outputs whose inputs changed.
+
+Each generator exposes build_targets() (see build_graph.py). A target is
+rebuilt when its input files, arguments or generator code/data changed since
+its last build, or when an output is missing.
+
+Usage:
+    python build_assets.py                 # Rebuild stale outputs
+    python build_assets.py --dry-run       # Show what would be rebuilt
+    python build_assets.py --force         # Rebuild everything
+    python build_assets.py --list          # List targets
+    python build_assets.py sprite:sheet    # Build specific targets (and their deps)
+"""
+
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from build_graph import STATE_FILE, BuildError, BuildGraph
+import atlas_packer
+import generate_dirt_textures
+import generate_item_icons
+import generate_miner_variants
+import improved_sprite_builder_v4
+
+GENERATORS = [
+    improved_sprite_builder_v4,
+    generate_miner_variants,
+    generate_item_icons,
+    generate_dirt_textures,
+    atlas_packer,
+]
+
+
+def load_graph(state_file: Path = STATE_FILE) -> BuildGraph:
+    """Build graph holding every generator's targets."""
+    graph = BuildGraph(state_file)
+    for generator in GENERATORS:
+        graph.add_all(generator.build_targets())
+    return graph
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    graph = load_graph()
+
+    if '--list' in sys.argv:
+        for target in graph.order():
+            deps = f" (after {', '.join(target.deps)})" if target.deps else ""
+            print(f"  {target.name}{deps}")
+        return
+
+    try:
+        rebuilt = graph.build(
+            names=args or None,
+            force='--force' in sys.argv,
+            dry_run='--dry-run' in sys.argv,
+        )
+    except BuildError:
+        print("\nBuild failed")
+        sys.exit(1)
+    verb = "Would rebuild" if '--dry-run' in sys.argv else "Rebuilt"
+    print(f"\n{verb} {len(rebuilt)} of {len(graph.order(args or None))} targets")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""
+Incremental build graph for generated art.
+
+A Target is one generator step: an action called with some arguments, the
+files it reads and the files it writes. Its fingerprint covers:
+
+- the contents of its input files (e.g. component PNGs)
+- its arguments (seeds, names, palettes)
+- the code it runs: the bytecode of the action and of every scripts/tools
+  function it calls, transitively (including the methods of scripts/tools
+  classes it uses), plus the module-level data those functions read
+  (COLORS, SWING_POSES, PALETTES, ...)
+
+Module globals named *_cache are runtime memoization, not data, and are
+left out so a fingerprint doesn't depend on what already ran in the process.
+
+A target is rebuilt only when its fingerprint differs from the one recorded
+at its last build, or one of its outputs is missing. Editing a comment
+changes nothing. Editing a palette or a pose rebuilds exactly the outputs
+that use it. Targets run after the targets they depend on, so a rebuilt
+component changes the fingerprint of everything that reads it.
+
+Fingerprints are recorded in scripts/tools/.cache/build_graph.json.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import CodeType, FunctionType, ModuleType
+from typing import Any, Callable, Iterable, Optional
+import functools
+import hashlib
+import inspect
+import json
+import sys
+
+TOOLS_DIR = Path(__file__).parent
+STATE_FILE = TOOLS_DIR / ".cache" / "build_graph.json"
+
+sys.path.insert(0, str(TOOLS_DIR))
+from validation_cache import file_digest
+
+
+def _is_tool_object(obj: Any) -> bool:
+    """True if obj was defined in a scripts/tools module."""
+    module = inspect.getmodule(obj)
+    path = getattr(module, "__file__", None)
+    return path is not None and Path(path).resolve().parent == TOOLS_DIR.resolve()
+
+
+class Fingerprint:
+    """Accumulates a digest of values, following functions into their code."""
+
+    def __init__(self):
+        self.digest = hashlib.sha256()
+        self._seen: set[int] = set()
+
+    def update(self, text: str):
+        self.digest.update(text.encode())
+        self.digest.update(b"\0")
+
+    def hexdigest(self) -> str:
+        return self.digest.hexdigest()
+
+    def value(self, value: Any):
+        """Add a value: data by repr, functions by code, containers by content."""
+        if isinstance(value, functools.partial):
+            self.update("partial")
+            self.value(value.func)
+            self.value(value.args)
+            self.value(value.keywords)
+        elif isinstance(value, FunctionType):
+            self.function(value)
+        elif isinstance(value, type) and _is_tool_object(value):
+            self.cls(value)
+        elif isinstance(getattr(value, "__wrapped__", None), FunctionType):
+            # functools.lru_cache, functools.wraps decorators
+            self.update(f"wrapped:{type(value).__name__}")
+            self.function(value.__wrapped__)
+        elif isinstance(value, dict):
+            self.update(f"dict:{len(value)}")
+            for key, item in value.items():
+                self.value(key)
+                self.value(item)
+        elif isinstance(value, (list, tuple)):
+            self.update(f"{type(value).__name__}:{len(value)}")
+            for item in value:
+                self.value(item)
+        elif isinstance(value, (set, frozenset)):
+            self.update(f"set:{sorted(repr(item) for item in value)}")
+        elif isinstance(value, (ModuleType, type)) or callable(value):
+            # Library code (PIL, math, ...) is not tracked
+            self.update(f"{type(value).__name__}:{getattr(value, '__qualname__', value)}")
+        else:
+            if _is_tool_object(type(value)):
+                # Instances of scripts/tools classes run that class's methods
+                self.cls(type(value))
+            text = repr(value)
+            if " at 0x" in text:
+                text = type(value).__qualname__
+            self.update(text)
+
+    def function(self, func: FunctionType):
+        """Add a function's code, defaults and everything it reads from its module."""
+        if id(func) in self._seen:
+            self.update(f"seen:{func.__qualname__}")
+            return
+        self._seen.add(id(func))
+
+        self.update(f"function:{func.__qualname__}")
+        if not _is_tool_object(func):
+            return
+        self.value(func.__defaults__)
+        self.value(func.__kwdefaults__)
+        self._code(func.__code__, func.__globals__)
+
+    def cls(self, cls: type):
+        """Add a scripts/tools class: its tool bases, methods and class attributes."""
+        if id(cls) in self._seen:
+            self.update(f"seen:{cls.__qualname__}")
+            return
+        self._seen.add(id(cls))
+
+        self.update(f"class:{cls.__qualname__}")
+        for base in cls.__bases__:
+            self.value(base)
+        for name, attr in vars(cls).items():
+            if name in ("__dict__", "__weakref__", "__module__", "__doc__"):
+                continue
+            self.update(name)
+            if isinstance(attr, (staticmethod, classmethod)):
+                attr = attr.__func__
+            elif isinstance(attr, property):
+                attr = (attr.fget, attr.fset, attr.fdel)
+            self.value(attr)
+
+    def _code(self, code: CodeType, globals_: dict):
+        self.digest.update(code.co_code)
+        for const in code.co_consts:
+            if isinstance(const, CodeType):
+                # Lambdas, comprehensions and nested functions
+                self._code(const, globals_)
+            else:
+                self.update(repr(const))
+        for name in code.co_names:
+            self.update(name)
+            if name in globals_ and not name.endswith("_cache"):
+                self.value(globals_[name])
+
+
+class BuildError(Exception):
+    """A target's action failed; its fingerprint is not recorded."""
+
+
+@dataclass
+class Target:
+    """One build step: action(*args) reads inputs and writes outputs."""
+    name: str
+    action: Callable
+    args: tuple = ()
+    inputs: list[Path] = field(default_factory=list)
+    outputs: list[Path] = field(default_factory=list)
+    deps: list[str] = field(default_factory=list)
+
+    def fingerprint(self) -> str:
+        fp = Fingerprint()
+        fp.value(self.action)
+        fp.value(self.args)
+        for path in self.inputs:
+            fp.update(f"{Path(path).name}:{file_digest(path)}")
+        return fp.hexdigest()
+
+
+class BuildGraph:
+    """Targets plus the fingerprints they were last built with."""
+
+    def __init__(self, state_file: Path = STATE_FILE):
+        self.state_file = Path(state_file)
+        self.targets: dict[str, Target] = {}
+        try:
+            self.state = json.loads(self.state_file.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.state = {}
+
+    def add(self, target: Target):
+        if target.name in self.targets:
+            raise ValueError(f"Duplicate target: {target.name}")
+        self.targets[target.name] = target
+
+    def add_all(self, targets: Iterable[Target]):
+        for target in targets:
+            self.add(target)
+
+    def order(self, names: Optional[Iterable[str]] = None) -> list[Target]:
+        """Requested targets (default: all) and their dependencies, dependencies first."""
+        ordered: list[Target] = []
+        visiting: set[str] = set()
+        done: set[str] = set()
+
+        def visit(name: str):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle at target: {name}")
+            if name not in self.targets:
+                raise ValueError(f"Unknown target: {name}")
+            visiting.add(name)
+            for dep in self.targets[name].deps:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+            ordered.append(self.targets[name])
+
+        for name in (self.targets if names is None else names):
+            visit(name)
+        return ordered
+
+    def stale_reason(self, target: Target, fingerprint: str) -> Optional[str]:
+        """Why target needs rebuilding, or None if it is up to date."""
+        if target.name not in self.state:
+            return "never built"
+        missing = [path for path in target.outputs if not Path(path).exists()]
+        if missing:
+            return f"missing {Path(missing[0]).name}"
+        if self.state[target.name] != fingerprint:
+            return "changed"
+        return None
+
+    def build(self, names: Optional[Iterable[str]] = None, force: bool = False,
+              dry_run: bool = False) -> list[str]:
+        """Rebuild stale targets in dependency order.
+
+        Returns:
+            Names of the targets that were (or, with dry_run, would be) rebuilt
+
+        Raises:
+            BuildError: an action raised ValueError or OSError; the build
+                stops there and that target stays stale
+        """
+        rebuilt: list[str] = []
+        for target in self.order(names):
+            fingerprint = target.fingerprint()
+            reason = "forced" if force else self.stale_reason(target, fingerprint)
+            if reason is None and dry_run and any(dep in rebuilt for dep in target.deps):
+                reason = "dependency rebuilt"
+            if reason is None:
+                print(f"  up to date: {target.name}")
+                continue
+
+            print(f"  build: {target.name} ({reason})")
+            rebuilt.append(target.name)
+            if dry_run:
+                continue
+
+            try:
+                target.action(*target.args)
+            except (ValueError, OSError) as e:
+                print(f"  failed: {target.name}: {e}")
+                raise BuildError(f"{target.name}: {e}") from e
+            self.state[target.name] = fingerprint
+            self.save()
+
+        return rebuilt
+
+    def save(self):
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        self.state_file.write_text(json.dumps(self.state, indent=2, sort_keys=True) + "\n")
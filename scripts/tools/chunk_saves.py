@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Read, write and survey SaveManager chunk files.
+
+SaveManager.save_chunk() keeps the tiles dug in each 16x16 chunk in
+user://chunks/slot_N/chunk_X_Y.dat, written with
+FileAccess.store_var(modified_tiles, true): a Dictionary of "x,y" world
+tile keys to true, in Godot's Variant binary format (godot_variant.py).
+
+The survey streams a slot directory one file at a time and reports dug tile
+counts, bytes on disk, storage per tile against a 256-bit mask per chunk,
+and the hottest chunks with their depth range below the surface, so real
+player saves can be analyzed without starting the game.
+
+Usage:
+    python chunk_saves.py --slot 0                 # Survey the game's slot 0
+    python chunk_saves.py path/to/slot_0 --top 20  # Survey a copied slot
+    python chunk_saves.py path/to/chunk_0_3.dat    # Dump one chunk
+
+    from chunk_saves import read_chunk_tiles, write_chunk
+    tiles = read_chunk_tiles(path)
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+import argparse
+import heapq
+import os
+import re
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent))
+from godot_variant import get_var, store_var
+
+PROJECT_NAME = "GoDig"  # project.godot config/name, which names user://
+CHUNK_SIZE = 16
+SURFACE_ROW = 7  # GameManager.SURFACE_ROW: grid row of depth 0
+
+# store_var() of a 256-bit dug mask (PackedByteArray): length, header, size, data
+MASK_BYTES = 4 + 4 + 4 + CHUNK_SIZE * CHUNK_SIZE // 8
+
+_CHUNK_FILE = re.compile(r'^chunk_(-?\d+)_(-?\d+)\.dat$')
+
+
+def user_data_dir() -> Path:
+    """Godot's user:// for this project on the current platform."""
+    if sys.platform == "win32":
+        base = Path(os.environ.get("APPDATA", Path.home() / "AppData" / "Roaming")) / "Godot"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Application Support" / "Godot"
+    else:
+        base = Path(os.environ.get("XDG_DATA_HOME", Path.home() / ".local" / "share")) / "godot"
+    return base / "app_userdata" / PROJECT_NAME
+
+
+def slot_dir(slot: int) -> Path:
+    """SaveManager.CHUNKS_DIR for a save slot."""
+    return user_data_dir() / "chunks" / f"slot_{slot}"
+
+
+def chunk_path(directory: Path, chunk: tuple[int, int]) -> Path:
+    """SaveManager.get_chunk_path() inside a slot directory."""
+    return Path(directory) / f"chunk_{chunk[0]}_{chunk[1]}.dat"
+
+
+def parse_chunk_name(name: str) -> Optional[tuple[int, int]]:
+    match = _CHUNK_FILE.match(name)
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+
+# ============================================
+# Reading and writing
+# ============================================
+
+def read_chunk(path: Path) -> dict:
+    """SaveManager.load_chunk(): the stored Dictionary ({} if it is not one)."""
+    with open(path, "rb") as f:
+        data = get_var(f, allow_objects=True)
+    return data if isinstance(data, dict) else {}
+
+
+def dug_tiles(modified_tiles: dict) -> list[tuple[int, int]]:
+    """World tiles marked dug, parsed as DirtGrid._load_chunk_dug_tiles() does."""
+    tiles = []
+    for key, dug in modified_tiles.items():
+        if not dug:
+            continue
+        parts = str(key).split(",")
+        if len(parts) == 2:
+            tiles.append((int(parts[0]), int(parts[1])))
+    return tiles
+
+
+def read_chunk_tiles(path: Path) -> list[tuple[int, int]]:
+    return dug_tiles(read_chunk(path))
+
+
+def write_chunk(directory: Path, chunk: tuple[int, int], tiles: Iterable[tuple[int, int]]) -> Path:
+    """Write a chunk's dug tiles byte-for-byte as the game would.
+
+    Keys are added column by column like DirtGrid._save_chunk_dug_tiles(),
+    and an empty chunk removes the file, as SaveManager.save_chunk() does.
+    """
+    path = chunk_path(directory, chunk)
+    dug = set(tiles)
+    start_x, start_y = chunk[0] * CHUNK_SIZE, chunk[1] * CHUNK_SIZE
+    modified_tiles = {
+        f"{x},{y}": True
+        for x in range(start_x, start_x + CHUNK_SIZE)
+        for y in range(start_y, start_y + CHUNK_SIZE)
+        if (x, y) in dug
+    }
+    if not modified_tiles:
+        path.unlink(missing_ok=True)
+        return path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        store_var(f, modified_tiles, full_objects=True)
+    return path
+
+
+# ============================================
+# Survey
+# ============================================
+
+@dataclass
+class ChunkInfo:
+    chunk: tuple[int, int]
+    tiles: int
+    size: int          # bytes on disk
+    error: str = ""
+
+
+@dataclass
+class SlotSurvey:
+    chunks: int = 0
+    tiles: int = 0
+    size: int = 0
+    min_row: Optional[int] = None
+    max_row: Optional[int] = None
+    unreadable: list[ChunkInfo] = field(default_factory=list)
+    hottest: list[ChunkInfo] = field(default_factory=list)
+
+    @property
+    def mask_size(self) -> int:
+        return self.chunks * MASK_BYTES
+
+
+def iter_slot(directory: Path) -> Iterator[ChunkInfo]:
+    """Decode each chunk file in a slot directory, one at a time."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            chunk = parse_chunk_name(entry.name)
+            if chunk is None or not entry.is_file():
+                continue
+            size = entry.stat().st_size
+            try:
+                tiles = len(read_chunk_tiles(Path(entry.path)))
+            except (ValueError, EOFError, UnicodeDecodeError) as e:
+                yield ChunkInfo(chunk, 0, size, error=str(e))
+                continue
+            yield ChunkInfo(chunk, tiles, size)
+
+
+def survey_slot(directory: Path, top: int = 10) -> SlotSurvey:
+    """Totals over a slot plus its `top` chunks with the most dug tiles."""
+    survey = SlotSurvey()
+    heap: list[tuple[int, tuple[int, int], ChunkInfo]] = []
+    for info in iter_slot(directory):
+        survey.chunks += 1
+        survey.size += info.size
+        if info.error:
+            survey.unreadable.append(info)
+            continue
+        survey.tiles += info.tiles
+        row = info.chunk[1]
+        survey.min_row = row if survey.min_row is None else min(survey.min_row, row)
+        survey.max_row = row if survey.max_row is None else max(survey.max_row, row)
+        # Ties go to the shallower chunk; negated so the heap root is the worst kept
+        entry = (info.tiles, (-info.chunk[1], -info.chunk[0]), info)
+        if len(heap) < top:
+            heapq.heappush(heap, entry)
+        elif top and entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+    survey.hottest = [info for _, _, info in sorted(heap, key=lambda e: e[:2], reverse=True)]
+    return survey
+
+
+def format_survey(directory: Path, survey: SlotSurvey) -> str:
+    lines = [f"{directory}"]
+    if not survey.chunks:
+        lines.append("  No chunk files")
+        return "\n".join(lines)
+
+    per_tile = survey.size / survey.tiles if survey.tiles else 0.0
+    area = max(survey.chunks - len(survey.unreadable), 1) * CHUNK_SIZE * CHUNK_SIZE
+    lines.append(f"  Chunks:      {survey.chunks:,} (rows {survey.min_row} to {survey.max_row})"
+                 if survey.min_row is not None else f"  Chunks:      {survey.chunks:,}")
+    lines.append(f"  Dug tiles:   {survey.tiles:,} "
+                 f"({survey.tiles / area:.1%} of chunk area)")
+    lines.append(f"  On disk:     {survey.size:,} bytes ({per_tile:.1f} per dug tile)")
+    lines.append(f"  As bitmasks: {survey.mask_size:,} bytes "
+                 f"({survey.mask_size / survey.size:.0%} of the current size)")
+    for info in survey.unreadable:
+        lines.append(f"  Unreadable:  chunk {info.chunk}: {info.error}")
+
+    if survey.hottest:
+        lines.append("")
+        lines.append(f"  {'Chunk':<14}{'Depth':>12}{'Tiles':>8}{'Bytes':>8}")
+        for info in survey.hottest:
+            x, y = info.chunk
+            top = y * CHUNK_SIZE - SURFACE_ROW
+            depth = f"{top} to {top + CHUNK_SIZE - 1}"
+            lines.append(f"  {f'({x}, {y})':<14}{depth:>12}{info.tiles:>8}{info.size:>8}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="Survey SaveManager chunk files")
+    parser.add_argument("path", nargs="?", type=Path, help="Slot directory or one chunk .dat file")
+    parser.add_argument("--slot", type=int, help="Survey this slot in the game's user:// directory")
+    parser.add_argument("--top", type=int, default=10, help="Hottest chunks to list (default 10)")
+    args = parser.parse_args(argv)
+
+    if args.path is None and args.slot is None:
+        parser.error("give a slot directory, a chunk file or --slot N")
+    path = args.path if args.path is not None else slot_dir(args.slot)
+
+    if path.is_file():
+        modified_tiles = read_chunk(path)
+        tiles = sorted(dug_tiles(modified_tiles), key=lambda tile: (tile[1], tile[0]))
+        print(f"{path}: {len(tiles)} dug tiles in {len(modified_tiles)} keys, {path.stat().st_size} bytes")
+        for x, y in tiles:
+            print(f"  {x},{y}")
+        return 0
+    if not path.is_dir():
+        print(f"{path}: not found")
+        return 1
+
+    print(format_survey(path, survey_slot(path, args.top)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -10,11 +10,16 @@ Validates and scores sprite components for quality metrics:
 - Shading (presence of highlights/shadows)
 """
 
-from PIL import Image
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Optional
-import math
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent))
+from image_analysis import (
+    ImageLike, alpha_mask, as_rgba, boundary_mask, load_rgba, luminance,
+    unique_color_count,
+)
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 COMPONENTS_DIR = PROJECT_ROOT / "resources" / "sprites" / "components"
@@ -44,38 +49,25 @@ class ComponentScore:
         )
 
 
-def analyze_pixel_density(img: Image.Image) -> float:
+def analyze_pixel_density(img: ImageLike) -> float:
     """Calculate ratio of non-transparent pixels."""
-    if img.mode != 'RGBA':
-        img = img.convert('RGBA')
-
-    pixels = list(img.getdata())
-    non_transparent = sum(1 for p in pixels if p[3] > 128)
-    total = len(pixels)
+    rgba = as_rgba(img)
+    total = rgba.shape[0] * rgba.shape[1]
 
-    return non_transparent / total if total > 0 else 0
+    return int(alpha_mask(rgba).sum()) / total if total > 0 else 0
 
 
-def analyze_colors(img: Image.Image) -> tuple[int, float]:
+def analyze_colors(img: ImageLike) -> tuple[int, float]:
     """Analyze color palette.
 
     Returns:
         color_count: Number of unique opaque colors
         coherence: How well colors form a coherent palette (0-1)
     """
-    if img.mode != 'RGBA':
-        img = img.convert('RGBA')
-
-    # Get unique opaque colors
-    pixels = list(img.getdata())
-    opaque_colors = set()
-    for p in pixels:
-        if p[3] > 128:  # Opaque enough
-            # Quantize to reduce near-duplicates
-            r, g, b = p[0] // 8 * 8, p[1] // 8 * 8, p[2] // 8 * 8
-            opaque_colors.add((r, g, b))
+    rgba = as_rgba(img)
 
-    color_count = len(opaque_colors)
+    # Unique opaque colors, quantized to reduce near-duplicates
+    color_count = unique_color_count(rgba, alpha_mask(rgba), step=8)
 
     # Coherence: fewer colors = more coherent for pixel art
     # Ideal is 4-12 colors for small sprites
@@ -95,87 +87,43 @@ def analyze_colors(img: Image.Image) -> tuple[int, float]:
     return color_count, coherence
 
 
-def analyze_edges(img: Image.Image) -> float:
+def analyze_edges(img: ImageLike) -> float:
     """Analyze edge clarity.
 
     Checks for:
     - Clear silhouette (no stray pixels)
     - No anti-aliasing artifacts (pixel art should be crisp)
     """
-    if img.mode != 'RGBA':
-        img = img.convert('RGBA')
-
-    width, height = img.size
-    pixels = img.load()
-
-    # Count boundary pixels vs interior pixels
-    boundary_count = 0
-    clean_boundary_count = 0
-
-    for y in range(height):
-        for x in range(width):
-            alpha = pixels[x, y][3]
-
-            if alpha > 128:  # This pixel is opaque
-                # Check if it's a boundary pixel
-                is_boundary = False
-                neighbor_alphas = []
-
-                for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                    nx, ny = x + dx, y + dy
-                    if 0 <= nx < width and 0 <= ny < height:
-                        neighbor_alphas.append(pixels[nx, ny][3])
-                    else:
-                        is_boundary = True  # Edge of image
-
-                if any(a <= 128 for a in neighbor_alphas):
-                    is_boundary = True
+    rgba = as_rgba(img)
 
-                if is_boundary:
-                    boundary_count += 1
-                    # Clean boundary = fully opaque (255) not semi-transparent
-                    if alpha >= 250:
-                        clean_boundary_count += 1
+    # Boundary pixels: opaque, next to a transparent pixel or the image edge
+    boundary = boundary_mask(alpha_mask(rgba))
+    boundary_count = int(boundary.sum())
 
     if boundary_count == 0:
         return 1.0
 
+    # Clean boundary = fully opaque (255) not semi-transparent
+    clean_boundary_count = int((rgba[..., 3][boundary] >= 250).sum())
+
     return clean_boundary_count / boundary_count
 
 
-def analyze_shading(img: Image.Image) -> float:
+def analyze_shading(img: ImageLike) -> float:
     """Analyze shading quality.
 
     Good pixel art has:
     - Light and dark variations of base colors
     - Highlights and shadows
     """
-    if img.mode != 'RGBA':
-        img = img.convert('RGBA')
-
-    pixels = list(img.getdata())
-    opaque_pixels = [p for p in pixels if p[3] > 128]
+    rgba = as_rgba(img)
+    luminances = luminance(rgba)[alpha_mask(rgba)]
 
-    if len(opaque_pixels) < 10:
+    if luminances.size < 10:
         return 0.5  # Too small to judge
 
-    # Calculate luminance for each pixel
-    luminances = []
-    for r, g, b, a in opaque_pixels:
-        lum = 0.299 * r + 0.587 * g + 0.114 * b
-        luminances.append(lum)
-
-    if not luminances:
-        return 0.0
-
-    min_lum = min(luminances)
-    max_lum = max(luminances)
-    lum_range = max_lum - min_lum
-
-    # Calculate standard deviation
-    mean_lum = sum(luminances) / len(luminances)
-    variance = sum((l - mean_lum) ** 2 for l in luminances) / len(luminances)
-    std_dev = math.sqrt(variance)
+    lum_range = float(luminances.max() - luminances.min())
+    std_dev = float(luminances.std())
 
     # Score based on luminance range and variation
     # Good pixel art should have reasonable contrast
@@ -203,7 +151,7 @@ def analyze_shading(img: Image.Image) -> float:
 
 def validate_component(img_path: Path) -> ComponentScore:
     """Validate a single component image."""
-    img = Image.open(img_path)
+    img = load_rgba(img_path)
     name = img_path.stem
 
     pixel_density = analyze_pixel_density(img)
@@ -231,17 +179,17 @@ def validate_component(img_path: Path) -> ComponentScore:
     )
 
 
-def validate_all_components(components_dir: Path = COMPONENTS_DIR) -> dict[str, ComponentScore]:
-    """Validate all components in a directory."""
-    scores = {}
+def component_files(components_dir: Path = COMPONENTS_DIR) -> list[Path]:
+    """Component images in a directory (frame previews excluded)."""
+    return [
+        png_file for png_file in components_dir.glob("*.png")
+        if not png_file.stem.startswith("frame_")
+    ]
 
-    for png_file in components_dir.glob("*.png"):
-        # Skip frame previews
-        if png_file.stem.startswith("frame_"):
-            continue
-        scores[png_file.stem] = validate_component(png_file)
 
-    return scores
+def validate_all_components(components_dir: Path = COMPONENTS_DIR) -> dict[str, ComponentScore]:
+    """Validate all components in a directory."""
+    return {png_file.stem: validate_component(png_file) for png_file in component_files(components_dir)}
 
 
 def compare_component_sets(dir_a: Path, dir_b: Path) -> dict:
@@ -0,0 +1,583 @@
+#!/usr/bin/env python3
+"""
+Monte-Carlo economy simulator: how long does each upgrade take?
+
+Runs thousands of simulated players through the dig -> fill inventory ->
+return -> sell -> upgrade -> prestige loop, all agents advancing one trip at
+a time as NumPy arrays, and reports progression curves and time-to-upgrade
+distributions. Everything it prices comes from the game's own data:
+- ore/gem sell values, hardness and tool tiers from resources/ores and gems
+- tool damage, speed, cost and unlock depth from resources/tools
+- terrain (hardness, caves, ore shares per depth) from worldgen_sim
+- EconomyConfig defaults (get_tool_cost, get_ore_sell_value), overridable
+  with a remote-config JSON via --config
+- PrestigeManager points, milestones and bonuses
+- the shop's backpack upgrades and PlayerData.get_depth_sell_multiplier()
+
+Model:
+- Each trip the player drops to a target depth: the deepest row where the
+  equipped tool needs at most --max-hits hits per block, but no more than
+  --dive-step below the run's previous record. New depth is dug as a shaft.
+- At the target depth they dig up to --trip-blocks blocks, stopping early
+  when the inventory is full (stacks of max_stack, as InventoryManager.add_item).
+  Ores the tool cannot mine (required_tool_tier) are walked around.
+- A hit takes one swing (8 frames at 10 fps) divided by the tool's speed and
+  the prestige mining speed bonus; every block also costs a MOVE_DURATION step.
+- Back at the surface everything is sold ("shop" pricing: sell_value x the
+  dive depth multiplier, as shop.gd pays; "config" pricing: get_ore_sell_value
+  per item), the prestige coin bonus is applied, and the next tool and
+  backpack are bought whenever unlocked and affordable.
+- When the run reaches --prestige-depth the agent prestiges, spends points in
+  --allocate order and restarts with PrestigeManager's reset state.
+Shaft ore, chests, ladders and consumables are not modelled.
+
+Usage:
+    python economy_sim.py                              # 2000 agents, 10 hours
+    python economy_sim.py --agents 10000 --hours 20 --jobs 0
+    python economy_sim.py --pricing config --config tuning.json
+    python economy_sim.py --prestige-depth 0           # Never prestige
+"""
+
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+import ast
+import json
+import re
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+from game_data import Ore, Tool, load_game_data
+from parallel_jobs import resolve_jobs, run_jobs
+from worldgen_sim import PROJECT_ROOT, depth_chunks, iter_batches, load_world
+
+ECONOMY_CONFIG = PROJECT_ROOT / "scripts" / "autoload" / "economy_config.gd"
+PRESTIGE_MANAGER = PROJECT_ROOT / "scripts" / "autoload" / "prestige_manager.gd"
+SHOP = PROJECT_ROOT / "scripts" / "ui" / "shop.gd"
+
+HIT_SECONDS = 0.8     # "swing" in miner_animation.tres: 8 frames at 10 fps
+MOVE_SECONDS = 0.15   # Player.MOVE_DURATION
+BASE_SLOTS = 8        # InventoryManager.max_slots
+
+# Rows averaged on each side of a depth when building the terrain profile
+PROFILE_WINDOW = 4
+
+# Blocks dug per vectorized step within a trip
+STEP_BLOCKS = 25
+
+# Inventory fill fractions tried when a step overflows the last slot
+FILL_FRACTIONS = np.linspace(1.0, 0.0, 21)
+
+# Agents per pool job
+AGENTS_PER_JOB = 500
+
+MAX_TRIPS = 100_000
+
+DEFAULT_ALLOCATION = ("mining_speed", "coin_bonus", "inventory_bonus", "starting_coins", "fall_resistance")
+
+
+# ============================================
+# Game data
+# ============================================
+
+def _gd_value(text: str, name: str):
+    """Literal value of a top-level `var`/`const` declaration in a GDScript file."""
+    match = re.search(rf'^(?:var|const) {name}\b[^=\n]*=\s*', text, re.MULTILINE)
+    if match is None:
+        raise KeyError(name)
+    start = end = match.end()
+    if text[start] in "[{":
+        depth = 0
+        for end in range(start, len(text)):
+            depth += {"[": 1, "{": 1, "]": -1, "}": -1}.get(text[end], 0)
+            if depth == 0:
+                break
+        source = text[start:end + 1]
+    else:
+        source = text[start:text.index("\n", start)]
+    source = re.sub(r'#[^\n]*', "", source)
+    source = re.sub(r'\btrue\b', "True", re.sub(r'\bfalse\b', "False", source))
+    return ast.literal_eval(source.strip())
+
+
+def load_ore_items(ore_ids: list[str]) -> list[Ore]:
+    """OreData for each id, in the given order."""
+    ores = load_game_data().ores
+    return [ores[ore_id] for ore_id in ore_ids]
+
+
+def load_tools() -> list[Tool]:
+    """ToolData by tier (PlayerData.get_next_tool_upgrade walks tiers in order)."""
+    return load_game_data().tools_by_tier()
+
+
+@dataclass
+class EconomyConfig:
+    """EconomyConfig's session snapshot (defaults from economy_config.gd)."""
+    ore_value_multiplier: float
+    ore_depth_value_bonus: float
+    early_ore_boost: float
+    ore_multipliers: dict
+    tool_cost_multiplier: float
+    tool_cost_overrides: dict
+    risk_zones: dict
+    jackpot_chance: float
+    jackpot_mult_min: float
+    jackpot_mult_max: float
+
+    def tool_cost(self, tool: Tool) -> int:
+        """get_tool_cost()."""
+        if tool.id in self.tool_cost_overrides:
+            return int(self.tool_cost_overrides[tool.id])
+        return max(0, int(tool.cost * self.tool_cost_multiplier))
+
+    def sell_values(self, rng: np.random.Generator, items: list[Ore], qty: np.ndarray,
+                    depth: np.ndarray) -> np.ndarray:
+        """Sum of get_ore_sell_value() over qty (agents x ores) items mined at depth.
+
+        Per-item variance and jackpot rolls are summed in aggregate (a normal
+        approximation of the variance rolls, binomial jackpot counts).
+        """
+        depth = depth[:, None]
+        base = np.array([item.sell_value for item in items], dtype=np.float64)[None, :]
+        multiplier = self.ore_value_multiplier * np.array(
+            [self.ore_multipliers.get(item.id, 1.0) for item in items])[None, :]
+        multiplier = multiplier * (1.0 + depth / 100.0 * self.ore_depth_value_bonus)
+        multiplier = np.where(depth < 50, multiplier * self.early_ore_boost, multiplier)
+
+        zone_depths = sorted(int(d) for d in self.risk_zones)
+        zones = [self.risk_zones[d] if d in self.risk_zones else self.risk_zones[str(d)] for d in zone_depths]
+        zone = np.maximum(np.searchsorted(zone_depths, depth, side="right") - 1, 0)
+        value_mult = np.array([z.get("value_mult", 1.0) for z in zones])[zone]
+        variance = np.array([z.get("variance", 0.0) for z in zones])[zone]
+        jackpots = np.array([z.get("has_jackpots", False) for z in zones])[zone]
+
+        rolls = qty + rng.standard_normal(qty.shape) * np.sqrt(qty * variance ** 2 / 3.0)
+        value = base * multiplier * value_mult * np.maximum(rolls, 0.0)
+        hits = rng.binomial(qty, np.where(jackpots, self.jackpot_chance, 0.0))
+        jackpot_mean = (self.jackpot_mult_min + self.jackpot_mult_max) / 2.0
+        value += hits * base * multiplier * value_mult * (jackpot_mean - 1.0)
+        return np.maximum(value, qty).sum(axis=1)
+
+
+# Keys EconomyConfig._apply_config() takes from a remote config
+_REMOTE_KEYS = (
+    "ore_value_multiplier", "ore_depth_value_bonus", "early_ore_boost", "ore_multipliers",
+    "tool_cost_multiplier", "tool_cost_overrides", "risk_zones", "jackpot_chance",
+)
+
+
+def load_economy_config(overrides: Optional[dict] = None) -> EconomyConfig:
+    """Local defaults, with a remote-config dictionary applied on top."""
+    text = ECONOMY_CONFIG.read_text()
+    config = EconomyConfig(**{f.name: _gd_value(text, f.name) for f in fields(EconomyConfig)})
+    for key, value in (overrides or {}).items():
+        if key == "ore_multipliers":
+            config.ore_multipliers.update(value)
+        elif key in _REMOTE_KEYS:
+            setattr(config, key, value)
+    return config
+
+
+@dataclass
+class Prestige:
+    """PrestigeManager constants."""
+    min_depth: int
+    points_per_100_depth: int
+    milestones: dict
+    bonuses: dict
+
+    def points(self, run_depth: np.ndarray) -> np.ndarray:
+        """calculate_prestige_points()."""
+        points = (run_depth // 100) * self.points_per_100_depth
+        for milestone, bonus in self.milestones.items():
+            points += np.where(run_depth >= milestone, bonus, 0)
+        return np.where(run_depth >= self.min_depth, points, 0)
+
+
+def load_prestige() -> Prestige:
+    text = PRESTIGE_MANAGER.read_text()
+    return Prestige(
+        min_depth=_gd_value(text, "MIN_PRESTIGE_DEPTH"),
+        points_per_100_depth=_gd_value(text, "POINTS_PER_100_DEPTH"),
+        milestones=_gd_value(text, "MILESTONE_BONUS_POINTS"),
+        bonuses=_gd_value(text, "BONUS_TYPES"),
+    )
+
+
+def load_backpacks() -> list[dict]:
+    """Shop.backpack_upgrades (level 1 is the starting backpack)."""
+    return _gd_value(SHOP.read_text(), "backpack_upgrades")
+
+
+# ============================================
+# Terrain profile
+# ============================================
+
+@dataclass
+class DepthProfile:
+    """Terrain averages per depth row over a band of columns around spawn."""
+    cave: np.ndarray        # (depths,) share of cave tiles
+    ore: np.ndarray         # (depths, ores) share of tiles holding each ore
+    hits: np.ndarray        # (tools, depths) mean hits per tile the tool can mine
+    blocked: np.ndarray     # (tools, depths) share of tiles with ore the tool cannot mine
+    shaft_hits: np.ndarray  # (tools, depths + 1) hits to dig a shaft from the surface to each depth
+
+    @property
+    def max_depth(self) -> int:
+        return len(self.cave) - 1
+
+
+def _smooth(values: np.ndarray) -> np.ndarray:
+    """Moving sum over PROFILE_WINDOW rows on each side (along the last axis)."""
+    kernel = np.ones(2 * PROFILE_WINDOW + 1)
+    padded = np.pad(values, [(0, 0)] * (values.ndim - 1) + [(PROFILE_WINDOW, PROFILE_WINDOW)], mode="edge")
+    return np.apply_along_axis(lambda row: np.convolve(row, kernel, mode="valid"), -1, padded)
+
+
+@lru_cache(maxsize=2)
+def depth_profile(max_depth: int, columns: int) -> DepthProfile:
+    world = load_world()
+    items = load_ore_items([ore.id for ore in world.ores])
+    tools = load_tools()
+    ore_hardness = np.array([item.hardness for item in items] + [0], dtype=np.float64)
+    required_tier = np.array([item.required_tool_tier for item in items] + [0])
+
+    n_ores, n_tools = len(items), len(tools)
+    tiles = np.zeros(max_depth)
+    caves = np.zeros(max_depth)
+    ores = np.zeros((n_ores, max_depth))
+    hits = np.zeros((n_tools, max_depth))
+    minable = np.zeros((n_tools, max_depth))
+
+    chunks = depth_chunks(0, max_depth, columns, -(columns // 2))
+    for batch in iter_batches(world, chunks):
+        in_range = (batch.depth >= 0) & (batch.depth < max_depth)
+        depth = batch.depth[in_range]
+        tile = batch.tile[in_range]
+        ore = batch.ore[in_range]  # NO_ORE (-1) indexes the trailing 0 entries
+        health = np.nan_to_num(batch.hardness[in_range]) + ore_hardness[ore]
+
+        tiles += np.bincount(depth, minlength=max_depth)
+        caves += np.bincount(depth[batch.cave[in_range]], minlength=max_depth)
+        has_ore = ore >= 0
+        ores += np.bincount(ore[has_ore] * max_depth + depth[has_ore],
+                            minlength=n_ores * max_depth).reshape(n_ores, max_depth)
+        for t, tool in enumerate(tools):
+            can_mine = tile & (tool.tier >= required_tier[ore])
+            hits[t] += np.bincount(depth[can_mine], np.ceil(health[can_mine] / tool.damage), minlength=max_depth)
+            minable[t] += np.bincount(depth[can_mine], minlength=max_depth)
+
+    tiles, caves, ores = _smooth(tiles), _smooth(caves), _smooth(ores)
+    hits, minable = _smooth(hits), _smooth(minable)
+    mean_hits = hits / np.maximum(minable, 1)
+    solid = 1.0 - caves / tiles
+    return DepthProfile(
+        cave=caves / tiles,
+        ore=(ores / tiles).T,
+        hits=mean_hits,
+        blocked=np.maximum(solid - minable / tiles, 0.0),
+        shaft_hits=np.concatenate([np.zeros((n_tools, 1)), np.cumsum(mean_hits * solid, axis=1)], axis=1),
+    )
+
+
+# ============================================
+# Simulation
+# ============================================
+
+@dataclass
+class Policy:
+    hours: float = 10.0
+    trip_blocks: int = 300
+    max_hits: float = 4.0
+    dive_step: int = 50
+    prestige_depth: int = 500
+    allocation: tuple = DEFAULT_ALLOCATION
+    pricing: str = "shop"
+    climb_seconds: float = 0.3
+    shop_seconds: float = 20.0
+    skill_spread: float = 0.2
+    interval_minutes: float = 10.0
+    config: dict = field(default_factory=dict)
+    max_depth: int = 1600
+    columns: int = 16
+
+    @property
+    def grid_minutes(self) -> np.ndarray:
+        return np.arange(0.0, self.hours * 60.0 + 1e-9, self.interval_minutes)
+
+
+def simulate_agents(n_agents: int, seed: int, policy: Policy) -> dict:
+    """Run n_agents players for policy.hours of play and return their histories."""
+    rng = np.random.default_rng(seed)
+    profile = depth_profile(policy.max_depth, policy.columns)
+    world = load_world()
+    items = load_ore_items([ore.id for ore in world.ores])
+    tools = load_tools()
+    config = load_economy_config(policy.config)
+    prestige = load_prestige()
+    backpacks = load_backpacks()
+
+    n_tools = len(tools)
+    damage_tier = np.array([tool.tier for tool in tools])
+    speed = np.array([tool.speed_multiplier for tool in tools])
+    tool_cost = np.array([config.tool_cost(tool) for tool in tools])
+    unlock_depth = np.array([tool.unlock_depth for tool in tools])
+    pack_slots = np.array([pack["slots"] for pack in backpacks])
+    pack_cost = np.array([pack["cost"] for pack in backpacks])
+    pack_depth = np.array([pack.get("min_depth", 0) for pack in backpacks])
+    sell_value = np.array([item.sell_value for item in items], dtype=np.float64)
+    max_stack = np.array([item.max_stack for item in items])
+    required_tier = np.array([item.required_tool_tier for item in items])
+    bonus_names = list(prestige.bonuses)
+    per_point = np.array([prestige.bonuses[name]["per_point"] for name in bonus_names], dtype=np.float64)
+    max_points = np.array([prestige.bonuses[name]["max_points"] for name in bonus_names])
+    allocation = [bonus_names.index(name) for name in policy.allocation if name in bonus_names]
+    bonus = {name: i for i, name in enumerate(bonus_names)}
+
+    # Deepest row each tool mines within max_hits, checked from the surface down
+    comfortable = np.logical_and.accumulate(profile.hits <= policy.max_hits, axis=1)
+    deepest = np.maximum(comfortable.sum(axis=1) - 1, 0)
+
+    A = n_agents
+    agents = np.arange(A)
+    pace = rng.lognormal(0.0, policy.skill_spread, A)  # > 1 = slower player
+    trip_blocks = np.maximum((policy.trip_blocks * rng.uniform(0.75, 1.25, A)).astype(np.int64), 1)
+    budget = policy.hours * 3600.0
+
+    clock = np.zeros(A)
+    coins = np.zeros(A, dtype=np.int64)
+    earned = np.zeros(A, dtype=np.int64)
+    tool = np.zeros(A, dtype=np.int64)
+    pack = np.zeros(A, dtype=np.int64)
+    slots = np.full(A, BASE_SLOTS)
+    run_depth = np.zeros(A, dtype=np.int64)
+    max_depth = np.zeros(A, dtype=np.int64)
+    prestige_level = np.zeros(A, dtype=np.int64)
+    points = np.zeros((A, len(bonus_names)), dtype=np.int64)
+    trips = np.zeros(A, dtype=np.int64)
+
+    upgrade_time = np.full((A, n_tools), np.nan)
+    upgrade_time[:, 0] = 0.0
+    upgrade_trips = np.full((A, n_tools), -1, dtype=np.int64)
+    upgrade_trips[:, 0] = 0
+    prestige_time = np.full(A, np.nan)
+
+    grid = policy.grid_minutes * 60.0
+    curves = {name: np.zeros((len(grid), A), dtype=np.int64)
+              for name in ("tool_tier", "max_depth", "coins", "earned", "prestige")}
+
+    def record(start, end, mask):
+        """State during [start, end) for every grid time in it."""
+        passed = mask[None, :] & (grid[:, None] >= start[None, :]) & (grid[:, None] < end[None, :])
+        for name, values in (("tool_tier", damage_tier[tool]), ("max_depth", max_depth),
+                             ("coins", coins), ("earned", earned), ("prestige", prestige_level)):
+            curves[name][passed] = np.broadcast_to(values, passed.shape)[passed]
+
+    for _ in range(MAX_TRIPS):
+        active = clock < budget
+        if not active.any():
+            break
+        start = clock.copy()
+        mining_speed = speed[tool] * (1.0 + points[:, bonus["mining_speed"]] * per_point[bonus["mining_speed"]])
+        hit_seconds = HIT_SECONDS / mining_speed * pace
+
+        # Dive, digging a shaft through rows below the run's record
+        target = np.minimum(np.minimum(deepest[tool], run_depth + policy.dive_step), profile.max_depth)
+        target = np.where(active, target, 0)
+        shaft = profile.shaft_hits[tool, target] - profile.shaft_hits[tool, np.minimum(run_depth, target)]
+        clock += np.where(active, shaft * hit_seconds + target * MOVE_SECONDS * pace, 0.0)
+
+        # Dig until the inventory fills or the trip's block budget runs out
+        ore_share = profile.ore[target] * (damage_tier[tool][:, None] >= required_tier[None, :])
+        probabilities = np.concatenate([ore_share, 1.0 - ore_share.sum(axis=1, keepdims=True)], axis=1)
+        block_seconds = ((1.0 - profile.cave[target] - profile.blocked[tool, target])
+                         * profile.hits[tool, target] * hit_seconds + MOVE_SECONDS * pace)
+        inventory = np.zeros((A, len(items)), dtype=np.int64)
+        left = np.where(active, trip_blocks, 0)
+        while left.any():
+            n = np.minimum(left, STEP_BLOCKS)
+            drawn = rng.multinomial(n, probabilities)[:, :-1]
+            fraction = np.ones(A)
+            over = np.flatnonzero(np.ceil((inventory + drawn) / max_stack).sum(axis=1) > slots)
+            if len(over):
+                partial = inventory[over, None, :] + np.floor(drawn[over, None, :] * FILL_FRACTIONS[None, :, None])
+                fits = np.ceil(partial / max_stack).sum(axis=2) <= slots[over, None]
+                fraction[over] = FILL_FRACTIONS[np.argmax(fits, axis=1)]
+            inventory += np.floor(drawn * fraction[:, None]).astype(np.int64)
+            clock += n * block_seconds
+            left = np.where(fraction < 1.0, 0, left - n)
+
+        # Climb back and sell
+        clock += np.where(active, target * policy.climb_seconds * pace + policy.shop_seconds, 0.0)
+        if policy.pricing == "config":
+            value = config.sell_values(rng, items, inventory, target)
+        else:
+            depth_multiplier = 1.0 + target / 100.0  # PlayerData.get_depth_sell_multiplier()
+            value = np.floor(inventory * sell_value[None, :] * depth_multiplier[:, None]).sum(axis=1)
+        coin_multiplier = 1.0 + points[:, bonus["coin_bonus"]] * per_point[bonus["coin_bonus"]]
+        sale = np.where(active, (value * coin_multiplier).astype(np.int64), 0)
+        record(start, clock, active)
+        coins += sale
+        earned += sale
+        run_depth = np.maximum(run_depth, target)
+        max_depth = np.maximum(max_depth, target)
+        trips += active
+
+        # Buy the next tool, then the next backpack, while affordable and unlocked
+        while True:
+            next_tool = np.minimum(tool + 1, n_tools - 1)
+            buy_tool = (active & (tool + 1 < n_tools) & (run_depth >= unlock_depth[next_tool])
+                        & (coins >= tool_cost[next_tool]))
+            coins -= np.where(buy_tool, tool_cost[next_tool], 0)
+            tool = np.where(buy_tool, next_tool, tool)
+            first = buy_tool & np.isnan(upgrade_time[agents, tool])
+            upgrade_time[agents[first], tool[first]] = clock[first]
+            upgrade_trips[agents[first], tool[first]] = trips[first]
+
+            next_pack = np.minimum(pack + 1, len(backpacks) - 1)
+            buy_pack = (active & ~buy_tool & (pack + 1 < len(backpacks)) & (run_depth >= pack_depth[next_pack])
+                        & (coins >= pack_cost[next_pack]))
+            coins -= np.where(buy_pack, pack_cost[next_pack], 0)
+            pack = np.where(buy_pack, next_pack, pack)
+            slots = np.where(buy_pack, np.maximum(slots, pack_slots[pack]), slots)  # upgrade_capacity()
+            if not (buy_tool.any() or buy_pack.any()):
+                break
+
+        # Prestige: spend points in allocation order and reset the run
+        if policy.prestige_depth > 0:
+            ready = active & (run_depth >= max(policy.prestige_depth, prestige.min_depth))
+            available = prestige.points(run_depth) * ready
+            for index in allocation:
+                spend = np.minimum(available, max_points[index] - points[:, index])
+                points[:, index] += spend
+                available -= spend
+            prestige_time = np.where(ready & np.isnan(prestige_time), clock, prestige_time)
+            prestige_level += ready
+            starting = (points[:, bonus["starting_coins"]] * per_point[bonus["starting_coins"]]).astype(np.int64)
+            coins = np.where(ready, starting, coins)
+            tool = np.where(ready, 0, tool)
+            pack = np.where(ready, 0, pack)
+            slots = np.where(ready, BASE_SLOTS + points[:, bonus["inventory_bonus"]], slots)
+            run_depth = np.where(ready, 0, run_depth)
+
+    record(clock, np.full(A, np.inf), np.ones(A, dtype=bool))
+    return {
+        **curves,
+        "upgrade_time": upgrade_time / 60.0,
+        "upgrade_trips": upgrade_trips,
+        "prestige_time": prestige_time / 60.0,
+        "trips": trips,
+    }
+
+
+def run_simulation(n_agents: int, policy: Policy, seed: int = 0, jobs: int = 1) -> dict:
+    """Simulate n_agents players split over pool jobs and merge their histories."""
+    counts = [min(AGENTS_PER_JOB, n_agents - i) for i in range(0, n_agents, AGENTS_PER_JOB)]
+    seeds = np.random.SeedSequence(seed).generate_state(len(counts))
+    results = run_jobs(simulate_agents, [(count, int(job_seed), policy) for count, job_seed in zip(counts, seeds)], jobs)
+
+    tools = load_tools()
+    merged = {}
+    for key in results[0]:
+        axis = 1 if results[0][key].ndim == 2 and key not in ("upgrade_time", "upgrade_trips") else 0
+        merged[key] = np.concatenate([r[key] for r in results], axis=axis)
+    merged["grid_minutes"] = policy.grid_minutes
+    merged["tool_ids"] = np.array([tool.id for tool in tools])
+    merged["tool_tiers"] = np.array([tool.tier for tool in tools])
+    return merged
+
+
+# ============================================
+# Report
+# ============================================
+
+def summary_report(data: dict, policy: Policy, n_agents: int, elapsed: float) -> str:
+    tools = load_tools()
+    config = load_economy_config(policy.config)
+    lines = [
+        "# Economy simulation",
+        "",
+        f"{n_agents:,} agents, {policy.hours:g} hours each, {policy.pricing} pricing, "
+        f"prestige at {policy.prestige_depth or 'never'} ({elapsed:.1f}s)",
+        "",
+        "| Tool | Cost | Unlock | Reached | Minutes (p10 / median / p90) | Trips (median) |",
+        "|------|-----:|-------:|--------:|------------------------------|---------------:|",
+    ]
+    for i, tool in enumerate(tools):
+        times = data["upgrade_time"][:, i]
+        reached = ~np.isnan(times)
+        if reached.any():
+            p10, p50, p90 = np.percentile(times[reached], [10, 50, 90])
+            timing = f"{p10:.0f} / {p50:.0f} / {p90:.0f}"
+            trip_count = f"{np.median(data['upgrade_trips'][reached, i]):.0f}"
+        else:
+            timing, trip_count = "-", "-"
+        lines.append(f"| {tool.id} | {config.tool_cost(tool):,} | {tool.unlock_depth}m | "
+                     f"{reached.mean():.0%} | {timing} | {trip_count} |")
+
+    prestiged = ~np.isnan(data["prestige_time"])
+    if prestiged.any():
+        lines += ["", f"First prestige: {prestiged.mean():.0%} of agents, median "
+                      f"{np.median(data['prestige_time'][prestiged]):.0f} minutes"]
+
+    lines += [
+        "",
+        "| Hours | Tool tier | Max depth | Coins earned | Prestiges |",
+        "|------:|----------:|----------:|-------------:|----------:|",
+    ]
+    grid = data["grid_minutes"]
+    step = max(1, int(round(60.0 / policy.interval_minutes)))
+    for g in range(0, len(grid), step):
+        lines.append(
+            f"| {grid[g] / 60.0:g} | {np.median(data['tool_tier'][g]):.0f} "
+            f"| {np.median(data['max_depth'][g]):.0f}m | {np.median(data['earned'][g]):,.0f} "
+            f"| {data['prestige'][g].mean():.2f} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Simulate player progression through the economy")
+    parser.add_argument("--agents", type=int, default=2000, help="Simulated players (default 2000)")
+    parser.add_argument("--hours", type=float, default=10.0, help="Play time per agent (default 10)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--trip-blocks", type=int, default=300, help="Blocks dug per trip (default 300)")
+    parser.add_argument("--max-hits", type=float, default=4.0,
+                        help="Deepest comfortable depth: mean hits per block (default 4)")
+    parser.add_argument("--dive-step", type=int, default=50, help="Max metres past the run's record per trip")
+    parser.add_argument("--prestige-depth", type=int, default=500, help="Prestige at this run depth (0 = never)")
+    parser.add_argument("--allocate", type=str, default=",".join(DEFAULT_ALLOCATION),
+                        help="Prestige bonus order to fill")
+    parser.add_argument("--pricing", choices=["shop", "config"], default="shop",
+                        help="shop: what shop.gd pays; config: EconomyConfig.get_ore_sell_value")
+    parser.add_argument("--config", type=Path, help="Remote-config JSON applied over EconomyConfig defaults")
+    parser.add_argument("--interval", type=float, default=10.0, help="Curve sample interval in minutes")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes (0 = one per core)")
+    parser.add_argument("--output", type=Path, default=Path("economy_sim"),
+                        help="Output path without extension (.npz and .md are written)")
+
+    args = parser.parse_args()
+    policy = Policy(
+        hours=args.hours, trip_blocks=args.trip_blocks, max_hits=args.max_hits, dive_step=args.dive_step,
+        prestige_depth=args.prestige_depth, allocation=tuple(args.allocate.split(",")), pricing=args.pricing,
+        interval_minutes=args.interval, config=json.loads(args.config.read_text()) if args.config else {},
+    )
+
+    print(f"Simulating {args.agents:,} agents on {resolve_jobs(args.jobs)} worker(s)...")
+    start = time.perf_counter()
+    data = run_simulation(args.agents, policy, args.seed, args.jobs)
+    elapsed = time.perf_counter() - start
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(args.output.with_suffix(".npz"), **data)
+    report = summary_report(data, policy, args.agents, elapsed)
+    args.output.with_suffix(".md").write_text(report)
+    print(report)
+    print(f"Wrote {args.output.with_suffix('.npz')} and {args.output.with_suffix('.md')}")
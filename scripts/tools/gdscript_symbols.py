@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Project-wide GDScript symbol index.
+
+Records, for every .gd file in the project:
+- its class_name (if any) and what it extends
+- every top-level func and its declared return type (None if undeclared)
+
+plus every autoload in project.godot. The index is persisted in
+scripts/tools/.cache/gdscript_symbols.json and updated incrementally: a
+script is re-parsed only when its mtime/size and content hash changed.
+
+gdscript_type_lint.py uses it to resolve `var x := Obj.method()` when Obj is
+an autoload or a variable typed with a class_name: the call can only be
+inferred if the method (or one it inherits from a project script) declares
+a non-void return type.
+
+Usage:
+    python gdscript_symbols.py                 # Update and summarize
+    python gdscript_symbols.py GameManager     # Show a class or autoload
+"""
+
+from pathlib import Path
+from typing import Optional
+import hashlib
+import json
+import re
+import sys
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+INDEX_FILE = Path(__file__).parent / ".cache" / "gdscript_symbols.json"
+
+# Bump when the parsed fields change
+INDEX_FORMAT = 1
+
+CLASS_NAME = re.compile(r'^class_name\s+(\w+)', re.MULTILINE)
+EXTENDS = re.compile(r'^extends\s+("[^"]+"|[\w.]+)', re.MULTILINE)
+FUNC = re.compile(r'^(?:static\s+)?func\s+(\w+)\s*\(', re.MULTILINE)
+RETURN_TYPE = re.compile(r'\s*->\s*([\w.]+(?:\[[\w., ]+\])?)\s*:')
+AUTOLOAD = re.compile(r'^(\w+)\s*=\s*"\*?(res://[^"]+)"', re.MULTILINE)
+SCENE_SCRIPT = re.compile(r'\[ext_resource[^\]]*type="Script"[^\]]*path="([^"]+)"[^\]]*id="([^"]+)"')
+ROOT_SCRIPT = re.compile(r'\[node name="[^"]+" type="[^"]+"\]\s*\nscript = ExtResource\("([^"]+)"\)')
+
+
+def _skip_parens(text: str, start: int) -> int:
+    """Index just past the ')' matching the '(' before start."""
+    depth = 1
+    i = start
+    in_string = None
+    while i < len(text) and depth:
+        ch = text[i]
+        if in_string:
+            if ch == "\\":
+                i += 1
+            elif ch == in_string:
+                in_string = None
+        elif ch in "\"'":
+            in_string = ch
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        i += 1
+    return i
+
+
+def parse_script(text: str) -> dict:
+    """class_name, extends and top-level funcs (name -> return type) of a script."""
+    class_name = CLASS_NAME.search(text)
+    extends = EXTENDS.search(text)
+    funcs = {}
+    for match in FUNC.finditer(text):
+        end = _skip_parens(text, match.end())
+        returns = RETURN_TYPE.match(text, end)
+        funcs[match.group(1)] = returns.group(1) if returns else None
+    return {
+        "class_name": class_name.group(1) if class_name else None,
+        "extends": extends.group(1).strip('"') if extends else None,
+        "funcs": funcs,
+    }
+
+
+def res_path(path: Path, root: Path = PROJECT_ROOT) -> str:
+    return "res://" + Path(path).resolve().relative_to(root.resolve()).as_posix()
+
+
+def _scene_root_script(scene: Path) -> Optional[str]:
+    """res:// path of the script on a scene's root node."""
+    try:
+        text = scene.read_text(encoding="utf-8")
+    except OSError:
+        return None
+    scripts = {rid: path for path, rid in SCENE_SCRIPT.findall(text)}
+    root = ROOT_SCRIPT.search(text)
+    return scripts.get(root.group(1)) if root else None
+
+
+def parse_autoloads(root: Path = PROJECT_ROOT) -> dict[str, str]:
+    """Autoload name -> res:// path of its script (a scene's root script for .tscn)."""
+    try:
+        text = (root / "project.godot").read_text(encoding="utf-8")
+    except OSError:
+        return {}
+    section = re.search(r'^\[autoload\]\n(.*?)(?=^\[|\Z)', text, re.MULTILINE | re.DOTALL)
+    autoloads = {}
+    for name, path in AUTOLOAD.findall(section.group(1) if section else ""):
+        if path.endswith(".tscn"):
+            path = _scene_root_script(root / path[len("res://"):])
+        if path:
+            autoloads[name] = path
+    return autoloads
+
+
+class SymbolIndex:
+    """Persisted symbols of every script in a project."""
+
+    def __init__(self, root: Path = PROJECT_ROOT, path: Path = INDEX_FILE):
+        self.root = Path(root)
+        self.path = Path(path)
+        self.scripts: dict[str, dict] = {}
+        self.autoloads: dict[str, str] = {}
+        self.classes: dict[str, str] = {}
+        self._dirty = False
+        try:
+            data = json.loads(self.path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if data.get("format") == INDEX_FORMAT and data.get("root") == str(self.root.resolve()):
+            self.scripts = data.get("scripts", {})
+            self.autoloads = data.get("autoloads", {})
+            self._index_classes()
+
+    def _index_classes(self):
+        self.classes = {
+            entry["class_name"]: path
+            for path, entry in sorted(self.scripts.items())
+            if entry["class_name"]
+        }
+
+    def update(self, files: Optional[list[Path]] = None) -> int:
+        """Re-parse new and changed scripts and drop deleted ones.
+
+        Returns:
+            Number of scripts (re)parsed
+        """
+        if files is None:
+            files = [
+                path for path in self.root.rglob("*.gd")
+                if not any(part.startswith(".") for part in path.relative_to(self.root).parts[:-1])
+            ]
+
+        seen = set()
+        parsed = 0
+        for path in files:
+            key = res_path(path, self.root)
+            seen.add(key)
+            stat = path.stat()
+            entry = self.scripts.get(key)
+            if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                continue
+            data = path.read_bytes()
+            digest = hashlib.sha256(data).hexdigest()
+            if not entry or entry["sha256"] != digest:
+                entry = parse_script(data.decode("utf-8", errors="replace"))
+                entry["sha256"] = digest
+                parsed += 1
+            entry["mtime_ns"], entry["size"] = stat.st_mtime_ns, stat.st_size
+            self.scripts[key] = entry
+            self._dirty = True
+
+        for key in set(self.scripts) - seen:
+            del self.scripts[key]
+            self._dirty = True
+
+        autoloads = parse_autoloads(self.root)
+        if autoloads != self.autoloads:
+            self.autoloads = autoloads
+            self._dirty = True
+
+        self._index_classes()
+        return parsed
+
+    def save(self):
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({
+            "format": INDEX_FORMAT,
+            "root": str(self.root.resolve()),
+            "scripts": self.scripts,
+            "autoloads": self.autoloads,
+        }))
+        tmp.replace(self.path)
+        self._dirty = False
+
+    def script_for(self, name: str) -> Optional[str]:
+        """res:// script path behind a class_name or autoload name."""
+        return self.classes.get(name) or self.autoloads.get(name)
+
+    def resolve_method(self, script: str, method: str) -> tuple[bool, Optional[str]]:
+        """Find a method on a script or the project scripts it extends.
+
+        Returns:
+            (found, declared return type). found is False when the chain
+            reaches an engine class, which may still define the method.
+        """
+        visited = set()
+        while script and script not in visited:
+            visited.add(script)
+            entry = self.scripts.get(script)
+            if entry is None:
+                return False, None
+            if method in entry["funcs"]:
+                return True, entry["funcs"][method]
+            parent = entry["extends"]
+            script = parent if parent and parent.startswith("res://") else self.classes.get(parent)
+        return False, None
+
+    def signatures(self) -> dict:
+        """Everything lint results depend on: class names, returns, autoloads."""
+        return {
+            "scripts": {
+                path: [entry["class_name"], entry["extends"], entry["funcs"]]
+                for path, entry in sorted(self.scripts.items())
+            },
+            "autoloads": self.autoloads,
+        }
+
+    def signature_digest(self) -> str:
+        """Changes only when a class name, extends, func signature or autoload does."""
+        return hashlib.sha256(json.dumps(self.signatures(), sort_keys=True).encode()).hexdigest()[:16]
+
+
+def load_index(root: Path = PROJECT_ROOT) -> SymbolIndex:
+    """The project's symbol index, brought up to date."""
+    index = SymbolIndex(root)
+    index.update()
+    index.save()
+    return index
+
+
+def main(argv: list[str]) -> int:
+    index = SymbolIndex()
+    parsed = index.update()
+    index.save()
+
+    if not argv:
+        funcs = sum(len(entry["funcs"]) for entry in index.scripts.values())
+        untyped = sum(
+            1 for entry in index.scripts.values()
+            for returns in entry["funcs"].values() if returns is None
+        )
+        print(f"Scripts:   {len(index.scripts)} ({parsed} re-parsed)")
+        print(f"Classes:   {len(index.classes)}")
+        print(f"Autoloads: {len(index.autoloads)}")
+        print(f"Funcs:     {funcs} ({untyped} without a return type)")
+        return 0
+
+    for name in argv:
+        script = index.script_for(name)
+        if script is None:
+            print(f"{name}: not a class_name or autoload")
+            continue
+        entry = index.scripts.get(script, {})
+        print(f"{name}: {script} (extends {entry.get('extends')})")
+        for func, returns in sorted(entry.get("funcs", {}).items()):
+            print(f"  {func}() -> {returns or '?'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
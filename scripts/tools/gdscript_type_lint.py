@@ -9,11 +9,42 @@ Catches patterns like:
 When a variable is typed as a base Godot class (not a class_name script),
 GDScript 4.6 cannot infer the return type of method calls on it.
 Use explicit types instead: `var result: bool = foo.some_method()`
+
+With the project symbol index (gdscript_symbols.py) it also catches
+`var x := GameManager.foo()` or `var x := player.foo()` (player typed with a
+class_name) when foo() has no declared return type or returns void.
+
+Results are cached per file in scripts/tools/.cache/gdscript_type_lint.json,
+keyed by mtime, size and content hash (plus the linter's own source and the
+index's signatures), so a run only re-lints files that changed. Stale files
+are linted on a process pool when there are enough of them to be worth it.
+
+Usage:
+    python gdscript_type_lint.py                       # Whole project
+    python gdscript_type_lint.py scripts/player.gd     # Specific files
+    python gdscript_type_lint.py --changed-since HEAD  # Changed vs a git ref
+    python gdscript_type_lint.py --no-cache --jobs 4
 """
 
+from pathlib import Path
+from typing import Optional
+import hashlib
+import json
 import re
+import subprocess
 import sys
-from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from gdscript_symbols import SymbolIndex, load_index
+from parallel_jobs import run_jobs
+from validation_cache import source_version
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+CACHE_FILE = Path(__file__).parent / ".cache" / "gdscript_type_lint.json"
+
+# Below this many stale files, a process pool costs more than it saves
+# (a file lints in ~0.2 ms; starting the pool takes ~80 ms)
+PARALLEL_MIN_FILES = 500
 
 # Base Godot node/object types that don't carry script method return types
 BASE_GODOT_TYPES = {
@@ -90,63 +121,235 @@ INFER_ASSIGN = re.compile(
 )
 
 
-def collect_base_typed_vars(lines: list[str]) -> dict[str, str]:
-    """Return {var_name: godot_type} for vars typed as base Godot classes."""
+def collect_typed_vars(lines: list[str]) -> dict[str, str]:
+    """Return {var_name: type} for every explicitly typed var."""
     vars_: dict[str, str] = {}
     for line in lines:
-        m = ONREADY_DECL.search(line)
+        m = ONREADY_DECL.search(line) or VAR_DECL.search(line)
         if m:
-            name, typ = m.group(1), m.group(2)
-            if typ in BASE_GODOT_TYPES:
-                vars_[name] = typ
-            continue
-        m = VAR_DECL.search(line)
-        if m:
-            name, typ = m.group(1), m.group(2)
-            if typ in BASE_GODOT_TYPES:
-                vars_[name] = typ
+            vars_[m.group(1)] = m.group(2)
     return vars_
 
 
-def lint_file(path: Path) -> list[str]:
-    """Return list of error strings for a single .gd file."""
-    errors = []
-    try:
-        lines = path.read_text(encoding="utf-8").splitlines()
-    except OSError as e:
-        return [f"{path}: cannot read: {e}"]
+def collect_base_typed_vars(lines: list[str]) -> dict[str, str]:
+    """Return {var_name: godot_type} for vars typed as base Godot classes."""
+    return {
+        name: typ for name, typ in collect_typed_vars(lines).items()
+        if typ in BASE_GODOT_TYPES
+    }
+
+
+def lint_source(text: str, symbols: Optional[SymbolIndex] = None) -> list[tuple[int, str]]:
+    """Return (line number, message) for each error in GDScript source.
 
-    base_vars = collect_base_typed_vars(lines)
-    if not base_vars:
+    With a symbol index, calls on autoloads and on vars typed with a
+    class_name are resolved into the target script too.
+    """
+    lines = text.splitlines()
+    typed_vars = collect_typed_vars(lines)
+    base_vars = {name: typ for name, typ in typed_vars.items() if typ in BASE_GODOT_TYPES}
+    if not base_vars and symbols is None:
         return []
 
+    errors = []
     for lineno, line in enumerate(lines, start=1):
         m = INFER_ASSIGN.match(line)
         if not m:
             continue
         result_var, obj_var, method = m.group(1), m.group(2), m.group(3)
-        if obj_var in base_vars and method not in BUILTIN_METHODS:
-            godot_type = base_vars[obj_var]
-            errors.append(
-                f"{path}:{lineno}: '{obj_var}' is typed as base class '{godot_type}' — "
-                f"cannot infer return type of '{method}()'. "
-                f"Use explicit type: `var {result_var}: <type> = {obj_var}.{method}(...)`"
-            )
+        if obj_var in base_vars:
+            if method not in BUILTIN_METHODS:
+                godot_type = base_vars[obj_var]
+                errors.append((
+                    lineno,
+                    f"'{obj_var}' is typed as base class '{godot_type}' — "
+                    f"cannot infer return type of '{method}()'. "
+                    f"Use explicit type: `var {result_var}: <type> = {obj_var}.{method}(...)`"
+                ))
+            continue
+        if symbols is None:
+            continue
+
+        # A typed local shadows an autoload of the same name
+        owner = typed_vars.get(obj_var, obj_var)
+        script = symbols.script_for(owner)
+        if script is None:
+            continue
+        found, returns = symbols.resolve_method(script, method)
+        if not found:
+            continue
+        if returns is None:
+            errors.append((
+                lineno,
+                f"'{owner}.{method}()' has no declared return type — "
+                f"cannot infer type of '{result_var}'. "
+                f"Declare `-> <type>` on {method}() or use `var {result_var}: <type> = {obj_var}.{method}(...)`"
+            ))
+        elif returns == "void":
+            errors.append((
+                lineno,
+                f"'{owner}.{method}()' returns void — '{result_var}' has no value to infer from"
+            ))
 
     return errors
 
 
-def main(paths: list[str]) -> int:
-    all_errors: list[str] = []
+def _lint_path(path: str, symbols: Optional[SymbolIndex] = None) -> list[tuple[int, str]]:
+    """Errors for a file; line 0 means the file itself (unreadable)."""
+    try:
+        return lint_source(Path(path).read_text(encoding="utf-8"), symbols)
+    except OSError as e:
+        return [(0, f"cannot read: {e}")]
+
+
+def _format(path: Path, errors: list) -> list[str]:
+    return [
+        f"{path}:{lineno}: {message}" if lineno else f"{path}: {message}"
+        for lineno, message in errors
+    ]
+
+
+def lint_file(path: Path, symbols: Optional[SymbolIndex] = None) -> list[str]:
+    """Return list of error strings for a single .gd file."""
+    return _format(path, _lint_path(str(path), symbols))
+
+
+class LintCache:
+    """Per-file lint results, reused while a file's contents are unchanged."""
+
+    def __init__(self, path: Path = CACHE_FILE, symbols: Optional[SymbolIndex] = None):
+        self.path = Path(path)
+        # Results depend on other scripts' signatures too, but not their bodies
+        self.version = source_version(Path(__file__).name, "gdscript_symbols.py")
+        if symbols is not None:
+            self.version += ":" + symbols.signature_digest()
+        self.entries: dict[str, dict] = {}
+        self._dirty = False
+        try:
+            data = json.loads(self.path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if data.get("version") == self.version:
+            self.entries = data.get("files", {})
+
+    def lookup(self, path: Path) -> Optional[list]:
+        """Cached errors for a file, or None if it must be linted.
+
+        A matching mtime and size is trusted without reading the file; if
+        only the stat changed (touch, checkout) the content hash decides.
+        """
+        key = str(path.resolve())
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        stat = path.stat()
+        if entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return entry["errors"]
+        if entry["sha256"] != hashlib.sha256(path.read_bytes()).hexdigest():
+            return None
+        entry["mtime_ns"], entry["size"] = stat.st_mtime_ns, stat.st_size
+        self._dirty = True
+        return entry["errors"]
+
+    def store(self, path: Path, errors: list):
+        stat = path.stat()
+        self.entries[str(path.resolve())] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": hashlib.sha256(path.read_bytes()).hexdigest(),
+            "errors": [list(error) for error in errors],
+        }
+        self._dirty = True
+
+    def save(self):
+        """Write the cache back, dropping entries for files that were deleted."""
+        deleted = [key for key in self.entries if not Path(key).exists()]
+        for key in deleted:
+            del self.entries[key]
+        if not (self._dirty or deleted):
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"version": self.version, "files": self.entries}))
+        tmp.replace(self.path)
+        self._dirty = False
+
+
+def project_files(root: Path = PROJECT_ROOT) -> list[Path]:
+    """Every .gd file under root, skipping hidden directories (.godot, .git)."""
+    return sorted(
+        path for path in root.rglob("*.gd")
+        if not any(part.startswith(".") for part in path.relative_to(root).parts[:-1])
+    )
+
+
+def changed_files(ref: str) -> list[Path]:
+    """.gd files added or modified since a git ref, including uncommitted and untracked ones."""
+    top = Path(subprocess.run(
+        ["git", "rev-parse", "--show-toplevel"],
+        capture_output=True, text=True, check=True, cwd=PROJECT_ROOT,
+    ).stdout.strip())
+    names = subprocess.run(
+        ["git", "diff", "--name-only", "--diff-filter=ACMR", ref, "--", "*.gd"],
+        capture_output=True, text=True, check=True, cwd=top,
+    ).stdout.split()
+    names += subprocess.run(
+        ["git", "ls-files", "--others", "--exclude-standard", "--", "*.gd"],
+        capture_output=True, text=True, check=True, cwd=top,
+    ).stdout.split()
+    return sorted({top / name for name in names if (top / name).exists()})
+
+
+def lint_files(files: list[Path], cache: Optional[LintCache] = None, jobs: int = 0,
+               symbols: Optional[SymbolIndex] = None) -> list[str]:
+    """Lint files, reusing cached results and spreading the rest over jobs workers."""
+    results: dict[Path, list] = {}
+    stale = []
+    for path in files:
+        try:
+            cached = cache.lookup(path) if cache else None
+        except OSError as e:
+            results[path] = [(0, f"cannot read: {e}")]
+            continue
+        if cached is None:
+            stale.append(path)
+        else:
+            results[path] = cached
+
+    if stale:
+        workers = jobs if len(stale) >= PARALLEL_MIN_FILES else 1
+        for path, errors in zip(stale, run_jobs(_lint_path, [(str(p), symbols) for p in stale], workers)):
+            results[path] = errors
+            if cache and path.exists():
+                cache.store(path, errors)
+
+    return [error for path in files for error in _format(path, results[path])]
+
+
+def main(argv: list[str]) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="GDScript type inference linter")
+    parser.add_argument("paths", nargs="*", help=".gd files to lint (default: whole project)")
+    parser.add_argument("--changed-since", metavar="REF",
+                        help="Only lint .gd files changed since this git ref")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and don't update the result cache")
+    parser.add_argument("--jobs", type=int, default=0,
+                        help="Worker processes (0 = one per CPU core)")
+    args = parser.parse_args(argv)
 
-    if paths:
-        files = [Path(p) for p in paths if p.endswith(".gd")]
+    if args.changed_since:
+        files = changed_files(args.changed_since)
+    elif args.paths:
+        files = [Path(p) for p in args.paths if p.endswith(".gd")]
     else:
-        root = Path(__file__).parent.parent.parent
-        files = list(root.rglob("*.gd"))
+        files = project_files()
 
-    for f in files:
-        all_errors.extend(lint_file(f))
+    symbols = load_index()
+    cache = None if args.no_cache else LintCache(symbols=symbols)
+    all_errors = lint_files(files, cache, args.jobs, symbols)
+    if cache:
+        cache.save()
 
     if all_errors:
         print("GDScript type inference errors found:\n")
@@ -10,12 +10,17 @@ Output: resources/sprites/buildings/
 """
 
 import os
+import sys
 import random
 import math
 from PIL import Image, ImageDraw
 from typing import Tuple, List, Dict, Optional
 from dataclasses import dataclass
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from indexed_png import save_png
+from parallel_jobs import run_jobs
+
 
 # Building sprite size (256x192 as per shop_building.tscn)
 BUILDING_WIDTH = 256
@@ -626,8 +631,11 @@ def create_building_sprite(
     return img
 
 
-def generate_all_buildings(seed: int = 42, output_dir: Optional[str] = None) -> Dict[str, str]:
-    """Generate sprites for all building types."""
+def generate_all_buildings(seed: int = 42, output_dir: Optional[str] = None, jobs: int = 1) -> Dict[str, str]:
+    """Generate sprites for all building types.
+
+    Sprites are rendered on `jobs` worker processes (0 = one per core).
+    """
 
     if output_dir is None:
         script_dir = os.path.dirname(__file__)
@@ -640,14 +648,21 @@ def generate_all_buildings(seed: int = 42, output_dir: Optional[str] = None) ->
 
     print(f"Generating building sprites to: {output_dir}")
 
-    for building_type, palette in BUILDING_PALETTES.items():
-        sprite = create_building_sprite(building_type, seed + hash(building_type) % 1000)
+    # Seeds are derived here, not in the workers, so every sprite gets the
+    # same seed as in a serial run
+    building_types = list(BUILDING_PALETTES.keys())
+    sprites = run_jobs(
+        create_building_sprite,
+        [(building_type, seed + hash(building_type) % 1000) for building_type in building_types],
+        jobs
+    )
 
+    for building_type, sprite in zip(building_types, sprites):
         output_path = os.path.join(output_dir, f"{building_type}.png")
-        sprite.save(output_path)
+        save_png(sprite, output_path)
         output_files[building_type] = output_path
 
-        print(f"  Generated: {palette.name} -> {output_path}")
+        print(f"  Generated: {BUILDING_PALETTES[building_type].name} -> {output_path}")
 
     # Also generate an atlas image for preview
     atlas_cols = 5
@@ -656,16 +671,13 @@ def generate_all_buildings(seed: int = 42, output_dir: Optional[str] = None) ->
     atlas_h = atlas_rows * BUILDING_HEIGHT
     atlas = Image.new("RGBA", (atlas_w, atlas_h), (100, 150, 200, 255))  # Sky blue background
 
-    building_types = list(BUILDING_PALETTES.keys())
-    for i, building_type in enumerate(building_types):
+    for i, sprite in enumerate(sprites):
         col = i % atlas_cols
         row = i // atlas_cols
-
-        sprite = create_building_sprite(building_type, seed + hash(building_type) % 1000)
         atlas.paste(sprite, (col * BUILDING_WIDTH, row * BUILDING_HEIGHT), sprite)
 
     atlas_path = os.path.join(output_dir, "buildings_atlas.png")
-    atlas.save(atlas_path)
+    save_png(atlas, atlas_path)
     print(f"\nGenerated atlas preview: {atlas_path}")
 
     return output_files
@@ -683,7 +695,7 @@ def generate_single_building(
     if output_path is None:
         output_path = f"{building_type}_building.png"
 
-    sprite.save(output_path)
+    save_png(sprite, output_path)
     print(f"Saved {building_type} building to: {output_path}")
 
     return output_path
@@ -697,6 +709,8 @@ if __name__ == "__main__":
     parser.add_argument("--output", type=str, help="Output directory for sprites")
     parser.add_argument("--single", type=str, help="Generate a single building (type name)")
     parser.add_argument("--list-types", action="store_true", help="List available building types")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Worker processes for sprites (0 = one per CPU core)")
 
     args = parser.parse_args()
 
@@ -707,4 +721,4 @@ if __name__ == "__main__":
     elif args.single:
         generate_single_building(args.single, args.seed, args.output)
     else:
-        generate_all_buildings(args.seed, args.output)
+        generate_all_buildings(args.seed, args.output, args.jobs)
@@ -13,12 +13,19 @@ Output: resources/tileset/terrain_atlas.png
 """
 
 import os
+import sys
 import random
 import math
+import numpy as np
 from PIL import Image, ImageDraw
 from typing import Tuple, List, Dict, Optional
 from dataclasses import dataclass
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from build_graph import Target
+from indexed_png import save_png
+from parallel_jobs import run_jobs
+
 
 # Tile configuration
 TILE_SIZE = 128
@@ -172,53 +179,57 @@ PALETTES = {
 }
 
 
+# Bayer 4x4 matrix for ordered dithering
+BAYER_4X4 = np.array([
+    [0, 8, 2, 10],
+    [12, 4, 14, 6],
+    [3, 11, 1, 9],
+    [15, 7, 13, 5]
+])
+
+# Strength of the ordered dithering offset (in color levels)
+DITHER_STRENGTH = 30
+
+
+def _smoothstep_axis(size: int, scale: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Grid cell index and smoothstep weight for each pixel along one axis."""
+    g = np.arange(size) / scale
+    i0 = g.astype(np.int64)
+    f = g - i0
+    return i0, f * f * (3 - 2 * f)
+
+
 def generate_noise_layer(
     width: int,
     height: int,
     scale: float = 8.0,
     seed: int = 0
-) -> List[List[float]]:
-    """Generate a simple value noise layer."""
+) -> np.ndarray:
+    """Generate a simple value noise layer as a (height, width) array."""
     random.seed(seed)
 
-    # Create grid of random values
+    # Create grid of random values (drawn row by row from the seeded RNG)
     grid_w = int(width / scale) + 2
     grid_h = int(height / scale) + 2
-    grid = [[random.random() for _ in range(grid_w)] for _ in range(grid_h)]
-
-    # Interpolate to full resolution
-    noise = []
-    for y in range(height):
-        row = []
-        for x in range(width):
-            # Get grid coordinates
-            gx = x / scale
-            gy = y / scale
-
-            # Integer and fractional parts
-            x0 = int(gx)
-            y0 = int(gy)
-            fx = gx - x0
-            fy = gy - y0
-
-            # Smooth interpolation
-            fx = fx * fx * (3 - 2 * fx)
-            fy = fy * fy * (3 - 2 * fy)
+    grid = np.array([[random.random() for _ in range(grid_w)] for _ in range(grid_h)])
 
-            # Bilinear interpolation
-            v00 = grid[y0][x0]
-            v10 = grid[y0][x0 + 1]
-            v01 = grid[y0 + 1][x0]
-            v11 = grid[y0 + 1][x0 + 1]
+    # Interpolate to full resolution with smoothstep weights
+    x0, fx = _smoothstep_axis(width, scale)
+    y0, fy = _smoothstep_axis(height, scale)
+    fx = fx[np.newaxis, :]
+    fy = fy[:, np.newaxis]
 
-            v0 = v00 + (v10 - v00) * fx
-            v1 = v01 + (v11 - v01) * fx
-            value = v0 + (v1 - v0) * fy
+    # Bilinear interpolation
+    rows0 = grid[y0]
+    rows1 = grid[y0 + 1]
+    v00 = rows0[:, x0]
+    v10 = rows0[:, x0 + 1]
+    v01 = rows1[:, x0]
+    v11 = rows1[:, x0 + 1]
 
-            row.append(value)
-        noise.append(row)
-
-    return noise
+    v0 = v00 + (v10 - v00) * fx
+    v1 = v01 + (v11 - v01) * fx
+    return v0 + (v1 - v0) * fy
 
 
 def combine_noise_layers(
@@ -226,31 +237,30 @@ def combine_noise_layers(
     height: int,
     octaves: int = 3,
     seed: int = 0
-) -> List[List[float]]:
+) -> np.ndarray:
     """Combine multiple noise layers for natural-looking texture."""
-    combined = [[0.0 for _ in range(width)] for _ in range(height)]
+    combined = np.zeros((height, width))
 
     amplitude = 1.0
     total_amplitude = 0.0
     scale = 16.0
 
     for i in range(octaves):
-        layer = generate_noise_layer(width, height, scale, seed + i * 1000)
-
-        for y in range(height):
-            for x in range(width):
-                combined[y][x] += layer[y][x] * amplitude
+        combined += generate_noise_layer(width, height, scale, seed + i * 1000) * amplitude
 
         total_amplitude += amplitude
         amplitude *= 0.5
         scale *= 0.5
 
     # Normalize
-    for y in range(height):
-        for x in range(width):
-            combined[y][x] /= total_amplitude
+    return combined / total_amplitude
 
-    return combined
+
+def snap_to_palette(rgb: np.ndarray, colors: List[Tuple[int, int, int]]) -> np.ndarray:
+    """Index of the nearest palette color for each pixel (first wins on ties)."""
+    palette = np.array(colors, dtype=np.int64)
+    diff = rgb[..., np.newaxis, :].astype(np.int64) - palette
+    return (diff * diff).sum(axis=-1).argmin(axis=-1)
 
 
 def apply_dithering(
@@ -259,55 +269,28 @@ def apply_dithering(
     pattern: str = "ordered"
 ) -> Image.Image:
     """Apply dithering pattern to image."""
-    width, height = img.size
-    pixels = img.load()
-
-    # Bayer 4x4 matrix for ordered dithering
-    bayer_4x4 = [
-        [0, 8, 2, 10],
-        [12, 4, 14, 6],
-        [3, 11, 1, 9],
-        [15, 7, 13, 5]
-    ]
-
-    for y in range(height):
-        for x in range(width):
-            r, g, b, a = pixels[x, y]
-
-            if a == 0:
-                continue
-
-            # Find closest color
-            min_dist = float('inf')
-            closest = colors[0]
-
-            for color in colors:
-                dist = (r - color[0])**2 + (g - color[1])**2 + (b - color[2])**2
-                if dist < min_dist:
-                    min_dist = dist
-                    closest = color
+    pixels = np.array(img.convert("RGBA"))
+    height, width = pixels.shape[:2]
+    palette = np.array(colors, dtype=np.int64)
 
-            # Apply ordered dithering threshold
-            if pattern == "ordered":
-                threshold = (bayer_4x4[y % 4][x % 4] / 16.0 - 0.5) * 30
+    # Find closest color
+    closest = palette[snap_to_palette(pixels[..., :3], colors)]
 
-                # Adjust color based on threshold
-                adjusted = tuple(
-                    max(0, min(255, c + int(threshold)))
-                    for c in closest
-                )
+    # Apply ordered dithering threshold
+    if pattern == "ordered":
+        threshold = (BAYER_4X4 / 16.0 - 0.5) * DITHER_STRENGTH
+        offsets = np.tile(threshold.astype(np.int64), (height // 4 + 1, width // 4 + 1))[:height, :width]
 
-                # Find new closest after adjustment
-                min_dist = float('inf')
-                for color in colors:
-                    dist = sum((adjusted[i] - color[i])**2 for i in range(3))
-                    if dist < min_dist:
-                        min_dist = dist
-                        closest = color
+        # Adjust color based on threshold, then find new closest
+        adjusted = np.clip(closest + offsets[..., np.newaxis], 0, 255)
+        closest = palette[snap_to_palette(adjusted, colors)]
 
-            pixels[x, y] = closest + (255,)
+    # Transparent pixels are left untouched
+    opaque = pixels[..., 3] != 0
+    pixels[opaque, :3] = closest[opaque]
+    pixels[opaque, 3] = 255
 
-    return img
+    return Image.fromarray(pixels, "RGBA")
 
 
 def draw_rock_detail(
@@ -380,9 +363,6 @@ def create_dirt_tile(
     is_ore: bool = False
 ) -> Image.Image:
     """Create a single dirt/terrain tile with proper pixel art aesthetics."""
-    tile = Image.new("RGBA", (TILE_SIZE, TILE_SIZE), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(tile)
-
     # Generate multi-layer noise
     noise = combine_noise_layers(TILE_SIZE, TILE_SIZE, octaves=3, seed=tile_seed)
 
@@ -390,22 +370,15 @@ def create_dirt_tile(
     colors = palette.get_colors()
 
     # First pass: Base color fill with noise-based shading
-    for y in range(TILE_SIZE):
-        for x in range(TILE_SIZE):
-            value = noise[y][x]
-
-            # Map noise to color index
-            if value < 0.35:
-                color = palette.dark
-            elif value < 0.65:
-                color = palette.base
-            else:
-                color = palette.light
-
-            tile.putpixel((x, y), color + (255,))
+    shades = np.array([palette.dark, palette.base, palette.light], dtype=np.uint8)
+    shade_index = (noise >= 0.35).astype(np.int64) + (noise >= 0.65)
+    pixels = np.full((TILE_SIZE, TILE_SIZE, 4), 255, dtype=np.uint8)
+    pixels[..., :3] = shades[shade_index]
+    tile = Image.fromarray(pixels, "RGBA")
 
     # Second pass: Apply dithering for pixel art look
     tile = apply_dithering(tile, colors, pattern="ordered")
+    draw = ImageDraw.Draw(tile)
 
     # Third pass: Add detail elements
     random.seed(tile_seed + 500)
@@ -428,21 +401,23 @@ def create_dirt_tile(
 
     # Fourth pass: Add subtle border shading for depth
     border_width = 4
-    for y in range(TILE_SIZE):
-        for x in range(TILE_SIZE):
-            # Distance from edge
-            dist_from_edge = min(x, y, TILE_SIZE - 1 - x, TILE_SIZE - 1 - y)
-
-            if dist_from_edge < border_width:
-                # Darken pixels near edge
-                r, g, b, a = tile.getpixel((x, y))
-                factor = 0.7 + (dist_from_edge / border_width) * 0.3
-                r = int(r * factor)
-                g = int(g * factor)
-                b = int(b * factor)
-                tile.putpixel((x, y), (r, g, b, a))
+    coords = np.arange(TILE_SIZE)
+    edge = np.minimum(coords, TILE_SIZE - 1 - coords)
+
+    # Distance from edge
+    dist_from_edge = np.minimum(edge[:, np.newaxis], edge[np.newaxis, :])
+
+    # Darken pixels near edge
+    factor = 0.7 + (dist_from_edge / border_width) * 0.3
+    border = dist_from_edge < border_width
+    pixels = np.array(tile)
+    pixels[..., :3] = np.where(
+        border[..., np.newaxis],
+        (pixels[..., :3] * factor[..., np.newaxis]).astype(np.uint8),
+        pixels[..., :3]
+    )
 
-    return tile
+    return Image.fromarray(pixels, "RGBA")
 
 
 def create_ladder_tile(palette: MaterialPalette, seed: int) -> Image.Image:
@@ -575,8 +550,23 @@ TILE_LAYOUT = {
 }
 
 
-def generate_terrain_atlas(seed: int = 42, output_path: Optional[str] = None) -> str:
-    """Generate the complete terrain atlas with improved textures."""
+def render_tile(material_name: str, tile_type: str, is_ore: bool, tile_seed: int) -> Image.Image:
+    """Render one atlas tile (a parallel_jobs job)."""
+    palette = PALETTES[material_name]
+    if tile_type == "special" and material_name == "ladder":
+        return create_ladder_tile(palette, tile_seed)
+    elif tile_type == "gem":
+        return create_gem_tile(palette, tile_seed)
+    else:
+        return create_dirt_tile(0, 0, palette, tile_seed, is_ore)
+
+
+def generate_terrain_atlas(seed: int = 42, output_path: Optional[str] = None, jobs: int = 1) -> str:
+    """Generate the complete terrain atlas with improved textures.
+
+    Tiles are rendered on `jobs` worker processes (0 = one per core) and
+    pasted in layout order, so the atlas is identical for any job count.
+    """
 
     # Create atlas image
     width = COLS * TILE_SIZE
@@ -585,32 +575,27 @@ def generate_terrain_atlas(seed: int = 42, output_path: Optional[str] = None) ->
 
     print(f"Generating {COLS}x{ROWS} terrain atlas ({width}x{height} pixels)...")
 
+    positions = []
+    job_args = []
     for (col, row), (material_name, is_ore, tile_type) in TILE_LAYOUT.items():
-        x_offset = col * TILE_SIZE
-        y_offset = row * TILE_SIZE
-        tile_seed = seed + col * 100 + row * 1000
-
         if material_name == "air":
             # Leave transparent
             print(f"  [{col},{row}] Air - transparent")
             continue
 
-        palette = PALETTES.get(material_name)
-        if not palette:
+        if material_name not in PALETTES:
             print(f"  [{col},{row}] {material_name} - MISSING PALETTE, skipping")
             continue
 
-        # Generate tile based on type
-        if tile_type == "special" and material_name == "ladder":
-            tile = create_ladder_tile(palette, tile_seed)
-        elif tile_type == "gem":
-            tile = create_gem_tile(palette, tile_seed)
-        else:
-            tile = create_dirt_tile(x_offset, y_offset, palette, tile_seed, is_ore)
+        positions.append((col, row))
+        job_args.append((material_name, tile_type, is_ore, seed + col * 100 + row * 1000))
+
+    tiles = run_jobs(render_tile, job_args, jobs)
 
+    for (col, row), args, tile in zip(positions, job_args, tiles):
         # Paste tile into atlas
-        atlas.paste(tile, (x_offset, y_offset))
-        print(f"  [{col},{row}] {palette.name} - generated")
+        atlas.paste(tile, (col * TILE_SIZE, row * TILE_SIZE))
+        print(f"  [{col},{row}] {PALETTES[args[0]].name} - generated")
 
     # Determine output path
     if output_path is None:
@@ -622,13 +607,25 @@ def generate_terrain_atlas(seed: int = 42, output_path: Optional[str] = None) ->
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
     # Save atlas
-    atlas.save(output_path)
+    save_png(atlas, output_path)
     print(f"\nSaved terrain atlas to: {output_path}")
     print(f"Size: {width}x{height} ({COLS} columns x {ROWS} rows of {TILE_SIZE}x{TILE_SIZE} tiles)")
 
     return output_path
 
 
+def build_targets() -> List[Target]:
+    """Build graph target for the default (seed 42) terrain atlas."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    output_path = os.path.join(os.path.dirname(os.path.dirname(script_dir)), "resources", "tileset", "terrain_atlas.png")
+    return [Target(
+        name="terrain:atlas",
+        action=generate_terrain_atlas,
+        args=(42, output_path),
+        outputs=[output_path],
+    )]
+
+
 def generate_single_tile(
     material: str,
     seed: int = 42,
@@ -655,7 +652,7 @@ def generate_single_tile(
     if output_path is None:
         output_path = f"{material}_tile.png"
 
-    tile.save(output_path)
+    save_png(tile, output_path)
     print(f"Saved {material} tile to: {output_path}")
 
     return output_path
@@ -669,6 +666,8 @@ if __name__ == "__main__":
     parser.add_argument("--output", type=str, help="Output path for atlas")
     parser.add_argument("--single", type=str, help="Generate a single tile (material name)")
     parser.add_argument("--list-materials", action="store_true", help="List available materials")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Worker processes for atlas tiles (0 = one per CPU core)")
 
     args = parser.parse_args()
 
@@ -679,4 +678,4 @@ if __name__ == "__main__":
     elif args.single:
         generate_single_tile(args.single, args.seed, args.output)
     else:
-        generate_terrain_atlas(args.seed, args.output)
+        generate_terrain_atlas(args.seed, args.output, args.jobs)
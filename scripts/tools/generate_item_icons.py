@@ -9,8 +9,13 @@ Run: python3 scripts/tools/generate_item_icons.py
 
 import math
 import os
+import sys
 from PIL import Image, ImageDraw
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from build_graph import Target
+from indexed_png import save_png
+
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "../../resources/icons/items")
 SIZE = 64
 
@@ -209,6 +214,7 @@ def draw_tablet(img, draw, rc):
 
 # ── item registry ─────────────────────────────────────────────────────────────
 
+# Border rarities match the shipped icons, not necessarily the item's .tres
 ITEMS = [
     ("ladder",               "common",    draw_ladder),
     ("rope",                 "common",    draw_rope),
@@ -224,15 +230,31 @@ ITEMS = [
 ]
 
 
-def main():
+def render_icon(item_id: str, rarity: str, draw_fn):
+    """Draw one item icon and save it to OUTPUT_DIR."""
     os.makedirs(OUTPUT_DIR, exist_ok=True)
+    img, draw, rc = make_base(rarity)
+    draw_fn(img, draw, rc)
+    save_png(img, os.path.join(OUTPUT_DIR, f"{item_id}.png"))
+    print(f"  {item_id}.png")
+
+
+def build_targets() -> list[Target]:
+    """Build graph targets: one per item icon."""
+    return [
+        Target(
+            name=f"icon:{item_id}",
+            action=render_icon,
+            args=(item_id, rarity, draw_fn),
+            outputs=[os.path.join(OUTPUT_DIR, f"{item_id}.png")],
+        )
+        for item_id, rarity, draw_fn in ITEMS
+    ]
 
+
+def main():
     for item_id, rarity, draw_fn in ITEMS:
-        img, draw, rc = make_base(rarity)
-        draw_fn(img, draw, rc)
-        out_path = os.path.join(OUTPUT_DIR, f"{item_id}.png")
-        img.save(out_path)
-        print(f"  {item_id}.png")
+        render_icon(item_id, rarity, draw_fn)
 
     print(f"\nGenerated {len(ITEMS)} icons → {OUTPUT_DIR}")
 
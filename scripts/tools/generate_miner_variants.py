@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Generate miner swing sheets for every tool x helmet combination.
+
+Reads the pickaxes in resources/tools/*.tres and the helmets (slot = HELMET)
+in resources/equipment/*.tres, recolors the pickaxe head and hardhat of the
+saved sprite components to match each item, and assembles the full
+SWING_POSES animation for every (tool, helmet) pair, plus each tool with no
+helmet (the default yellow hardhat, helmet id "none").
+
+Body and arm layers are loaded once and shared by every variant. Work is
+split per tool, so the rotated arm+pickaxe for each pose is computed once
+and reused for every helmet (see rotate_around_pivot's cache).
+
+Every frame is trimmed and packed with atlas_packer (MaxRects onto the
+fewest power-of-two pages by area) into miner_variants_<n>.png, with:
+
+    miner_variants.tres   AtlasTextures in the "regions" metadata, named
+                          "<tool_id>/<helmet_id>/<frame>"; MinerVariants
+                          (scripts/player/miner_variants.gd) builds the
+                          player's SpriteFrames from it
+    miner_variants.json   the same regions for tools:
+        {
+          "pages": [{"image": "miner_variants_0.png", "size": [w, h]}, ...],
+          "frame_size": [128, 128],
+          "poses": ["ready", "windup_1", ...],
+          "regions": {"<tool_id>/<helmet_id>/<frame>": {"page", "rect",
+                      "offset", "source_size"}}
+        }
+
+Run: python3 scripts/tools/generate_miner_variants.py [--jobs N]
+Output: resources/sprites/variants/
+"""
+
+from PIL import Image
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Optional
+import json
+import sys
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+from atlas_packer import Sprite, pack, trim, write_tres
+from build_graph import Target
+from game_data import GameData, load_game_data
+from generate_item_icons import rarity_color
+from improved_sprite_builder_v4 import (
+    COLORS, COMPONENTS_DIR, FRAME_HEIGHT, FRAME_WIDTH, PROJECT_ROOT,
+    SHEET_COMPONENTS, SPRITES_DIR, SWING_POSES, assemble_frame,
+)
+from indexed_png import save_png
+from parallel_jobs import run_jobs
+
+TOOLS_DIR = PROJECT_ROOT / "resources" / "tools"
+EQUIPMENT_DIR = PROJECT_ROOT / "resources" / "equipment"
+OUTPUT_DIR = SPRITES_DIR / "variants"
+ATLAS_PREFIX = "miner_variants"
+INDEX_NAME = "miner_variants.json"
+TRES_NAME = "miner_variants.tres"
+
+# Helmet id for the unrecolored default hardhat (no helmet equipped)
+NO_HELMET = "none"
+
+# Hardhat colors in create_head_component (shadow, base, highlight)
+HARDHAT_COLORS = ((220, 180, 50), (240, 200, 60), (255, 220, 80))
+
+# Pickaxe head colors in create_pickaxe_component (shadow, base, highlight)
+METAL_COLORS = (COLORS["metal_shadow"], COLORS["metal"], COLORS["metal_highlight"])
+
+# Largest atlas page side
+MAX_PAGE_SIZE = 2048
+
+
+@dataclass
+class ToolVariant:
+    """A pickaxe from resources/tools."""
+    id: str
+    tier: int
+    color: tuple  # (r, g, b) from particle_color
+
+
+@dataclass
+class HelmetVariant:
+    """A helmet from resources/equipment (rarity None: the default hardhat)."""
+    id: str
+    tier: int
+    rarity: Optional[str]
+
+
+def load_tools(data: Optional[GameData] = None) -> list[ToolVariant]:
+    """Pickaxes, lowest tier first."""
+    data = data or load_game_data()
+    return [
+        ToolVariant(
+            id=tool.id,
+            tier=tool.tier,
+            color=tuple(round(c * 255) for c in tool.particle_color[:3]),
+        )
+        for tool in data.tools_by_tier()
+    ]
+
+
+def load_helmets(data: Optional[GameData] = None) -> list[HelmetVariant]:
+    """Helmet-slot equipment, lowest tier first (without NO_HELMET)."""
+    data = data or load_game_data()
+    helmets = [
+        HelmetVariant(id=item.id, tier=item.tier, rarity=item.rarity)
+        for item in data.equipment.values() if item.slot == "helmet"
+    ]
+    return sorted(helmets, key=lambda helmet: (helmet.tier, helmet.id))
+
+
+def shade_ramp(base: tuple) -> tuple:
+    """(shadow, base, highlight) for a base color."""
+    shadow = tuple(int(c * 0.55) for c in base)
+    highlight = tuple(int(c + (255 - c) * 0.35) for c in base)
+    return shadow, tuple(base), highlight
+
+
+def recolor(img: Image.Image, source: tuple, target: tuple) -> Image.Image:
+    """Copy of img with each source color replaced by the matching target color."""
+    pixels = np.array(img.convert('RGBA'))
+    visible = pixels[..., 3] > 0
+    matches = [visible & (pixels[..., :3] == old).all(axis=-1) for old in source]
+    for mask, new in zip(matches, target):
+        pixels[mask, :3] = new
+    return Image.fromarray(pixels, 'RGBA')
+
+
+def load_components() -> dict:
+    """Saved sprite components by name (body, head, arm, left_arm, pickaxe)."""
+    return {
+        Path(filename).stem: Image.open(COMPONENTS_DIR / filename).convert('RGBA')
+        for filename in SHEET_COMPONENTS
+    }
+
+
+def render_tool_frames(tool: ToolVariant, helmets: list, components: dict) -> list:
+    """Swing frames for one tool with each helmet, in helmet order."""
+    pickaxe = recolor(components["pickaxe"], METAL_COLORS, shade_ramp(tool.color))
+    per_helmet = []
+    for helmet in helmets:
+        head = components["head"]
+        if helmet.rarity is not None:
+            head = recolor(head, HARDHAT_COLORS, shade_ramp(rarity_color(helmet.rarity)))
+        per_helmet.append([
+            assemble_frame(
+                body=components["body"],
+                head=head,
+                arm=components["arm"],
+                pickaxe=pickaxe,
+                left_arm=components["left_arm"],
+                arm_angle=pose["arm_angle"],
+                body_offset=pose["body_offset"],
+            )
+            for pose in SWING_POSES
+        ])
+    return per_helmet
+
+
+def frame_name(tool_id: str, helmet_id: str, frame: int) -> str:
+    return f"{tool_id}/{helmet_id}/{frame}"
+
+
+def generate_variants(output_dir: Path = OUTPUT_DIR, jobs: int = 1) -> Path:
+    """Render every tool x helmet swing, pack the frames and write the pages and indexes."""
+    tools = load_tools()
+    helmets = [HelmetVariant(id=NO_HELMET, tier=0, rarity=None)] + load_helmets()
+    components = load_components()
+    print(f"Rendering {len(tools)} tools x {len(helmets)} helmets x {len(SWING_POSES)} poses...")
+
+    per_tool = run_jobs(render_tool_frames, [(tool, helmets, components) for tool in tools], jobs)
+    sprites = []
+    for tool, per_helmet in zip(tools, per_tool):
+        for helmet, frames in zip(helmets, per_helmet):
+            for i, frame in enumerate(frames):
+                trimmed, offset = trim(frame)
+                sprites.append(Sprite(frame_name(tool.id, helmet.id, i), trimmed, offset, frame.size))
+    pages = pack(sprites, MAX_PAGE_SIZE, padding=0)
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for stale in output_dir.glob(f"{ATLAS_PREFIX}_*.png"):
+        stale.unlink()
+
+    by_name = {sprite.name: sprite for sprite in sprites}
+    page_paths = []
+    regions = {}
+    for index, page in enumerate(pages):
+        image = Image.new('RGBA', (page.width, page.height), COLORS["transparent"])
+        for name, (x, y) in page.placements.items():
+            sprite = by_name[name]
+            image.paste(sprite.image, (x, y))
+            regions[name] = {
+                "page": index,
+                "rect": [x, y, sprite.size[0], sprite.size[1]],
+                "offset": list(sprite.offset),
+                "source_size": list(sprite.source_size),
+            }
+        page_path = output_dir / f"{ATLAS_PREFIX}_{index}.png"
+        save_png(image, page_path)
+        page_paths.append(page_path)
+    regions = {sprite.name: regions[sprite.name] for sprite in sprites}
+
+    index = {
+        "pages": [
+            {"image": path.name, "size": [page.width, page.height]}
+            for path, page in zip(page_paths, pages)
+        ],
+        "frame_size": [FRAME_WIDTH, FRAME_HEIGHT],
+        "poses": [pose["name"] for pose in SWING_POSES],
+        "regions": regions,
+    }
+    index_path = output_dir / INDEX_NAME
+    index_path.write_text(json.dumps(index, indent=2) + "\n")
+    write_tres(output_dir / TRES_NAME, page_paths, regions)
+
+    grid_bytes = len(sprites) * FRAME_WIDTH * FRAME_HEIGHT * 4
+    atlas_bytes = sum(page.width * page.height * 4 for page in pages)
+    for path, page in zip(page_paths, pages):
+        print(f"  {path.name}: {page.width}x{page.height}, {len(page.placements)} frames")
+    print(f"  Index: {index_path} ({len(tools) * len(helmets)} variants, {len(sprites)} frames)")
+    print(f"  VRAM (RGBA8): {grid_bytes / 1024:.0f} KiB untrimmed -> {atlas_bytes / 1024:.0f} KiB")
+    return index_path
+
+
+def page_outputs(output_dir: Path = OUTPUT_DIR) -> list[Path]:
+    """Page images listed in the last index (the first page before any build)."""
+    try:
+        pages = json.loads((Path(output_dir) / INDEX_NAME).read_text())["pages"]
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        return [Path(output_dir) / f"{ATLAS_PREFIX}_0.png"]
+    return [Path(output_dir) / page["image"] for page in pages]
+
+
+def build_targets() -> list[Target]:
+    """Build graph target for the variant atlas (after the sprite components)."""
+    return [Target(
+        name="sprite:variants",
+        action=generate_variants,
+        inputs=(
+            [COMPONENTS_DIR / filename for filename in SHEET_COMPONENTS]
+            + sorted(TOOLS_DIR.glob("*.tres"))
+            + sorted(EQUIPMENT_DIR.glob("*.tres"))
+        ),
+        outputs=[OUTPUT_DIR / INDEX_NAME, OUTPUT_DIR / TRES_NAME] + page_outputs(),
+        deps=[f"sprite:{Path(filename).stem}" for filename in SHEET_COMPONENTS],
+    )]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate tool x helmet miner sprite variants")
+    parser.add_argument("--output", type=Path, default=OUTPUT_DIR, help="Output directory")
+    parser.add_argument("--list", action="store_true", help="List tools and helmets")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Worker processes, one tool per job (0 = one per CPU core)")
+
+    args = parser.parse_args()
+
+    if args.list:
+        print("Tools:")
+        for tool in load_tools():
+            print(f"  - {tool.id} (tier {tool.tier}, color {tool.color})")
+        print("Helmets:")
+        for helmet in load_helmets():
+            print(f"  - {helmet.id} (tier {helmet.tier}, {helmet.rarity})")
+    else:
+        generate_variants(args.output, args.jobs)
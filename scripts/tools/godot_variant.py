@@ -0,0 +1,635 @@
+#!/usr/bin/env python3
+"""
+Godot 4 Variant binary serialization.
+
+Reads and writes the format produced by var_to_bytes() and
+FileAccess.store_var() (marshalls.cpp), so save files written by the game can
+be inspected and generated offline. Values map to Python as:
+
+    null / bool / int / float / String   None / bool / int / float / str
+    Dictionary / Array                   dict / list (typed containers decode
+                                         to plain ones and encode untyped)
+    Vector2, Vector2i, Rect2, Color...   the NamedTuples below
+    StringName / NodePath                StringName / NodePath (str subclasses)
+    PackedByteArray                      bytes
+    Packed*Array                         the list subclasses below
+    Object                               GodotObject (full_objects) or
+                                         ObjectID (encoded as an id)
+
+Floats in math types are written as 32-bit, as a standard (non-double) Godot
+build does; 64-bit values written by double builds are read either way.
+
+Usage:
+    from godot_variant import Vector2i, decode, encode, get_var, store_var
+
+    data = encode({"pos": Vector2i(3, -4), "name": "gold"})
+    decode(data)
+
+    with open(path, "rb") as f:
+        value = get_var(f, allow_objects=True)   # FileAccess.get_var(true)
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, NamedTuple
+import struct
+
+# Variant::Type
+NIL = 0
+BOOL = 1
+INT = 2
+FLOAT = 3
+STRING = 4
+VECTOR2 = 5
+VECTOR2I = 6
+RECT2 = 7
+RECT2I = 8
+VECTOR3 = 9
+VECTOR3I = 10
+TRANSFORM2D = 11
+VECTOR4 = 12
+VECTOR4I = 13
+PLANE = 14
+QUATERNION = 15
+AABB_TYPE = 16
+BASIS = 17
+TRANSFORM3D = 18
+PROJECTION = 19
+COLOR = 20
+STRING_NAME = 21
+NODE_PATH = 22
+RID_TYPE = 23
+OBJECT = 24
+CALLABLE = 25
+SIGNAL = 26
+DICTIONARY = 27
+ARRAY = 28
+PACKED_BYTE_ARRAY = 29
+PACKED_INT32_ARRAY = 30
+PACKED_INT64_ARRAY = 31
+PACKED_FLOAT32_ARRAY = 32
+PACKED_FLOAT64_ARRAY = 33
+PACKED_STRING_ARRAY = 34
+PACKED_VECTOR2_ARRAY = 35
+PACKED_VECTOR3_ARRAY = 36
+PACKED_COLOR_ARRAY = 37
+PACKED_VECTOR4_ARRAY = 38
+
+HEADER_TYPE_MASK = 0xFF
+FLAG_64 = 1 << 16               # INT, FLOAT and real_t math types
+FLAG_OBJECT_AS_ID = 1 << 16     # OBJECT
+TYPED_ARRAY_SHIFT = 16          # ARRAY: element type kind, bits 16-17
+TYPED_KEY_SHIFT = 16            # DICTIONARY: key type kind, bits 16-17
+TYPED_VALUE_SHIFT = 18          # DICTIONARY: value type kind, bits 18-19
+
+# Container type kinds
+CONTAINER_NONE = 0
+CONTAINER_BUILTIN = 1
+CONTAINER_CLASS_NAME = 2
+CONTAINER_SCRIPT = 3
+
+# Godot refuses to nest deeper than this (MAX_RECURSION_DEPTH)
+MAX_DEPTH = 1024
+
+_U32 = struct.Struct("<I")
+_I32 = struct.Struct("<i")
+_I64 = struct.Struct("<q")
+_U64 = struct.Struct("<Q")
+_F32 = struct.Struct("<f")
+_F64 = struct.Struct("<d")
+
+
+# ============================================
+# Python types
+# ============================================
+
+class Vector2(NamedTuple):
+    x: float
+    y: float
+
+
+class Vector2i(NamedTuple):
+    x: int
+    y: int
+
+
+class Rect2(NamedTuple):
+    x: float
+    y: float
+    width: float
+    height: float
+
+
+class Rect2i(NamedTuple):
+    x: int
+    y: int
+    width: int
+    height: int
+
+
+class Vector3(NamedTuple):
+    x: float
+    y: float
+    z: float
+
+
+class Vector3i(NamedTuple):
+    x: int
+    y: int
+    z: int
+
+
+class Vector4(NamedTuple):
+    x: float
+    y: float
+    z: float
+    w: float
+
+
+class Vector4i(NamedTuple):
+    x: int
+    y: int
+    z: int
+    w: int
+
+
+class Plane(NamedTuple):
+    x: float
+    y: float
+    z: float
+    d: float
+
+
+class Quaternion(NamedTuple):
+    x: float
+    y: float
+    z: float
+    w: float
+
+
+class Color(NamedTuple):
+    r: float
+    g: float
+    b: float
+    a: float = 1.0
+
+
+class Transform2D(NamedTuple):
+    """Columns x, y and origin, flattened."""
+    xx: float
+    xy: float
+    yx: float
+    yy: float
+    ox: float
+    oy: float
+
+
+class AABB(NamedTuple):
+    x: float
+    y: float
+    z: float
+    width: float
+    height: float
+    depth: float
+
+
+class Basis(NamedTuple):
+    """Rows, flattened."""
+    xx: float
+    xy: float
+    xz: float
+    yx: float
+    yy: float
+    yz: float
+    zx: float
+    zy: float
+    zz: float
+
+
+class Transform3D(NamedTuple):
+    """Basis rows then origin, flattened."""
+    xx: float
+    xy: float
+    xz: float
+    yx: float
+    yy: float
+    yz: float
+    zx: float
+    zy: float
+    zz: float
+    ox: float
+    oy: float
+    oz: float
+
+
+class Projection(NamedTuple):
+    """Four column Vector4s, flattened."""
+    xx: float
+    xy: float
+    xz: float
+    xw: float
+    yx: float
+    yy: float
+    yz: float
+    yw: float
+    zx: float
+    zy: float
+    zz: float
+    zw: float
+    wx: float
+    wy: float
+    wz: float
+    ww: float
+
+
+class StringName(str):
+    pass
+
+
+class NodePath(str):
+    pass
+
+
+class RID(int):
+    pass
+
+
+class ObjectID(int):
+    """An Object encoded as its instance id (EncodedObjectAsID)."""
+
+
+class Signal(NamedTuple):
+    name: str
+    object_id: int
+
+
+@dataclass
+class GodotObject:
+    """An Object encoded with full_objects: its class and stored properties."""
+    class_name: str
+    properties: dict = field(default_factory=dict)
+
+
+class PackedInt32Array(list):
+    pass
+
+
+class PackedInt64Array(list):
+    pass
+
+
+class PackedFloat32Array(list):
+    pass
+
+
+class PackedFloat64Array(list):
+    pass
+
+
+class PackedStringArray(list):
+    pass
+
+
+class PackedVector2Array(list):
+    pass
+
+
+class PackedVector3Array(list):
+    pass
+
+
+class PackedColorArray(list):
+    pass
+
+
+class PackedVector4Array(list):
+    pass
+
+
+# Fixed-size math types: Variant type -> (Python type, component kind), where
+# "real" is real_t (float, or double with FLAG_64), "f32" always float and
+# "i32" int
+STRUCT_TYPES = {
+    VECTOR2: (Vector2, "real"),
+    VECTOR2I: (Vector2i, "i32"),
+    RECT2: (Rect2, "real"),
+    RECT2I: (Rect2i, "i32"),
+    VECTOR3: (Vector3, "real"),
+    VECTOR3I: (Vector3i, "i32"),
+    TRANSFORM2D: (Transform2D, "real"),
+    VECTOR4: (Vector4, "real"),
+    VECTOR4I: (Vector4i, "i32"),
+    PLANE: (Plane, "real"),
+    QUATERNION: (Quaternion, "real"),
+    AABB_TYPE: (AABB, "real"),
+    BASIS: (Basis, "real"),
+    TRANSFORM3D: (Transform3D, "real"),
+    PROJECTION: (Projection, "real"),
+    COLOR: (Color, "f32"),
+}
+
+# Packed arrays of numbers or math types: Variant type -> (Python type,
+# element struct type or None, component kind)
+PACKED_TYPES = {
+    PACKED_INT32_ARRAY: (PackedInt32Array, None, "i32"),
+    PACKED_INT64_ARRAY: (PackedInt64Array, None, "i64"),
+    PACKED_FLOAT32_ARRAY: (PackedFloat32Array, None, "f32"),
+    PACKED_FLOAT64_ARRAY: (PackedFloat64Array, None, "f64"),
+    PACKED_VECTOR2_ARRAY: (PackedVector2Array, Vector2, "real"),
+    PACKED_VECTOR3_ARRAY: (PackedVector3Array, Vector3, "real"),
+    PACKED_COLOR_ARRAY: (PackedColorArray, Color, "f32"),
+    PACKED_VECTOR4_ARRAY: (PackedVector4Array, Vector4, "real"),
+}
+
+_TYPE_OF = {cls: variant_type for variant_type, (cls, _) in STRUCT_TYPES.items()}
+_TYPE_OF.update({cls: variant_type for variant_type, (cls, _, _) in PACKED_TYPES.items()})
+
+_COMPONENT = {"i32": ("i", 4), "i64": ("q", 8), "f32": ("f", 4), "f64": ("d", 8)}
+
+
+def _pad(length: int) -> int:
+    return -length % 4
+
+
+# ============================================
+# Decoding
+# ============================================
+
+class _Decoder:
+    def __init__(self, data: bytes, allow_objects: bool):
+        self.data = memoryview(data)
+        self.pos = 0
+        self.allow_objects = allow_objects
+
+    def _take(self, size: int) -> int:
+        start = self.pos
+        if start + size > len(self.data):
+            raise ValueError(f"Truncated Variant data at byte {start} (need {size})")
+        self.pos = start + size
+        return start
+
+    def u32(self) -> int:
+        return _U32.unpack_from(self.data, self._take(4))[0]
+
+    def string(self) -> str:
+        length = self.u32()
+        start = self._take(length + _pad(length))
+        return str(self.data[start:start + length], "utf-8")
+
+    def components(self, kind: str, count: int, flags: int) -> tuple:
+        if kind == "real":
+            kind = "f64" if flags & FLAG_64 else "f32"
+        code, size = _COMPONENT[kind]
+        start = self._take(size * count)
+        return struct.unpack_from(f"<{count}{code}", self.data, start)
+
+    def container_type(self, kind: int) -> None:
+        """Skip a typed Array/Dictionary element type (values decode untyped)."""
+        if kind == CONTAINER_BUILTIN:
+            self._take(4)
+        elif kind in (CONTAINER_CLASS_NAME, CONTAINER_SCRIPT):
+            self.string()
+
+    def value(self, depth: int = 0) -> Any:
+        if depth > MAX_DEPTH:
+            raise ValueError("Variant nesting too deep")
+        header = self.u32()
+        variant_type = header & HEADER_TYPE_MASK
+        flags = header & ~HEADER_TYPE_MASK
+
+        if variant_type == NIL:
+            return None
+        if variant_type == BOOL:
+            return self.u32() != 0
+        if variant_type == INT:
+            if flags & FLAG_64:
+                return _I64.unpack_from(self.data, self._take(8))[0]
+            return _I32.unpack_from(self.data, self._take(4))[0]
+        if variant_type == FLOAT:
+            if flags & FLAG_64:
+                return _F64.unpack_from(self.data, self._take(8))[0]
+            return _F32.unpack_from(self.data, self._take(4))[0]
+        if variant_type == STRING:
+            return self.string()
+        if variant_type in STRUCT_TYPES:
+            cls, kind = STRUCT_TYPES[variant_type]
+            return cls(*self.components(kind, len(cls._fields), flags))
+        if variant_type == STRING_NAME:
+            return StringName(self.string())
+        if variant_type == NODE_PATH:
+            return self.node_path()
+        if variant_type == RID_TYPE:
+            return RID(_U64.unpack_from(self.data, self._take(8))[0])
+        if variant_type == OBJECT:
+            return self.object(flags, depth)
+        if variant_type == CALLABLE:
+            return None  # Callables are not serialized
+        if variant_type == SIGNAL:
+            name = self.string()
+            return Signal(name, _U64.unpack_from(self.data, self._take(8))[0])
+        if variant_type == DICTIONARY:
+            self.container_type((flags >> TYPED_KEY_SHIFT) & 3)
+            self.container_type((flags >> TYPED_VALUE_SHIFT) & 3)
+            count = self.u32() & 0x7FFFFFFF
+            result = {}
+            for _ in range(count):
+                key = self.value(depth + 1)
+                result[key] = self.value(depth + 1)
+            return result
+        if variant_type == ARRAY:
+            self.container_type((flags >> TYPED_ARRAY_SHIFT) & 3)
+            count = self.u32() & 0x7FFFFFFF
+            return [self.value(depth + 1) for _ in range(count)]
+        if variant_type == PACKED_BYTE_ARRAY:
+            length = self.u32()
+            start = self._take(length + _pad(length))
+            return bytes(self.data[start:start + length])
+        if variant_type == PACKED_STRING_ARRAY:
+            return PackedStringArray(self.string() for _ in range(self.u32()))
+        if variant_type in PACKED_TYPES:
+            cls, element, kind = PACKED_TYPES[variant_type]
+            count = self.u32()
+            if element is None:
+                return cls(self.components(kind, count, flags))
+            width = len(element._fields)
+            values = self.components(kind, count * width, flags)
+            return cls(element(*values[i:i + width]) for i in range(0, len(values), width))
+        raise ValueError(f"Unknown Variant type {variant_type} at byte {self.pos - 4}")
+
+    def node_path(self) -> NodePath:
+        names = self.u32()
+        if not names & 0x80000000:
+            raise ValueError("Old-format NodePath is not supported")
+        names &= 0x7FFFFFFF
+        subnames = self.u32()
+        np_flags = self.u32()
+        if np_flags & 2:  # Old format: property stored as an extra subname
+            subnames += 1
+        parts = [self.string() for _ in range(names + subnames)]
+        path = "/".join(parts[:names])
+        if np_flags & 1:
+            path = "/" + path
+        return NodePath(path + "".join(":" + part for part in parts[names:]))
+
+    def object(self, flags: int, depth: int) -> Any:
+        if flags & FLAG_OBJECT_AS_ID:
+            object_id = _U64.unpack_from(self.data, self._take(8))[0]
+            return ObjectID(object_id) if object_id else None
+        if not self.allow_objects:
+            raise ValueError("Encoded Object found but allow_objects is false")
+        class_name = self.string()
+        if not class_name:
+            return None
+        properties = {}
+        for _ in range(self.u32()):
+            name = self.string()
+            properties[name] = self.value(depth + 1)
+        return GodotObject(class_name, properties)
+
+
+def decode(data: bytes, allow_objects: bool = False) -> Any:
+    """bytes_to_var() (allow_objects=True: bytes_to_var_with_objects())."""
+    return _Decoder(data, allow_objects).value()
+
+
+def get_var(stream: BinaryIO, allow_objects: bool = False) -> Any:
+    """FileAccess.get_var(): a 32-bit length, then that many bytes of Variant."""
+    header = stream.read(4)
+    if len(header) < 4:
+        raise EOFError("No Variant left in stream")
+    length = _U32.unpack(header)[0]
+    data = stream.read(length)
+    if len(data) < length:
+        raise ValueError(f"Truncated Variant: expected {length} bytes, got {len(data)}")
+    return decode(data, allow_objects)
+
+
+# ============================================
+# Encoding
+# ============================================
+
+class _Encoder:
+    def __init__(self, full_objects: bool):
+        self.parts: list[bytes] = []
+        self.full_objects = full_objects
+
+    def u32(self, value: int) -> None:
+        self.parts.append(_U32.pack(value))
+
+    def string(self, text: str) -> None:
+        raw = text.encode("utf-8")
+        self.parts.append(_U32.pack(len(raw)) + raw + b"\0" * _pad(len(raw)))
+
+    def components(self, kind: str, values) -> None:
+        if kind == "real":
+            kind = "f32"
+        code, _ = _COMPONENT[kind]
+        self.parts.append(struct.pack(f"<{len(values)}{code}", *values))
+
+    def value(self, value: Any, depth: int = 0) -> None:
+        if depth > MAX_DEPTH:
+            raise ValueError("Variant nesting too deep")
+
+        variant_type = _TYPE_OF.get(type(value))
+        if variant_type in STRUCT_TYPES:
+            self.u32(variant_type)
+            self.components(STRUCT_TYPES[variant_type][1], value)
+        elif variant_type in PACKED_TYPES:
+            _, element, kind = PACKED_TYPES[variant_type]
+            self.u32(variant_type)
+            self.u32(len(value))
+            self.components(kind, [c for item in value for c in item] if element else value)
+        elif value is None:
+            self.u32(NIL)
+        elif isinstance(value, bool):
+            self.u32(BOOL)
+            self.u32(int(value))
+        elif isinstance(value, (ObjectID, RID)):
+            self.u32(OBJECT | FLAG_OBJECT_AS_ID if isinstance(value, ObjectID) else RID_TYPE)
+            self.parts.append(_U64.pack(value))
+        elif isinstance(value, int):
+            if -2**31 <= value < 2**31:
+                self.u32(INT)
+                self.parts.append(_I32.pack(value))
+            else:
+                self.u32(INT | FLAG_64)
+                self.parts.append(_I64.pack(value))
+        elif isinstance(value, float):
+            if _F32.unpack(_F32.pack(value))[0] == value:
+                self.u32(FLOAT)
+                self.parts.append(_F32.pack(value))
+            else:
+                self.u32(FLOAT | FLAG_64)
+                self.parts.append(_F64.pack(value))
+        elif isinstance(value, StringName):
+            self.u32(STRING_NAME)
+            self.string(value)
+        elif isinstance(value, NodePath):
+            self.node_path(value)
+        elif isinstance(value, str):
+            self.u32(STRING)
+            self.string(value)
+        elif isinstance(value, Signal):
+            self.u32(SIGNAL)
+            self.string(value.name)
+            self.parts.append(_U64.pack(value.object_id))
+        elif isinstance(value, GodotObject):
+            self.object(value, depth)
+        elif isinstance(value, dict):
+            self.u32(DICTIONARY)
+            self.u32(len(value))
+            for key, item in value.items():
+                self.value(key, depth + 1)
+                self.value(item, depth + 1)
+        elif isinstance(value, PackedStringArray):
+            self.u32(PACKED_STRING_ARRAY)
+            self.u32(len(value))
+            for text in value:
+                self.string(text)
+        elif isinstance(value, (list, tuple)):
+            self.u32(ARRAY)
+            self.u32(len(value))
+            for item in value:
+                self.value(item, depth + 1)
+        elif isinstance(value, (bytes, bytearray)):
+            self.u32(PACKED_BYTE_ARRAY)
+            self.u32(len(value))
+            self.parts.append(bytes(value) + b"\0" * _pad(len(value)))
+        else:
+            raise TypeError(f"Cannot encode {type(value).__name__} as a Variant")
+
+    def node_path(self, path: str) -> None:
+        absolute = path.startswith("/")
+        names, _, subnames = path.lstrip("/").partition(":")
+        name_parts = names.split("/") if names else []
+        subname_parts = subnames.split(":") if subnames else []
+        self.u32(NODE_PATH)
+        self.u32(len(name_parts) | 0x80000000)
+        self.u32(len(subname_parts))
+        self.u32(1 if absolute else 0)
+        for part in name_parts + subname_parts:
+            self.string(part)
+
+    def object(self, obj: GodotObject, depth: int) -> None:
+        if not self.full_objects:
+            raise ValueError("Encoding a full Object requires full_objects=True")
+        self.u32(OBJECT)
+        self.string(obj.class_name)
+        self.u32(len(obj.properties))
+        for name, item in obj.properties.items():
+            self.string(name)
+            self.value(item, depth + 1)
+
+
+def encode(value: Any, full_objects: bool = False) -> bytes:
+    """var_to_bytes() (full_objects=True: var_to_bytes_with_objects())."""
+    encoder = _Encoder(full_objects)
+    encoder.value(value)
+    return b"".join(encoder.parts)
+
+
+def store_var(stream: BinaryIO, value: Any, full_objects: bool = False) -> int:
+    """FileAccess.store_var(); returns the bytes written."""
+    data = encode(value, full_objects)
+    stream.write(_U32.pack(len(data)))
+    stream.write(data)
+    return len(data) + 4
@@ -0,0 +1,174 @@
+"""
+Array-backed image analysis shared by the validators.
+
+Each image is loaded once as a read-only (height, width, 4) uint8 RGBA array
+and every metric is computed with vectorized NumPy operations instead of
+per-pixel Python loops. Masks are boolean (height, width) arrays indexed
+[y, x], so a validator picks its own opacity rule (alpha > 128 for "opaque
+enough", alpha > 0 for "not fully transparent") and reuses it everywhere.
+
+Usage:
+    from image_analysis import load_rgba, alpha_mask, bounding_box
+
+    rgba = load_rgba(COMPONENTS_DIR / "pickaxe.png")
+    opaque = alpha_mask(rgba)
+    print(bounding_box(opaque))
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+from PIL import Image
+
+# Luminance weights (ITU-R BT.601), as used by every validator
+LUMA_WEIGHTS = (0.299, 0.587, 0.114)
+
+# Alpha above this counts as opaque for most quality metrics
+OPAQUE_THRESHOLD = 128
+
+ImageLike = Union[Image.Image, np.ndarray, str, Path]
+
+
+@lru_cache(maxsize=64)
+def _load_cached(path: str, mtime_ns: int, size: int) -> np.ndarray:
+    with Image.open(path) as img:
+        arr = np.array(img.convert("RGBA"))
+    arr.setflags(write=False)
+    return arr
+
+
+def load_rgba(path: Union[str, Path]) -> np.ndarray:
+    """Load an image file as a read-only RGBA array.
+
+    Results are cached per file and invalidated when the file changes, so
+    validators that look at the same image share a single decode.
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    return _load_cached(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def as_rgba(image: ImageLike) -> np.ndarray:
+    """Return an RGBA array for a PIL image, an array or an image path."""
+    if isinstance(image, np.ndarray):
+        return image
+    if isinstance(image, (str, Path)):
+        return load_rgba(image)
+    if image.mode != "RGBA":
+        image = image.convert("RGBA")
+    return np.asarray(image)
+
+
+def alpha_mask(rgba: np.ndarray, threshold: int = OPAQUE_THRESHOLD) -> np.ndarray:
+    """Pixels whose alpha is above threshold."""
+    return rgba[..., 3] > threshold
+
+
+def bounding_box(mask: np.ndarray) -> Optional[tuple[int, int, int, int]]:
+    """Inclusive (min_x, min_y, max_x, max_y) of a mask, or None if it is empty."""
+    cols = np.flatnonzero(mask.any(axis=0))
+    if cols.size == 0:
+        return None
+    rows = np.flatnonzero(mask.any(axis=1))
+    return int(cols[0]), int(rows[0]), int(cols[-1]), int(rows[-1])
+
+
+def centroid(mask: np.ndarray) -> Optional[tuple[float, float]]:
+    """(x, y) mean position of the set pixels in a mask, or None if it is empty."""
+    total = int(mask.sum())
+    if total == 0:
+        return None
+    cols = mask.sum(axis=0)
+    rows = mask.sum(axis=1)
+    return (
+        float(cols @ np.arange(cols.size)) / total,
+        float(rows @ np.arange(rows.size)) / total,
+    )
+
+
+def column_spans(mask: np.ndarray) -> np.ndarray:
+    """Per-column distance between the topmost and bottommost set pixel.
+
+    Empty columns and columns with a single set row both have span 0.
+    """
+    height = mask.shape[0]
+    filled = mask.any(axis=0)
+    top = mask.argmax(axis=0)
+    bottom = height - 1 - mask[::-1].argmax(axis=0)
+    return np.where(filled, bottom - top, 0)
+
+
+def row_span(mask: np.ndarray) -> Optional[tuple[int, int]]:
+    """(min_y, max_y) of the set pixels in a mask, or None if it is empty."""
+    rows = np.flatnonzero(mask.any(axis=1))
+    if rows.size == 0:
+        return None
+    return int(rows[0]), int(rows[-1])
+
+
+def boundary_mask(mask: np.ndarray) -> np.ndarray:
+    """Set pixels with an unset 4-neighbour or on the image edge."""
+    padded = np.pad(mask, 1, constant_values=False)
+    interior = (
+        padded[:-2, 1:-1] & padded[2:, 1:-1] &
+        padded[1:-1, :-2] & padded[1:-1, 2:]
+    )
+    return mask & ~interior
+
+
+def quantize(rgb: np.ndarray, step: int) -> np.ndarray:
+    """Snap channel values down to multiples of step (merges near-duplicates)."""
+    return rgb // step * step
+
+
+def _pack_rgb(rgb: np.ndarray) -> np.ndarray:
+    rgb = rgb.astype(np.uint32)
+    return (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+
+
+def color_counts(rgba: np.ndarray, mask: np.ndarray, step: int = 1) -> dict[tuple[int, int, int], int]:
+    """Pixel count of each (optionally quantized) RGB colour under a mask."""
+    rgb = rgba[..., :3][mask]
+    if step > 1:
+        rgb = quantize(rgb, step)
+    packed, counts = np.unique(_pack_rgb(rgb), return_counts=True)
+    return {
+        (int(p >> 16), int((p >> 8) & 0xFF), int(p & 0xFF)): int(n)
+        for p, n in zip(packed, counts)
+    }
+
+
+def unique_color_count(rgba: np.ndarray, mask: np.ndarray, step: int = 1) -> int:
+    """Number of distinct (optionally quantized) RGB colours under a mask."""
+    rgb = rgba[..., :3][mask]
+    if step > 1:
+        rgb = quantize(rgb, step)
+    return int(np.unique(_pack_rgb(rgb)).size)
+
+
+def luminance(rgba: np.ndarray) -> np.ndarray:
+    """Per-pixel luminance as float64."""
+    rgb = rgba[..., :3].astype(np.float64)
+    r_w, g_w, b_w = LUMA_WEIGHTS
+    return r_w * rgb[..., 0] + g_w * rgb[..., 1] + b_w * rgb[..., 2]
+
+
+def luminance_histogram(rgba: np.ndarray, mask: np.ndarray, bins: int = 256) -> np.ndarray:
+    """Histogram of luminance over the masked pixels, spanning 0-255."""
+    counts, _ = np.histogram(luminance(rgba)[mask], bins=bins, range=(0.0, 255.0))
+    return counts
+
+
+def changed_fraction(a: np.ndarray, b: np.ndarray) -> float:
+    """Fraction of pixels that differ between two same-sized RGBA frames.
+
+    Only pixels that are visible (alpha > 0) in either frame are counted.
+    """
+    visible = (a[..., 3] > 0) | (b[..., 3] > 0)
+    total = int(visible.sum())
+    if total == 0:
+        return 0
+    changed = (a != b).any(axis=-1) & visible
+    return int(changed.sum()) / total
@@ -12,7 +12,14 @@ Key changes:
 
 from PIL import Image, ImageDraw
 from pathlib import Path
+from collections import OrderedDict
+import hashlib
 import math
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent))
+from build_graph import Target
+from indexed_png import save_png
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 SPRITES_DIR = PROJECT_ROOT / "resources" / "sprites"
@@ -320,49 +327,121 @@ def create_pickaxe_component() -> Image.Image:
     return img
 
 
+ROTATION_CACHE_SIZE = 256
+
+
+class _RotationCache:
+    """Rotated sprites keyed by (image digest, angle, pivot), least recently used first out.
+
+    Held on an instance so build fingerprints see this code, not the entries.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, key):
+        if key not in self._entries:
+            return None
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def put(self, key, value):
+        self._entries[key] = value
+        if len(self._entries) > self.size:
+            self._entries.popitem(last=False)
+
+
+_rotations = _RotationCache(ROTATION_CACHE_SIZE)
+
+
+def _fixed(v: float) -> int:
+    """16.16 fixed point, rounded like PIL's affine transform."""
+    v = v * 65536.0 + 0.5
+    return int(math.floor(v)) if v < 0 else int(v)
+
+
 def rotate_around_pivot(img: Image.Image, angle: float, pivot: tuple) -> tuple:
     """
     Rotate image around a pivot point and return rotated image + new pivot position.
 
-    Returns: (rotated_image, new_pivot_in_rotated)
-    """
-    # Create a larger canvas to avoid clipping
-    max_dim = int(math.sqrt(img.width**2 + img.height**2)) + 10
-    canvas_size = (max_dim * 2, max_dim * 2)
+    The rotated image is cropped to its opaque pixels and the pivot is given
+    relative to it, so it can be pasted straight onto a frame at
+    (target_x - pivot_x, target_y - pivot_y). Results are cached; don't
+    modify the returned image.
 
-    # Place original image at center of large canvas
-    canvas = Image.new('RGBA', canvas_size, COLORS["transparent"])
-    offset_x = (canvas_size[0] - img.width) // 2
-    offset_y = (canvas_size[1] - img.height) // 2
-    canvas.paste(img, (offset_x, offset_y), img)
+    Sampling matches Image.rotate(NEAREST) of the image centered on a padded
+    canvas, but only the pixels inside the rotated bounds are computed.
 
-    # Pivot position in canvas coordinates
-    canvas_pivot_x = offset_x + pivot[0]
-    canvas_pivot_y = offset_y + pivot[1]
+    Returns: (rotated_image, new_pivot_in_rotated)
+    """
+    key = (hashlib.sha256(img.tobytes()).hexdigest(), img.mode, img.size, angle, tuple(pivot))
+    cached = _rotations.get(key)
+    if cached is not None:
+        return cached
 
-    # Rotate around center of canvas
-    canvas_center = (canvas_size[0] // 2, canvas_size[1] // 2)
-    rotated = canvas.rotate(angle, resample=Image.Resampling.NEAREST,
-                            center=canvas_center, expand=False)
+    # Padded canvas the rotation is defined on (never allocated)
+    max_dim = int(math.sqrt(img.width**2 + img.height**2)) + 10
+    canvas_size = max_dim * 2
+    offset_x = (canvas_size - img.width) // 2
+    offset_y = (canvas_size - img.height) // 2
+    center = canvas_size // 2
 
-    # Calculate where the pivot point moved to after rotation
+    # Output -> input matrix, built as Image.rotate builds it
     angle_rad = math.radians(angle)
+    inv_rad = -math.radians(angle % 360.0)
+    a, b = round(math.cos(inv_rad), 15), round(math.sin(inv_rad), 15)
+    d, e = round(-math.sin(inv_rad), 15), round(math.cos(inv_rad), 15)
+    c = a * -center + b * -center + center
+    f = d * -center + e * -center + center
+
+    # Canvas region covered by the rotated image (corners, plus a rounding margin)
     cos_a = math.cos(angle_rad)
     sin_a = math.sin(angle_rad)
+    corners = [
+        (center + (x - center) * cos_a + (y - center) * sin_a,
+         center - (x - center) * sin_a + (y - center) * cos_a)
+        for x in (offset_x, offset_x + img.width)
+        for y in (offset_y, offset_y + img.height)
+    ]
+    x0 = max(0, int(math.floor(min(x for x, _ in corners))) - 2)
+    y0 = max(0, int(math.floor(min(y for _, y in corners))) - 2)
+    x1 = min(canvas_size, int(math.ceil(max(x for x, _ in corners))) + 2)
+    y1 = min(canvas_size, int(math.ceil(max(y for _, y in corners))) + 2)
+
+    # Sample just that region. PIL steps through the source in 16.16 fixed
+    # point from FIX(c + a/2 + b/2), so the translated offsets are chosen to
+    # land on the same fixed-point origin the full canvas would use.
+    origin_x = _fixed(c + a * 0.5 + b * 0.5) + x0 * _fixed(a) + y0 * _fixed(b) - (offset_x << 16)
+    origin_y = _fixed(f + d * 0.5 + e * 0.5) + x0 * _fixed(d) + y0 * _fixed(e) - (offset_y << 16)
+    matrix = (
+        a, b, origin_x / 65536.0 - a * 0.5 - b * 0.5,
+        d, e, origin_y / 65536.0 - d * 0.5 - e * 0.5,
+    )
+    source = Image.new('RGBA', img.size, COLORS["transparent"])
+    source.paste(img, (0, 0), img)
+    rotated = source.transform((x1 - x0, y1 - y0), Image.Transform.AFFINE, matrix,
+                               resample=Image.Resampling.NEAREST)
 
     # Vector from canvas center to pivot
-    dx = canvas_pivot_x - canvas_center[0]
-    dy = canvas_pivot_y - canvas_center[1]
+    dx = offset_x + pivot[0] - center
+    dy = offset_y + pivot[1] - center
 
     # Rotated vector (note: PIL rotates counter-clockwise for positive angles)
     new_dx = dx * cos_a + dy * sin_a
     new_dy = -dx * sin_a + dy * cos_a
+    new_pivot_x = int(center + new_dx)
+    new_pivot_y = int(center + new_dy)
 
-    # New pivot position
-    new_pivot_x = canvas_center[0] + new_dx
-    new_pivot_y = canvas_center[1] + new_dy
+    # Crop to the opaque pixels, keeping the pivot relative to the crop
+    bbox = rotated.getbbox() or (0, 0, 1, 1)
+    result = (
+        rotated.crop(bbox),
+        (new_pivot_x - x0 - bbox[0], new_pivot_y - y0 - bbox[1]),
+    )
 
-    return rotated, (int(new_pivot_x), int(new_pivot_y))
+    _rotations.put(key, result)
+    return result
 
 
 def assemble_frame(
@@ -446,33 +525,36 @@ SWING_POSES = [
 ]
 
 
-def generate_components():
-    """Generate and save all components."""
+def save_component(create, filename: str) -> Image.Image:
+    """Render a component with its create_* function and save it."""
     COMPONENTS_DIR.mkdir(parents=True, exist_ok=True)
+    img = create()
+    save_png(img, COMPONENTS_DIR / filename)
+    print(f"  Saved: {filename} ({img.size})")
+    return img
 
-    print("Generating V4 components...")
 
-    body = create_body_component()
-    body.save(COMPONENTS_DIR / "body.png")
-    print(f"  Saved: body.png ({body.size})")
+# Component files in build_sprite_sheet argument order
+SHEET_COMPONENTS = ("body.png", "head.png", "arm.png", "left_arm.png", "pickaxe.png")
 
-    head = create_head_component()
-    head.save(COMPONENTS_DIR / "head.png")
-    print(f"  Saved: head.png ({head.size})")
+# Component builders (kept apart from SHEET_COMPONENTS so the sheet's build
+# fingerprint covers the component files, not the code that draws them)
+COMPONENTS = [
+    ("body.png", create_body_component),
+    ("head.png", create_head_component),
+    ("arm.png", create_arm_component),
+    ("left_arm.png", create_left_arm_component),
+    ("pickaxe.png", create_pickaxe_component),
+]
 
-    arm = create_arm_component()
-    arm.save(COMPONENTS_DIR / "arm.png")
-    print(f"  Saved: arm.png ({arm.size})")
+SHEET_PATH = OUTPUT_DIR / "miner_swing_composable.png"
 
-    left_arm = create_left_arm_component()
-    left_arm.save(COMPONENTS_DIR / "left_arm.png")
-    print(f"  Saved: left_arm.png ({left_arm.size})")
 
-    pickaxe = create_pickaxe_component()
-    pickaxe.save(COMPONENTS_DIR / "pickaxe.png")
-    print(f"  Saved: pickaxe.png ({pickaxe.size})")
+def generate_components():
+    """Generate and save all components."""
+    print("Generating V4 components...")
 
-    return body, head, arm, left_arm, pickaxe
+    return tuple(save_component(create, filename) for filename, create in COMPONENTS)
 
 
 def build_sprite_sheet(body, head, arm, left_arm, pickaxe) -> Image.Image:
@@ -499,11 +581,45 @@ def build_sprite_sheet(body, head, arm, left_arm, pickaxe) -> Image.Image:
         )
 
         sheet.paste(frame, (i * FRAME_WIDTH, 0), frame)
-        frame.save(COMPONENTS_DIR / f"frame_{i:02d}_{pose['name']}.png")
+        save_png(frame, COMPONENTS_DIR / f"frame_{i:02d}_{pose['name']}.png")
 
     return sheet
 
 
+def assemble_sheet_from_files():
+    """Rebuild the frames and sprite sheet from the saved component PNGs."""
+    components = [
+        Image.open(COMPONENTS_DIR / filename).convert('RGBA')
+        for filename in SHEET_COMPONENTS
+    ]
+    sheet = build_sprite_sheet(*components)
+    save_png(sheet, SHEET_PATH)
+
+
+def build_targets() -> list[Target]:
+    """Build graph targets: one per component, then frames + sheet."""
+    targets = [
+        Target(
+            name=f"sprite:{Path(filename).stem}",
+            action=save_component,
+            args=(create, filename),
+            outputs=[COMPONENTS_DIR / filename],
+        )
+        for filename, create in COMPONENTS
+    ]
+    targets.append(Target(
+        name="sprite:sheet",
+        action=assemble_sheet_from_files,
+        inputs=[COMPONENTS_DIR / filename for filename in SHEET_COMPONENTS],
+        outputs=[SHEET_PATH] + [
+            COMPONENTS_DIR / f"frame_{i:02d}_{pose['name']}.png"
+            for i, pose in enumerate(SWING_POSES)
+        ],
+        deps=[target.name for target in targets],
+    ))
+    return targets
+
+
 def main():
     print("=" * 60)
     print("IMPROVED COMPOSABLE SPRITE BUILDER - V4")
@@ -513,8 +629,8 @@ def main():
     body, head, arm, left_arm, pickaxe = generate_components()
     sheet = build_sprite_sheet(body, head, arm, left_arm, pickaxe)
 
-    output_path = OUTPUT_DIR / "miner_swing_composable.png"
-    sheet.save(output_path)
+    output_path = SHEET_PATH
+    save_png(sheet, output_path)
 
     print(f"\n{'='*60}")
     print("BUILD COMPLETE")
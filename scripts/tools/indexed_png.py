@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Palette-indexed PNG export for generated pixel art.
+
+Generated assets use a handful of colors (the validators score 4-12 per
+sprite as ideal) but were saved as 32-bit RGBA. save_png() writes an
+image as an indexed PNG (PLTE + tRNS, 1/2/4/8-bit depending on the palette
+size) whenever that is lossless, i.e. it has at most 256 distinct RGBA
+colors, and falls back to RGBA otherwise. Fully transparent pixels count
+as one color whatever their RGB; nothing renders them.
+
+Run as a script to convert the generated assets already on disk and
+report the savings:
+
+    python3 scripts/tools/indexed_png.py            # Convert in place
+    python3 scripts/tools/indexed_png.py --check    # Only report
+    python3 scripts/tools/indexed_png.py FILE...    # Specific files
+"""
+
+from PIL import Image
+from pathlib import Path
+from typing import Optional
+import io
+import sys
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# Generator outputs (terrain atlas, item icons, buildings, miner sprites)
+GENERATED_PATTERNS = [
+    "resources/tileset/terrain_atlas.png",
+    "resources/icons/items/*.png",
+    "resources/sprites/buildings/*.png",
+    "resources/sprites/*.png",
+    "resources/sprites/components/*.png",
+    "resources/sprites/variants/*.png",
+    "resources/sprites/atlas/*.png",
+]
+
+MAX_COLORS = 256
+
+
+def _normalized(img: Image.Image) -> np.ndarray:
+    """RGBA pixels with every fully transparent pixel set to (0, 0, 0, 0)."""
+    pixels = np.array(img.convert('RGBA'))
+    pixels[pixels[..., 3] == 0] = 0
+    return pixels
+
+
+def to_indexed(img: Image.Image) -> Optional[Image.Image]:
+    """Lossless palette ('P') version of an image, or None if it has too many colors."""
+    pixels = _normalized(img)
+    packed = pixels.reshape(-1, 4).view(np.uint32).ravel()
+    colors, inverse, counts = np.unique(packed, return_inverse=True, return_counts=True)
+    if colors.size > MAX_COLORS:
+        return None
+
+    # Most common colors first, so index runs compress well
+    order = np.argsort(-counts, kind='stable')
+    rank = np.empty_like(order)
+    rank[order] = np.arange(order.size)
+    palette = colors[order].view(np.uint8).reshape(-1, 4)
+
+    indexed = Image.fromarray(rank[inverse].reshape(pixels.shape[:2]).astype(np.uint8), 'P')
+    indexed.putpalette(palette[:, :3].tobytes())
+    if (palette[:, 3] < 255).any():
+        indexed.info["transparency"] = palette[:, 3].tobytes()
+    return indexed
+
+
+def encode_png(img: Image.Image) -> bytes:
+    """Smallest lossless PNG encoding: indexed when possible, else RGBA."""
+    candidates = [img.convert('RGBA') if img.mode not in ('RGB', 'RGBA') else img]
+    indexed = to_indexed(img)
+    if indexed is not None:
+        candidates.insert(0, indexed)
+
+    best = None
+    for candidate in candidates:
+        buffer = io.BytesIO()
+        params = {"optimize": True}
+        if "transparency" in candidate.info:
+            params["transparency"] = candidate.info["transparency"]
+        candidate.save(buffer, format="PNG", **params)
+        data = buffer.getvalue()
+        if best is None or len(data) < len(best):
+            best = data
+    return best
+
+
+def save_png(img: Image.Image, path) -> int:
+    """Save an image as the smallest lossless PNG.
+
+    Returns:
+        Bytes written
+    """
+    data = encode_png(img)
+    Path(path).write_bytes(data)
+    return len(data)
+
+
+def convert_file(path: Path, write: bool = True) -> tuple:
+    """Re-encode a PNG on disk if that makes it smaller without changing pixels.
+
+    Returns:
+        (bytes before, bytes after)
+    """
+    path = Path(path)
+    before = path.stat().st_size
+    with Image.open(path) as img:
+        img.load()
+        data = encode_png(img)
+        reference = _normalized(img)
+
+    if len(data) >= before:
+        return before, before
+    with Image.open(io.BytesIO(data)) as encoded:
+        if not np.array_equal(_normalized(encoded), reference):
+            raise ValueError(f"{path}: re-encoding changed pixels")
+    if write:
+        path.write_bytes(data)
+    return before, len(data)
+
+
+def generated_files() -> list[Path]:
+    files = []
+    for pattern in GENERATED_PATTERNS:
+        files.extend(sorted(PROJECT_ROOT.glob(pattern)))
+    return files
+
+
+def main():
+    args = [Path(arg) for arg in sys.argv[1:] if not arg.startswith('--')]
+    check = '--check' in sys.argv
+    files = args or generated_files()
+
+    print("PNG export (indexed where lossless)" + (" - check only" if check else ""))
+    total_before = total_after = 0
+    for path in files:
+        before, after = convert_file(path, write=not check)
+        total_before += before
+        total_after += after
+        try:
+            name = path.resolve().relative_to(PROJECT_ROOT.resolve())
+        except ValueError:
+            name = path
+        saved = f"-{(before - after) / before:.0%}" if after < before else "unchanged"
+        print(f"  {name}: {before:,} -> {after:,} bytes ({saved})")
+
+    if total_before:
+        print(f"\nTotal: {total_before:,} -> {total_after:,} bytes "
+              f"(saved {total_before - total_after:,}, "
+              f"{(total_before - total_after) / total_before:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Streaming motion analysis for animation frames.
+
+Frames are read one at a time and only the previous and current frame are
+kept, so memory stays flat however long the animation is. Frames can come
+from individual PNGs (decoded one by one, bypassing load_rgba's cache) or
+from a sprite sheet, sliced into frame-sized views of a single decode.
+
+For each consecutive pair it reports:
+- changed: fraction of visible pixels that differ (see changed_fraction)
+- bbox_travel: largest distance any edge of the visible bounding box moved
+- velocity: (dx, dy) of the visible-pixel centroid, in pixels per frame
+
+Usage:
+    python motion_analysis.py                               # Builder frames
+    python motion_analysis.py sheet.png --frame-size 128x128
+    python motion_analysis.py frame_00.png frame_01.png ...
+
+    from motion_analysis import iter_sheet_frames, iter_motion, summarize_motion
+    summary = summarize_motion(iter_motion(iter_sheet_frames(sheet, 128)))
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+import argparse
+import math
+import sys
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).parent))
+from image_analysis import bounding_box, centroid, changed_fraction
+
+
+@dataclass
+class FrameMotion:
+    """Motion from one frame to the next."""
+    frame: int  # index of the later frame
+    changed: float
+    bbox_travel: int
+    velocity: tuple  # (dx, dy) of the centroid
+
+    @property
+    def speed(self) -> float:
+        return math.hypot(*self.velocity)
+
+
+def _decode(path: Path) -> np.ndarray:
+    with Image.open(path) as img:
+        return np.asarray(img.convert('RGBA'))
+
+
+def iter_frame_files(paths: Iterable[Path]) -> Iterator[np.ndarray]:
+    """RGBA arrays of frame images, decoded one at a time."""
+    for path in paths:
+        yield _decode(path)
+
+
+def iter_sheet_frames(sheet_path: Path, frame_width: int, frame_height: Optional[int] = None) -> Iterator[np.ndarray]:
+    """Frames of a sprite sheet, left to right then top to bottom.
+
+    frame_height defaults to the sheet height (a single-row strip).
+    """
+    sheet = _decode(sheet_path)
+    frame_height = frame_height or sheet.shape[0]
+    for y in range(0, sheet.shape[0] - frame_height + 1, frame_height):
+        for x in range(0, sheet.shape[1] - frame_width + 1, frame_width):
+            yield sheet[y:y + frame_height, x:x + frame_width]
+
+
+def iter_motion(frames: Iterable[np.ndarray]) -> Iterator[FrameMotion]:
+    """Motion between each consecutive pair of frames."""
+    previous = None
+    for index, rgba in enumerate(frames):
+        visible = rgba[..., 3] > 0
+        current = (rgba, bounding_box(visible), centroid(visible))
+        if previous is not None:
+            prev_rgba, prev_bbox, prev_centroid = previous
+            _, bbox, center = current
+
+            if bbox is None or prev_bbox is None:
+                travel = 0
+            else:
+                travel = max(abs(a - b) for a, b in zip(bbox, prev_bbox))
+
+            if center is None or prev_centroid is None:
+                velocity = (0.0, 0.0)
+            else:
+                velocity = (center[0] - prev_centroid[0], center[1] - prev_centroid[1])
+
+            yield FrameMotion(index, changed_fraction(prev_rgba, rgba), travel, velocity)
+        previous = current
+
+
+def summarize_motion(motions: Iterable[FrameMotion]) -> Optional[dict]:
+    """Aggregate motion over an animation, or None with fewer than two frames.
+
+    Uses running totals, so motions are consumed as they stream in:
+    summarize_motion(iter_motion(frames)).
+    """
+    count = 0
+    total_change = 0.0
+    min_change = math.inf
+    max_change = 0.0
+    max_travel = 0
+    total_speed = 0.0
+    max_speed = 0.0
+
+    for motion in motions:
+        count += 1
+        total_change += motion.changed
+        min_change = min(min_change, motion.changed)
+        max_change = max(max_change, motion.changed)
+        max_travel = max(max_travel, motion.bbox_travel)
+        total_speed += motion.speed
+        max_speed = max(max_speed, motion.speed)
+
+    if count == 0:
+        return None
+
+    return {
+        'pairs': count,
+        'avg_change': total_change / count,
+        'min_change': min_change,
+        'max_change': max_change,
+        'max_bbox_travel': max_travel,
+        'avg_centroid_speed': total_speed / count,
+        'max_centroid_speed': max_speed,
+    }
+
+
+def _printed(motions: Iterable[FrameMotion]) -> Iterator[FrameMotion]:
+    print(f"{'frame':>5}  {'changed':>8}  {'bbox':>5}  {'velocity':>16}")
+    for motion in motions:
+        dx, dy = motion.velocity
+        print(f"{motion.frame:>5}  {motion.changed * 100:>7.1f}%  {motion.bbox_travel:>5}  "
+              f"({dx:>6.1f}, {dy:>6.1f})")
+        yield motion
+
+
+def _frame_size(value: str) -> tuple[int, Optional[int]]:
+    """argparse type for --frame-size: WIDTH or WIDTHxHEIGHT, both positive."""
+    width, sep, height = value.partition("x")
+    try:
+        size = (int(width), int(height) if sep else None)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTH or WIDTHxHEIGHT, got {value!r}")
+    if any(n is not None and n <= 0 for n in size):
+        raise argparse.ArgumentTypeError(f"frame size must be positive, got {value!r}")
+    return size
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Streaming frame-to-frame motion analysis")
+    parser.add_argument("paths", nargs="*", type=Path,
+                        help="Frame PNGs, or one sprite sheet with --frame-size (default: builder frames)")
+    parser.add_argument("--frame-size", type=_frame_size,
+                        help="WIDTHxHEIGHT of each frame in a sprite sheet (HEIGHT defaults to the sheet's)")
+
+    args = parser.parse_args()
+
+    if args.frame_size:
+        if len(args.paths) != 1:
+            parser.error("--frame-size takes exactly one sprite sheet")
+        frames = iter_sheet_frames(args.paths[0], *args.frame_size)
+    else:
+        if not args.paths:
+            from animation_validator import frame_files
+            args.paths = frame_files()
+        frames = iter_frame_files(args.paths)
+
+    summary = summarize_motion(_printed(iter_motion(frames)))
+    if summary:
+        print()
+        print(f"Avg change: {summary['avg_change'] * 100:.1f}%  "
+              f"Max bbox travel: {summary['max_bbox_travel']}px  "
+              f"Avg centroid speed: {summary['avg_centroid_speed']:.1f}px/frame")
@@ -0,0 +1,46 @@
+"""
+Process-pool scheduler shared by the asset generators.
+
+Generators describe their work as independent jobs, e.g. one terrain tile or
+one building sprite. Each job is a tuple of arguments for a top-level
+function. run_jobs() renders the jobs across worker processes and returns
+the results in job order, so compositing stays deterministic no matter which
+worker finishes first.
+
+Jobs must seed their own randomness: a worker process does not share the
+parent's `random` state.
+
+Usage:
+    from parallel_jobs import run_jobs
+
+    tiles = run_jobs(render_tile, [(name, seed) for name, seed in layout], jobs=4)
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterable, List
+import os
+
+
+def resolve_jobs(jobs: int) -> int:
+    """Worker count for a --jobs value (0 or less = one per CPU core)."""
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def run_jobs(func: Callable[..., Any], job_args: Iterable[tuple], jobs: int = 1) -> List[Any]:
+    """Call func(*args) for every job and return the results in job order.
+
+    With jobs == 1 everything runs in this process. Otherwise the jobs are
+    spread over a process pool; func and its arguments and results must be
+    picklable (PIL images are).
+    """
+    job_args = list(job_args)
+    workers = min(resolve_jobs(jobs), len(job_args))
+
+    if workers <= 1:
+        return [func(*args) for args in job_args]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(func, *args) for args in job_args]
+        return [future.result() for future in futures]
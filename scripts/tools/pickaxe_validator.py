@@ -9,10 +9,17 @@ Validates pickaxe components for:
 - Metal vs wood color separation
 """
 
-from PIL import Image
 from pathlib import Path
 from dataclasses import dataclass
-import math
+import sys
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+from image_analysis import (
+    ImageLike, alpha_mask, as_rgba, bounding_box, column_spans, load_rgba,
+    row_span,
+)
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 COMPONENTS_DIR = PROJECT_ROOT / "resources" / "sprites" / "components"
@@ -38,7 +45,7 @@ class PickaxeScore:
         )
 
 
-def analyze_silhouette(img: Image.Image) -> float:
+def analyze_silhouette(img: ImageLike) -> float:
     """
     Analyze if the pickaxe has a clear T-shape silhouette.
 
@@ -46,59 +53,35 @@ def analyze_silhouette(img: Image.Image) -> float:
     - Horizontal handle section (narrow vertically)
     - Vertical head section at one end (extends above and below handle)
     """
-    if img.mode != 'RGBA':
-        img = img.convert('RGBA')
-
-    width, height = img.size
-    pixels = img.load()
+    rgba = as_rgba(img)
+    opaque = alpha_mask(rgba)
 
     # Find bounding box of opaque pixels
-    min_x, max_x = width, 0
-    min_y, max_y = height, 0
-
-    for y in range(height):
-        for x in range(width):
-            if pixels[x, y][3] > 128:
-                min_x = min(min_x, x)
-                max_x = max(max_x, x)
-                min_y = min(min_y, y)
-                max_y = max(max_y, y)
+    bbox = bounding_box(opaque)
+    if bbox is None:
+        return 0.0
+    min_x, min_y, max_x, max_y = bbox
 
     if max_x <= min_x or max_y <= min_y:
         return 0.0
 
     actual_width = max_x - min_x
-    actual_height = max_y - min_y
 
     # For a pickaxe, width should be > height (horizontal orientation)
     # And there should be vertical extent at the right side (head)
 
     # Check right third for vertical extent (the head area)
     head_start_x = min_x + int(actual_width * 0.6)
-
-    head_min_y, head_max_y = height, 0
-    for y in range(height):
-        for x in range(head_start_x, max_x + 1):
-            if x < width and pixels[x, y][3] > 128:
-                head_min_y = min(head_min_y, y)
-                head_max_y = max(head_max_y, y)
-
-    head_height = head_max_y - head_min_y if head_max_y > head_min_y else 0
+    head_rows = row_span(opaque[:, head_start_x:max_x + 1])
+    head_height = head_rows[1] - head_rows[0] if head_rows else 0
 
     # Check left portion for handle (should be narrower)
     handle_end_x = min_x + int(actual_width * 0.5)
 
-    handle_heights = []
-    for x in range(min_x, handle_end_x):
-        col_min_y, col_max_y = height, 0
-        for y in range(height):
-            if pixels[x, y][3] > 128:
-                col_min_y = min(col_min_y, y)
-                col_max_y = max(col_max_y, y)
-        if col_max_y > col_min_y:
-            handle_heights.append(col_max_y - col_min_y)
+    spans = column_spans(opaque[:, min_x:handle_end_x])
+    handle_heights = spans[spans > 0]
 
-    avg_handle_height = sum(handle_heights) / len(handle_heights) if handle_heights else 0
+    avg_handle_height = float(handle_heights.mean()) if handle_heights.size else 0
 
     # Good T-shape: head should be significantly taller than handle
     if avg_handle_height > 0 and head_height > 0:
@@ -114,25 +97,20 @@ def analyze_silhouette(img: Image.Image) -> float:
     return silhouette_score
 
 
-def analyze_proportions(img: Image.Image) -> float:
+def analyze_proportions(img: ImageLike) -> float:
     """Check if head is approximately 1/3 of total length.
 
     Uses relative change detection: the head is where vertical extent
     increases significantly above the handle baseline.
     """
-    if img.mode != 'RGBA':
-        img = img.convert('RGBA')
-
-    width, height = img.size
-    pixels = img.load()
+    rgba = as_rgba(img)
+    opaque = alpha_mask(rgba)
 
     # Find horizontal extent
-    min_x, max_x = width, 0
-    for y in range(height):
-        for x in range(width):
-            if pixels[x, y][3] > 128:
-                min_x = min(min_x, x)
-                max_x = max(max_x, x)
+    bbox = bounding_box(opaque)
+    if bbox is None:
+        return 0.0
+    min_x, _, max_x, _ = bbox
 
     if max_x <= min_x:
         return 0.0
@@ -140,34 +118,20 @@ def analyze_proportions(img: Image.Image) -> float:
     total_length = max_x - min_x
 
     # Calculate vertical extent for each column
-    col_extents = []
-    for x in range(min_x, max_x + 1):
-        col_min_y, col_max_y = height, 0
-        for y in range(height):
-            if pixels[x, y][3] > 128:
-                col_min_y = min(col_min_y, y)
-                col_max_y = max(col_max_y, y)
-        extent = col_max_y - col_min_y if col_max_y > col_min_y else 0
-        col_extents.append((x, extent))
-
-    if not col_extents:
-        return 0.2
+    col_extents = column_spans(opaque[:, min_x:max_x + 1])
 
     # Calculate handle baseline (average extent in left 50%)
     handle_portion = len(col_extents) // 2
-    handle_extents = [e[1] for e in col_extents[:handle_portion] if e[1] > 0]
-    if not handle_extents:
+    handle_extents = col_extents[:handle_portion]
+    handle_extents = handle_extents[handle_extents > 0]
+    if not handle_extents.size:
         return 0.2
-    handle_baseline = sum(handle_extents) / len(handle_extents)
+    handle_baseline = float(handle_extents.mean())
 
     # Find where head starts: where extent is > 1.5x handle baseline
-    head_start = max_x
     threshold = handle_baseline * 1.3  # 30% increase = head transition
-
-    for x, extent in col_extents:
-        if extent > threshold:
-            head_start = x
-            break
+    above = np.flatnonzero(col_extents > threshold)
+    head_start = min_x + int(above[0]) if above.size else max_x
 
     head_length = max_x - head_start
 
@@ -184,33 +148,25 @@ def analyze_proportions(img: Image.Image) -> float:
         return 0.2
 
 
-def analyze_color_separation(img: Image.Image) -> float:
+def analyze_color_separation(img: ImageLike) -> float:
     """Check if wood and metal colors are clearly distinct."""
-    if img.mode != 'RGBA':
-        img = img.convert('RGBA')
-
-    pixels = list(img.getdata())
-    opaque_colors = []
-
-    for p in pixels:
-        if p[3] > 128:
-            opaque_colors.append((p[0], p[1], p[2]))
+    rgba = as_rgba(img)
+    opaque_colors = rgba[..., :3][alpha_mask(rgba)].astype(np.int32)
 
     if len(opaque_colors) < 10:
         return 0.5
 
     # Group colors by hue/saturation to identify wood (warm/brown) vs metal (cool/gray)
-    warm_count = 0  # Brown/wood colors
-    cool_count = 0  # Gray/metal colors
+    r, g, b = opaque_colors[:, 0], opaque_colors[:, 1], opaque_colors[:, 2]
 
-    for r, g, b in opaque_colors:
-        # Simple heuristic: wood is warmer (more red/yellow), metal is cooler (more gray)
-        warmth = (r - b) + (g - b) * 0.5
+    # Simple heuristic: wood is warmer (more red/yellow), metal is cooler (more gray)
+    warmth = (r - b) + (g - b) * 0.5
+    warm = warmth > 20
+    gray = (np.abs(r - g) < 20) & (np.abs(g - b) < 20)
+    cool = ~warm & ((warmth < -10) | gray)
 
-        if warmth > 20:
-            warm_count += 1
-        elif warmth < -10 or (abs(r - g) < 20 and abs(g - b) < 20):
-            cool_count += 1
+    warm_count = int(warm.sum())  # Brown/wood colors
+    cool_count = int(cool.sum())  # Gray/metal colors
 
     total = warm_count + cool_count
     if total == 0:
@@ -229,38 +185,27 @@ def analyze_color_separation(img: Image.Image) -> float:
         return 0.4
 
 
-def analyze_vertical_extent(img: Image.Image) -> float:
+def analyze_vertical_extent(img: ImageLike) -> float:
     """Check if head extends above and below the handle centerline."""
-    if img.mode != 'RGBA':
-        img = img.convert('RGBA')
-
-    width, height = img.size
-    pixels = img.load()
+    rgba = as_rgba(img)
+    opaque = alpha_mask(rgba)
+    width = opaque.shape[1]
 
     # Find the handle's vertical center (left half of image)
-    left_half_y_coords = []
-    for y in range(height):
-        for x in range(width // 2):
-            if pixels[x, y][3] > 128:
-                left_half_y_coords.append(y)
+    left_half_y_coords = np.nonzero(opaque[:, :width // 2])[0]
 
-    if not left_half_y_coords:
+    if not left_half_y_coords.size:
         return 0.3
 
-    handle_center_y = sum(left_half_y_coords) / len(left_half_y_coords)
+    handle_center_y = int(left_half_y_coords.sum()) / len(left_half_y_coords)
 
     # Find head's vertical extent (right third)
     head_start_x = int(width * 0.6)
-    head_min_y, head_max_y = height, 0
-
-    for y in range(height):
-        for x in range(head_start_x, width):
-            if pixels[x, y][3] > 128:
-                head_min_y = min(head_min_y, y)
-                head_max_y = max(head_max_y, y)
+    head_rows = row_span(opaque[:, head_start_x:])
 
-    if head_max_y <= head_min_y:
+    if head_rows is None or head_rows[1] <= head_rows[0]:
         return 0.3
+    head_min_y, head_max_y = head_rows
 
     # Check if head extends both above and below handle center
     extends_above = handle_center_y - head_min_y
@@ -281,7 +226,7 @@ def validate_pickaxe(img_path: Path = None) -> PickaxeScore:
     if img_path is None:
         img_path = COMPONENTS_DIR / "pickaxe.png"
 
-    img = Image.open(img_path)
+    img = load_rgba(img_path)
 
     silhouette = analyze_silhouette(img)
     proportions = analyze_proportions(img)
@@ -9,11 +9,13 @@ Validates body part proportions for consistency and anatomical correctness:
 - Component bounds checking
 """
 
-from PIL import Image
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Optional
-import math
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent))
+from image_analysis import ImageLike, alpha_mask, as_rgba, bounding_box, load_rgba
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 COMPONENTS_DIR = PROJECT_ROOT / "resources" / "sprites" / "components"
@@ -41,12 +43,18 @@ class ProportionScore:
         )
 
 
-def get_content_dimensions(img: Image.Image) -> tuple[int, int, int, int]:
-    """Get actual content bounds (non-transparent area)."""
-    if img.mode != 'RGBA':
-        img = img.convert('RGBA')
+def content_bbox(img: ImageLike) -> Optional[tuple[int, int, int, int]]:
+    """Bounds of the non-transparent area as (x1, y1, x2, y2), exclusive like PIL's getbbox()."""
+    bbox = bounding_box(alpha_mask(as_rgba(img), threshold=0))
+    if bbox is None:
+        return None
+    min_x, min_y, max_x, max_y = bbox
+    return min_x, min_y, max_x + 1, max_y + 1
 
-    bbox = img.getbbox()
+
+def get_content_dimensions(img: ImageLike) -> tuple[int, int, int, int]:
+    """Get actual content bounds (non-transparent area)."""
+    bbox = content_bbox(img)
     if bbox is None:
         return 0, 0, 0, 0
 
@@ -56,16 +64,13 @@ def get_content_dimensions(img: Image.Image) -> tuple[int, int, int, int]:
     return width, height, x1, y1
 
 
-def measure_limb_thickness(img: Image.Image, orientation: str = "horizontal") -> float:
+def measure_limb_thickness(img: ImageLike, orientation: str = "horizontal") -> float:
     """Measure the thickness of a limb component.
 
     For horizontal arms: measures vertical extent (thickness)
     For vertical arms: measures horizontal extent (thickness)
     """
-    if img.mode != 'RGBA':
-        img = img.convert('RGBA')
-
-    bbox = img.getbbox()
+    bbox = content_bbox(img)
     if bbox is None:
         return 0
 
@@ -77,12 +82,9 @@ def measure_limb_thickness(img: Image.Image, orientation: str = "horizontal") ->
         return x2 - x1  # Horizontal extent = thickness
 
 
-def measure_limb_length(img: Image.Image, orientation: str = "horizontal") -> float:
+def measure_limb_length(img: ImageLike, orientation: str = "horizontal") -> float:
     """Measure the length of a limb component."""
-    if img.mode != 'RGBA':
-        img = img.convert('RGBA')
-
-    bbox = img.getbbox()
+    bbox = content_bbox(img)
     if bbox is None:
         return 0
 
@@ -94,16 +96,14 @@ def measure_limb_length(img: Image.Image, orientation: str = "horizontal") -> fl
         return y2 - y1  # Vertical extent = length
 
 
-def check_bounds(img: Image.Image) -> tuple[bool, str]:
+def check_bounds(img: ImageLike) -> tuple[bool, str]:
     """Check if all content is within image bounds.
 
     Returns (valid, message).
     """
-    if img.mode != 'RGBA':
-        img = img.convert('RGBA')
-
-    width, height = img.size
-    bbox = img.getbbox()
+    rgba = as_rgba(img)
+    height, width = rgba.shape[:2]
+    bbox = content_bbox(rgba)
 
     if bbox is None:
         return True, "Empty image"
@@ -125,21 +125,23 @@ def check_bounds(img: Image.Image) -> tuple[bool, str]:
     return True, "OK"
 
 
+def proportion_files(components_dir: Path = COMPONENTS_DIR) -> list[Path]:
+    """Components measured by validate_proportions: arm, left arm, body, head."""
+    return [components_dir / f"{name}.png" for name in ("arm", "left_arm", "body", "head")]
+
+
 def validate_proportions(components_dir: Path = COMPONENTS_DIR) -> ProportionScore:
     """Validate proportions of all components."""
     details = {}
 
     # Load components
-    arm_path = components_dir / "arm.png"
-    left_arm_path = components_dir / "left_arm.png"
-    body_path = components_dir / "body.png"
-    head_path = components_dir / "head.png"
+    arm_path, left_arm_path, body_path, head_path = proportion_files(components_dir)
 
     # Check bounds for all components
     bounds_issues = []
     for path in [arm_path, left_arm_path, body_path, head_path]:
         if path.exists():
-            img = Image.open(path)
+            img = load_rgba(path)
             valid, msg = check_bounds(img)
             if not valid:
                 bounds_issues.append(f"{path.stem}: {msg}")
@@ -149,8 +151,8 @@ def validate_proportions(components_dir: Path = COMPONENTS_DIR) -> ProportionSco
 
     # Measure arm proportions
     if arm_path.exists() and left_arm_path.exists():
-        arm = Image.open(arm_path)
-        left_arm = Image.open(left_arm_path)
+        arm = load_rgba(arm_path)
+        left_arm = load_rgba(left_arm_path)
 
         # Right arm is horizontal, left arm is vertical
         right_thickness = measure_limb_thickness(arm, "horizontal")
@@ -178,8 +180,8 @@ def validate_proportions(components_dir: Path = COMPONENTS_DIR) -> ProportionSco
 
     # Measure head/body ratio
     if head_path.exists() and body_path.exists():
-        head = Image.open(head_path)
-        body = Image.open(body_path)
+        head = load_rgba(head_path)
+        body = load_rgba(body_path)
 
         head_w, head_h, _, _ = get_content_dimensions(head)
         body_w, body_h, _, _ = get_content_dimensions(body)
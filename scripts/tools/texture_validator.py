@@ -12,11 +12,14 @@ Run: python3 scripts/tools/texture_validator.py [--atlas PATH]
 """
 
 import os
-from PIL import Image
+import sys
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
-from collections import Counter
-import math
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from image_analysis import ImageLike, alpha_mask, as_rgba, color_counts, load_rgba, luminance
 
 
 # Tile configuration
@@ -46,78 +49,57 @@ class ValidationResult:
     issues: List[str]
 
 
-def extract_tile(atlas: Image.Image, col: int, row: int) -> Image.Image:
+def extract_tile(atlas: ImageLike, col: int, row: int) -> np.ndarray:
     """Extract a single tile from the atlas."""
     x = col * TILE_SIZE
     y = row * TILE_SIZE
-    return atlas.crop((x, y, x + TILE_SIZE, y + TILE_SIZE))
+    region = as_rgba(atlas)[y:y + TILE_SIZE, x:x + TILE_SIZE]
+    if region.shape[:2] == (TILE_SIZE, TILE_SIZE):
+        return region
 
+    # Past the atlas edge: pad with transparent pixels, as Image.crop() does
+    tile = np.zeros((TILE_SIZE, TILE_SIZE, 4), dtype=np.uint8)
+    tile[:region.shape[0], :region.shape[1]] = region
+    return tile
 
-def analyze_colors(tile: Image.Image) -> Tuple[int, Dict[Tuple[int, int, int], float]]:
+
+def analyze_colors(tile: ImageLike) -> Tuple[int, Dict[Tuple[int, int, int], float]]:
     """Analyze color usage in a tile."""
-    pixels = list(tile.getdata())
-    total = len(pixels)
+    rgba = as_rgba(tile)
+    total = rgba.shape[0] * rgba.shape[1]
 
-    # Count colors (ignoring alpha)
-    color_counts = Counter()
-    for pixel in pixels:
-        if len(pixel) == 4 and pixel[3] == 0:  # Skip transparent
-            continue
-        rgb = pixel[:3]
-        color_counts[rgb] += 1
+    # Count colors (ignoring alpha), skipping fully transparent pixels
+    counts = color_counts(rgba, alpha_mask(rgba, threshold=0))
 
-    unique = len(color_counts)
-    distribution = {color: count / total for color, count in color_counts.items()}
+    unique = len(counts)
+    distribution = {color: count / total for color, count in counts.items()}
 
     return unique, distribution
 
 
-def calculate_edge_contrast(tile: Image.Image) -> float:
+def calculate_edge_contrast(tile: ImageLike) -> float:
     """Calculate contrast at tile edges (lower is better for seamless tiling)."""
-    width, height = tile.size
-    pixels = tile.load()
-
-    total_diff = 0
-    count = 0
-
-    # Check left-right edge contrast
-    for y in range(height):
-        left = pixels[0, y][:3]
-        right = pixels[width - 1, y][:3]
-        diff = sum(abs(left[i] - right[i]) for i in range(3)) / 3
-        total_diff += diff
-        count += 1
-
-    # Check top-bottom edge contrast
-    for x in range(width):
-        top = pixels[x, 0][:3]
-        bottom = pixels[x, height - 1][:3]
-        diff = sum(abs(top[i] - bottom[i]) for i in range(3)) / 3
-        total_diff += diff
-        count += 1
+    rgb = as_rgba(tile)[..., :3].astype(np.int32)
+
+    # Left-right and top-bottom edge contrast, averaged over channels
+    left_right = np.abs(rgb[:, 0] - rgb[:, -1]).sum(axis=1) / 3
+    top_bottom = np.abs(rgb[0, :] - rgb[-1, :]).sum(axis=1) / 3
+
+    count = left_right.size + top_bottom.size
+    total_diff = float(left_right.sum() + top_bottom.sum())
 
     return total_diff / count if count > 0 else 0
 
 
-def calculate_noise_variance(tile: Image.Image) -> float:
+def calculate_noise_variance(tile: ImageLike) -> float:
     """Calculate variance of luminance values (texture complexity)."""
-    pixels = list(tile.getdata())
-
-    luminances = []
-    for pixel in pixels:
-        if len(pixel) == 4 and pixel[3] == 0:
-            continue
-        # Calculate luminance
-        lum = 0.299 * pixel[0] + 0.587 * pixel[1] + 0.114 * pixel[2]
-        luminances.append(lum)
+    rgba = as_rgba(tile)
+    luminances = luminance(rgba)[alpha_mask(rgba, threshold=0)]
 
-    if not luminances:
+    if not luminances.size:
         return 0
 
-    mean = sum(luminances) / len(luminances)
-    variance = sum((l - mean) ** 2 for l in luminances) / len(luminances)
-
-    return math.sqrt(variance)  # Return standard deviation
+    return float(luminances.std())  # Return standard deviation
 
 
 def calculate_palette_adherence(
@@ -167,14 +149,14 @@ TILE_NAMES = {
 
 def validate_atlas(atlas_path: str) -> ValidationResult:
     """Validate the entire terrain atlas."""
-    atlas = Image.open(atlas_path).convert("RGBA")
+    atlas = load_rgba(atlas_path)
 
     metrics = []
     issues = []
     scores = []
 
     print(f"Validating terrain atlas: {atlas_path}")
-    print(f"Atlas size: {atlas.size[0]}x{atlas.size[1]}")
+    print(f"Atlas size: {atlas.shape[1]}x{atlas.shape[0]}")
     print("-" * 60)
 
     for row in range(ROWS):
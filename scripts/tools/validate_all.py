@@ -5,18 +5,24 @@ Usage:
     python validate_all.py           # Run all validations
     python validate_all.py --quick   # Quick summary only
     python validate_all.py --strict  # Fail if any metric below target
+    python validate_all.py --no-cache  # Re-score everything, ignoring cached results
+
+Results are cached in scripts/tools/.cache/ by file content and validator
+source (see validation_cache.py), so only edited assets are re-scored.
 """
 
+from dataclasses import asdict
 from pathlib import Path
 import sys
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(Path(__file__).parent))
 
-from component_validator import validate_all_components
-from pickaxe_validator import validate_pickaxe
-from animation_validator import analyze_frame_metrics, analyze_motion
-from proportions_validator import validate_proportions
+from component_validator import ComponentScore, component_files, validate_component
+from pickaxe_validator import COMPONENTS_DIR, PickaxeScore, validate_pickaxe
+from animation_validator import analyze_frame_metrics, analyze_motion, frame_files
+from proportions_validator import ProportionScore, proportion_files, validate_proportions
+from validation_cache import MISS, ResultCache
 
 
 # Quality targets
@@ -28,13 +34,38 @@ TARGETS = {
     'proportions': 0.90,
 }
 
+# Source files each validator's results depend on (part of the cache key)
+COMPONENT_SOURCES = ("component_validator.py", "image_analysis.py")
+PICKAXE_SOURCES = ("pickaxe_validator.py", "image_analysis.py")
+ANIMATION_SOURCES = ("animation_validator.py", "image_analysis.py", "motion_analysis.py")
+PROPORTION_SOURCES = ("proportions_validator.py", "image_analysis.py")
+
+
+def cached(cache, validator, inputs, sources, compute):
+    """Return compute() for these inputs, reusing a cached result if possible."""
+    if cache is None:
+        return compute()
+    result = cache.get(validator, inputs, sources)
+    if result is MISS:
+        result = compute()
+        cache.put(validator, inputs, sources, result)
+    return result
 
-def run_all_validations():
-    """Run all validations and return results."""
+
+def run_all_validations(cache: ResultCache = None):
+    """Run all validations and return results.
+
+    Pass a ResultCache to skip assets whose results are already cached.
+    """
     results = {}
     
     # Component validation
-    components = validate_all_components()
+    components = {
+        path.stem: ComponentScore(**cached(
+            cache, "component", [path], COMPONENT_SOURCES,
+            lambda: asdict(validate_component(path))))
+        for path in component_files()
+    }
     avg = sum(s.overall for s in components.values()) / len(components)
     all_coherent = all(s.color_coherence >= 0.99 for s in components.values())
     
@@ -46,23 +77,35 @@ def run_all_validations():
     }
     
     # Pickaxe validation
-    pickaxe = validate_pickaxe()
+    pickaxe_path = COMPONENTS_DIR / "pickaxe.png"
+    pickaxe = PickaxeScore(**cached(
+        cache, "pickaxe", [pickaxe_path], PICKAXE_SOURCES,
+        lambda: asdict(validate_pickaxe(pickaxe_path))))
     results['pickaxe'] = {
         'score': pickaxe.overall,
         'pass': pickaxe.overall >= TARGETS['pickaxe'],
     }
     
     # Animation validation
-    anim = analyze_frame_metrics()
-    motion = analyze_motion()
+    animation = cached(
+        cache, "animation", frame_files(), ANIMATION_SOURCES,
+        lambda: {'metrics': analyze_frame_metrics(), 'motion': analyze_motion()})
+    anim = animation['metrics']
+    motion = animation['motion']
+    # Reported here rather than by the analysis, so cached results print it too
+    if anim is None:
+        print("Not enough frames to analyze")
+    consistency = anim['overall'] if anim else 0
     results['animation'] = {
-        'consistency': anim['overall'],
+        'consistency': consistency,
         'motion': motion['motion_score'] if motion else 0,
-        'pass': anim['overall'] >= TARGETS['animation'],
+        'pass': consistency >= TARGETS['animation'],
     }
 
     # Proportions validation
-    proportions = validate_proportions()
+    proportions = ProportionScore(**cached(
+        cache, "proportions", proportion_files(), PROPORTION_SOURCES,
+        lambda: asdict(validate_proportions())))
     results['proportions'] = {
         'score': proportions.overall,
         'arm_ratio': proportions.arm_thickness_ratio,
@@ -131,7 +174,10 @@ def print_full_report(results):
 
 
 def main():
-    results = run_all_validations()
+    cache = None if '--no-cache' in sys.argv else ResultCache()
+    results = run_all_validations(cache)
+    if cache is not None:
+        cache.save()
     
     if '--quick' in sys.argv:
         print_quick_summary(results)
@@ -0,0 +1,125 @@
+"""
+Persistent result cache for validate_all.py.
+
+Results are keyed by validator name, validator version and the SHA-256 of
+every input file, so an entry is reused only while the exact same bytes are
+being scored by the exact same code. The validator version is a digest of
+the validator's source files: editing a scoring rule invalidates its results
+without a manual version bump.
+
+The cache is a single JSON file holding at most MAX_ENTRIES results. The
+least recently used entries are dropped first.
+
+Usage:
+    cache = ResultCache()
+    score = cache.get("pickaxe", [pickaxe_png], PICKAXE_SOURCES)
+    if score is MISS:
+        score = asdict(validate_pickaxe(pickaxe_png))
+        cache.put("pickaxe", [pickaxe_png], PICKAXE_SOURCES, score)
+    cache.save()
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable
+import hashlib
+import json
+import time
+
+TOOLS_DIR = Path(__file__).parent
+CACHE_FILE = TOOLS_DIR / ".cache" / "validate_all.json"
+
+# Bump when the cache file layout changes
+CACHE_FORMAT = 1
+
+# Maximum number of cached results (one per component, pickaxe, etc.)
+MAX_ENTRIES = 512
+
+# Returned by ResultCache.get() when there is no usable entry
+MISS = object()
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 of a file's contents, or "missing" if it doesn't exist."""
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return "missing"
+
+
+@lru_cache(maxsize=None)
+def source_version(*sources: str) -> str:
+    """Digest of the validator source files that produce a result."""
+    digest = hashlib.sha256()
+    for name in sorted(sources):
+        digest.update(name.encode())
+        digest.update(file_digest(TOOLS_DIR / name).encode())
+    return digest.hexdigest()[:16]
+
+
+class ResultCache:
+    """Content-addressed store of validator results (JSON-serializable values)."""
+
+    def __init__(self, path: Path = CACHE_FILE, max_entries: int = MAX_ENTRIES):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.entries: dict[str, dict] = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            data = json.loads(self.path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if data.get("format") == CACHE_FORMAT:
+            self.entries = data.get("entries", {})
+
+    def key(self, validator: str, inputs: Iterable[Path], sources: Iterable[str]) -> str:
+        """Cache key for a validator run over a set of input files."""
+        digest = hashlib.sha256()
+        digest.update(validator.encode())
+        digest.update(source_version(*sources).encode())
+        for path in inputs:
+            digest.update(Path(path).name.encode())
+            digest.update(file_digest(path).encode())
+        return digest.hexdigest()
+
+    def get(self, validator: str, inputs: Iterable[Path], sources: Iterable[str]) -> Any:
+        """Cached result, or MISS."""
+        entry = self.entries.get(self.key(validator, inputs, sources))
+        if entry is None:
+            self.misses += 1
+            return MISS
+        self.hits += 1
+        entry["used"] = time.time()
+        self._dirty = True
+        return entry["result"]
+
+    def put(self, validator: str, inputs: Iterable[Path], sources: Iterable[str], result: Any):
+        """Store a result."""
+        self.entries[self.key(validator, inputs, sources)] = {
+            "validator": validator,
+            "used": time.time(),
+            "result": result,
+        }
+        self._dirty = True
+
+    def save(self):
+        """Write the cache back to disk, dropping the least recently used
+        entries beyond max_entries."""
+        excess = len(self.entries) - self.max_entries
+        if excess > 0:
+            oldest = sorted(self.entries, key=lambda k: self.entries[k]["used"])[:excess]
+            for key in oldest:
+                del self.entries[key]
+            self._dirty = True
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"format": CACHE_FORMAT, "entries": self.entries}))
+        tmp.replace(self.path)
+        self._dirty = False
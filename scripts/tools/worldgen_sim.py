@@ -0,0 +1,707 @@
+#!/usr/bin/env python3
+"""
+Offline world-generation simulator mirroring ThreadedChunkGenerator.
+
+Reproduces ThreadedChunkGenerator.generate_chunk_data()
+(scripts/world/threaded_chunk_generator.gd) without Godot, for whole batches
+of chunks at once:
+- cave tiles from the position-hash cave noise (CAVE_* constants)
+- hardness and color per tile from the layer .tres data, including the
+  transition-zone blend and infinite depth scaling
+- ore seeds from the position-hash ore noise, rarest ore first
+- vein expansion with each vein's own position-seeded RandomNumberGenerator
+- near-ore marking around every vein block
+
+Godot's RandomNumberGenerator (PCG32, plus the randf/randi_range/randf_range
+conversions of Godot 4's RandomPCG) is reimplemented on NumPy uint64 arrays,
+and GDScript's 64-bit int wraparound and truncating % are kept, so results
+match the game tile for tile. Per-tile work is vectorized over the batch.
+Vein expansion is order-dependent within a chunk, but chunks are
+independent, so every chunk in a batch walks its own tile order in lockstep
+(see _expand_veins). One core generates about a million blocks a second.
+
+Ores and layers are read from resources/ in DataRegistry's preload order.
+The world seed only seeds the per-chunk RNG (chunk_seed()), which the
+current generator never draws from: terrain is the same for every seed.
+
+Usage:
+    python worldgen_sim.py                       # Ore density per layer
+    python worldgen_sim.py --depth 0:600 --columns 64
+    python worldgen_sim.py --parity chunks.json  # Compare exported chunks
+
+    from worldgen_sim import load_world, generate_chunks
+    batch = generate_chunks(load_world(), [(0, 1), (0, 2)])
+
+Exported chunks are ChunkGenerationResult.to_dict() results, e.g. from
+test_level.gd's test_export_chunks() (see tests/test_worldgen_parity.py).
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+import json
+import re
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+from game_data import load_game_data
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DATA_REGISTRY = PROJECT_ROOT / "scripts" / "autoload" / "data_registry.gd"
+
+# ThreadedChunkGenerator / GameManager constants
+CHUNK_SIZE = 16
+SURFACE_ROW = 7
+CAVE_MIN_DEPTH = 20
+CAVE_FREQUENCY = 0.05
+CAVE_THRESHOLD = 0.85
+CAVE_DEPTH_FACTOR = 0.001
+
+# Layer transition blend (LayerData.is_transition_zone / _get_block_color_thread)
+TRANSITION_RANGE = 10
+TRANSITION_LOOKAHEAD = 15
+TRANSITION_CHANCE = 0.4
+
+CARDINAL_DIRS = np.array([(1, 0), (-1, 0), (0, 1), (0, -1)], dtype=np.int64)
+DIAGONAL_DIRS = np.array([(1, 1), (-1, 1), (1, -1), (-1, -1)], dtype=np.int64)
+
+NO_ORE = -1
+
+# Chunks per batch (about 1M blocks; bounds memory when surveying)
+BATCH_CHUNKS = 4096
+
+_PRELOAD = re.compile(r'preload\("(res://[^"]+\.tres)"\)')
+
+
+# ============================================
+# Godot RandomNumberGenerator (RandomPCG)
+# ============================================
+
+_PCG_MULT = np.uint64(6364136223846793005)
+_PCG_INC = np.uint64((1442695040888963407 << 1 | 1) & 0xFFFFFFFFFFFFFFFF)
+_U32 = np.uint64(0xFFFFFFFF)
+
+
+def _as_u64(values) -> np.ndarray:
+    """int64 values as the uint64 bits Godot seeds with (two's complement)."""
+    return np.asarray(values, dtype=np.int64).view(np.uint64)
+
+
+def rng_seed(seeds) -> np.ndarray:
+    """PCG states after `rng.seed = seeds` (pcg32_srandom_r)."""
+    return (_PCG_INC + _as_u64(seeds)) * _PCG_MULT + _PCG_INC
+
+
+def rng_randi(state: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """randi(): (uint32 outputs as int64, next states)."""
+    xorshifted = (((state >> np.uint64(18)) ^ state) >> np.uint64(27)) & _U32
+    rot = state >> np.uint64(59)
+    out = ((xorshifted >> rot) | (xorshifted << ((np.uint64(32) - rot) & np.uint64(31)))) & _U32
+    return out.astype(np.int64), state * _PCG_MULT + _PCG_INC
+
+
+def rng_randf(state: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """randf(): float32 in [0, 1) (returned as float64, as GDScript sees it), next states."""
+    exponent_bits, after_first = rng_randi(state)
+    significand, after_second = rng_randi(after_first)
+    bit_length = np.frexp(exponent_bits.astype(np.float64))[1]
+    value = np.ldexp(
+        (significand | 0x80000001).astype(np.uint32).astype(np.float32),
+        (-32 - (32 - bit_length)).astype(np.int32),
+    )
+    zero = exponent_bits == 0
+    return (
+        np.where(zero, 0.0, value.astype(np.float64)),
+        np.where(zero, after_first, after_second),
+    )
+
+
+def rng_randf_range(value: np.ndarray, low: float, high: float) -> np.ndarray:
+    """randf_range() from the randf() it draws, in float32 (real_t) as RandomPCG::random does."""
+    low, high = np.float32(low), np.float32(high)
+    return (value.astype(np.float32) * (high - low) + low).astype(np.float64)
+
+
+def rng_randi_range(state: np.ndarray, low: np.ndarray, high: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """randi_range() per element; equal bounds return low without drawing."""
+    low = np.asarray(low, dtype=np.int64)
+    high = np.asarray(high, dtype=np.int64)
+    bound = np.abs(high - low) + 1
+    threshold = (2 ** 32 - bound) % bound
+    value = np.zeros(state.shape, dtype=np.int64)
+    pending = low != high
+    while pending.any():
+        out, advanced = rng_randi(state[pending])
+        state[pending] = advanced
+        accepted = out >= threshold[pending]
+        index = np.flatnonzero(pending)
+        value[index[accepted]] = out[accepted] % bound[pending][accepted]
+        pending[index[accepted]] = False
+    return value + np.minimum(low, high), state
+
+
+def chunk_seed(world_seed: int, chunk_x: int, chunk_y: int) -> int:
+    """Seed of a chunk's RandomNumberGenerator (64-bit wraparound, as in GDScript)."""
+    seed = (world_seed + chunk_x * 73856093 + chunk_y * 19349663) & 0xFFFFFFFFFFFFFFFF
+    return seed - (1 << 64) if seed >= 1 << 63 else seed
+
+
+# ============================================
+# Game data
+# ============================================
+
+@dataclass
+class Layer:
+    id: str
+    min_depth: int
+    max_depth: int
+    base_hardness: float
+    colors: tuple  # (primary, secondary, accent) RGBA
+    infinite_scaling: bool = False
+    hardness_per_100_depth: float = 10.0
+    max_hardness: float = 0.0
+
+
+@dataclass
+class Ore:
+    id: str
+    min_depth: int
+    max_depth: int
+    spawn_threshold: float
+    noise_frequency: float
+    vein_size_min: int
+    vein_size_max: int
+
+    def can_spawn_at_depth(self, depth: np.ndarray) -> np.ndarray:
+        ok = depth >= self.min_depth
+        if self.max_depth != -1:
+            ok &= depth <= self.max_depth
+        return ok
+
+
+@dataclass
+class World:
+    """Layers and ores as DataRegistry holds them.
+
+    ores_by_depth is DataRegistry._ores_by_depth (get_ores_at_depth order);
+    ores is the generator's spawn priority, rarest (highest spawn_threshold)
+    first. Ore indices everywhere refer to ores.
+    """
+    layers: list[Layer]
+    ores_by_depth: list[Ore]
+    ores: list[Ore] = field(init=False)
+
+    def __post_init__(self):
+        # _determine_ore_spawn_thread's sort_custom is stable for arrays this small
+        self.ores = sorted(self.ores_by_depth, key=lambda ore: -ore.spawn_threshold)
+
+    def ore_index(self, ore_id: str) -> int:
+        return next(i for i, ore in enumerate(self.ores) if ore.id == ore_id)
+
+    @property
+    def vein_reach(self) -> int:
+        """Furthest a vein can reach from its seed tile, plus one for near-ore marking."""
+        return max((ore.vein_size_max for ore in self.ores), default=1)
+
+    def layer_index(self, depth: np.ndarray) -> np.ndarray:
+        """DataRegistry.get_layer_at_depth() as indices into layers."""
+        index = np.full(np.shape(depth), len(self.layers) - 1, dtype=np.int64)
+        for i in reversed(range(len(self.layers))):
+            layer = self.layers[i]
+            index[(depth >= layer.min_depth) & (depth < layer.max_depth)] = i
+        return index
+
+
+def _registry_resources(name: str) -> list:
+    """Resources in one of DataRegistry's preload arrays, in order."""
+    text = DATA_REGISTRY.read_text()
+    block = re.search(rf'^const {name} := \[(.*?)^\]', text, re.MULTILINE | re.DOTALL)
+    data = load_game_data()
+    return [data.by_path[path] for path in _PRELOAD.findall(block.group(1))]
+
+
+def load_layers() -> list[Layer]:
+    layers = [
+        Layer(
+            id=layer.id,
+            min_depth=layer.min_depth,
+            max_depth=layer.max_depth,
+            base_hardness=float(layer.base_hardness),
+            colors=(layer.color_primary, layer.color_secondary, layer.color_accent),
+            infinite_scaling=layer.infinite_scaling,
+            hardness_per_100_depth=float(layer.hardness_per_100_depth),
+            max_hardness=float(layer.max_hardness),
+        )
+        for layer in _registry_resources("LAYER_RESOURCES")
+    ]
+    # Godot's sort_custom is stable for arrays this small
+    return sorted(layers, key=lambda layer: layer.min_depth)
+
+
+def load_ores() -> list[Ore]:
+    """Ores and gems in DataRegistry._ores_by_depth order (by min_depth)."""
+    ores = [
+        Ore(
+            id=ore.id,
+            min_depth=ore.min_depth,
+            max_depth=ore.max_depth,
+            spawn_threshold=float(ore.spawn_threshold),
+            noise_frequency=float(ore.noise_frequency),
+            vein_size_min=ore.vein_size_min,
+            vein_size_max=ore.vein_size_max,
+        )
+        for ore in _registry_resources("ORE_RESOURCES") + _registry_resources("GEM_RESOURCES")
+    ]
+    # Godot's sort_custom is stable for arrays this small
+    return sorted(ores, key=lambda ore: ore.min_depth)
+
+
+def load_world() -> World:
+    return World(load_layers(), load_ores())
+
+
+# ============================================
+# Generation
+# ============================================
+
+@dataclass
+class ChunkBatch:
+    """Generated chunks. Per-tile arrays are indexed [chunk, local_x, local_y],
+    so flattening a chunk gives the generator's tile order."""
+    chunks: np.ndarray     # (n, 2) chunk coordinates
+    tile: np.ndarray       # solid tile generated
+    cave: np.ndarray       # cave (empty) tile
+    hardness: np.ndarray   # float64, NaN where there is no tile
+    color: np.ndarray      # (n, 16, 16, 4) float32 RGBA
+    ore: np.ndarray        # index into World.ores, NO_ORE if none (tiles only)
+    near_ore: np.ndarray   # tile marked is_near_ore
+    ore_map: np.ndarray    # every block the chunk's veins claimed, with a margin of reach
+    reach: int             # ore_map[:, reach + x, reach + y] is local tile (x, y)
+    depth: np.ndarray = field(repr=False)  # depth below the surface row per tile
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    def to_dict(self, index: int, world: World) -> dict:
+        """One chunk in ChunkGenerationResult.to_dict()'s layout."""
+        cx, cy = (int(v) for v in self.chunks[index])
+        x0, y0 = cx * CHUNK_SIZE, cy * CHUNK_SIZE
+        tiles, caves = [], []
+        for lx in range(CHUNK_SIZE):
+            for ly in range(CHUNK_SIZE):
+                pos = [x0 + lx, y0 + ly]
+                if self.cave[index, lx, ly]:
+                    caves.append(pos)
+                elif self.tile[index, lx, ly]:
+                    ore = self.ore[index, lx, ly]
+                    tiles.append(pos + [
+                        float(self.hardness[index, lx, ly]),
+                        [float(c) for c in self.color[index, lx, ly]],
+                        world.ores[ore].id if ore != NO_ORE else "",
+                        bool(self.near_ore[index, lx, ly]),
+                    ])
+
+        ore_map = self.ore_map[index]
+        claimed = ore_map != NO_ORE
+        ore_list = [
+            [x0 + int(px) - self.reach, y0 + int(py) - self.reach, world.ores[ore_map[px, py]].id]
+            for px, py in zip(*np.nonzero(claimed))
+        ]
+        near = _dilate(claimed) & ~claimed
+        near_list = [
+            [x0 + int(px) - self.reach, y0 + int(py) - self.reach]
+            for px, py in zip(*np.nonzero(near))
+        ]
+        return {"chunk": [cx, cy], "tiles": tiles, "ore_map": ore_list, "caves": caves, "near_ore": near_list}
+
+
+def _dilate(mask: np.ndarray) -> np.ndarray:
+    """Mask plus its 8-neighbours, over the last two axes."""
+    padded = np.pad(mask, [(0, 0)] * (mask.ndim - 2) + [(1, 1), (1, 1)])
+    height, width = mask.shape[-2:]
+    result = np.zeros_like(mask)
+    for dx in (0, 1, 2):
+        for dy in (0, 1, 2):
+            result |= padded[..., dx:dx + height, dy:dy + width]
+    return result
+
+
+def cave_noise(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """_generate_cave_noise_thread (int64 wraparound, truncating %)."""
+    noise1 = np.fmod(x * 198491317 + y * 6542989, 1000000) / 1000000.0
+    noise2 = np.fmod(x * 73856093 + y * 19349663, 1000000) / 1000000.0
+    return noise1 * 0.7 + noise2 * 0.3
+
+
+def _ore_hash(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    return np.fmod(x * 374761393 + y * 668265263, 1000000)
+
+
+def _ore_noise_from_hash(hash_val: np.ndarray, frequency: float) -> np.ndarray:
+    return np.fmod(hash_val * int(frequency * 1000), 1000000) / 1000000.0
+
+
+def ore_noise(x: np.ndarray, y: np.ndarray, frequency: float) -> np.ndarray:
+    """_generate_ore_noise_thread."""
+    return _ore_noise_from_hash(_ore_hash(x, y), frequency)
+
+
+def _hardness(world: World, layer: np.ndarray, y: np.ndarray, variance: np.ndarray) -> np.ndarray:
+    """LayerData.get_hardness_at (depth scaling uses the grid row, as the game does)."""
+    hardness = np.zeros(layer.shape)
+    for i, data in enumerate(world.layers):
+        here = layer == i
+        if not here.any():
+            continue
+        value = np.full(int(here.sum()), data.base_hardness)
+        if data.infinite_scaling:
+            into_layer = y[here] - data.min_depth
+            deep = into_layer > 0
+            value[deep] += np.log(1.0 + into_layer[deep] / 100.0) * data.hardness_per_100_depth
+            if data.max_hardness > 0:
+                value[deep] = np.minimum(value[deep], data.max_hardness)
+        hardness[here] = value
+    return hardness * variance
+
+
+def _colors(world: World, layer: np.ndarray, depth: np.ndarray, roll: np.ndarray) -> np.ndarray:
+    """_get_block_color_thread: the layer (or next layer's) palette picked by roll."""
+    next_layer = world.layer_index(depth + TRANSITION_LOOKAHEAD)
+    max_depth = np.array([data.max_depth for data in world.layers])[layer]
+    blend = (
+        (depth >= max_depth - TRANSITION_RANGE) & (depth < max_depth)
+        & (next_layer != layer) & (roll < TRANSITION_CHANCE)
+    )
+    palette_layer = np.where(blend, next_layer, layer)
+    slot = np.where(roll < 0.60, 0, np.where(roll < 0.85, 1, 2))
+    palettes = np.array([data.colors for data in world.layers], dtype=np.float32)
+    return palettes[palette_layer, slot]
+
+
+def _spawn_ore(world: World, x: np.ndarray, y: np.ndarray, depth: np.ndarray) -> np.ndarray:
+    """Ore each position would seed a vein of, or NO_ORE (rarest ore checked first)."""
+    spawn = np.full(x.shape, NO_ORE, dtype=np.int16)
+    hash_val = _ore_hash(x, y)
+    open_ = np.ones(x.shape, dtype=bool)
+    for i, ore in enumerate(world.ores):
+        candidates = np.flatnonzero(open_ & ore.can_spawn_at_depth(depth))
+        noise = _ore_noise_from_hash(hash_val.flat[candidates], ore.noise_frequency)
+        hit = candidates[noise > ore.spawn_threshold]
+        spawn.flat[hit] = i
+        open_.flat[hit] = False
+    return spawn
+
+
+def _expand_veins(world: World, spawn: np.ndarray, x: np.ndarray, y: np.ndarray,
+                  ore_map: np.ndarray, reach: int, surface_row: int):
+    """Second pass of the generator: seed and grow veins into ore_map.
+
+    Within a chunk, tiles are visited in generation order and a tile claimed
+    by an earlier vein seeds nothing. Chunks do not share an ore map, so
+    every chunk runs its own visit order at once: each step, a chunk with no
+    vein growing takes its next seed candidate, and a chunk with one makes
+    one _expand_ore_vein_thread attempt.
+    """
+    n = len(spawn)
+    spawn = spawn.reshape(n, -1)
+    x, y = x.reshape(n, -1), y.reshape(n, -1)
+    candidates = np.argsort(spawn == NO_ORE, axis=1, kind="stable")
+    n_candidates = (spawn != NO_ORE).sum(axis=1)
+    next_candidate = np.zeros(n, dtype=np.int64)
+
+    vein_min = np.array([ore.vein_size_min for ore in world.ores], dtype=np.int64)
+    vein_max = np.array([ore.vein_size_max for ore in world.ores], dtype=np.int64)
+    ore_min_depth = np.array([ore.min_depth for ore in world.ores], dtype=np.int64)
+    ore_max_depth = np.array([ore.max_depth for ore in world.ores], dtype=np.int64)
+    origin_y = y[:, 0] - reach - surface_row  # depth of ore_map row 0
+
+    # Vein being grown in each chunk
+    growing = np.zeros(n, dtype=bool)
+    ore = np.zeros(n, dtype=np.int64)
+    state = np.zeros(n, dtype=np.uint64)
+    size = np.zeros(n, dtype=np.int64)
+    placed = np.zeros((n, max(int(vein_max.max()), 1), 2), dtype=np.int64)
+    placed_count = np.zeros(n, dtype=np.int64)
+    attempts = np.zeros(n, dtype=np.int64)
+    last_dir = np.zeros((n, 2), dtype=np.int64)
+    has_last = np.zeros(n, dtype=bool)
+
+    while True:
+        # Chunks with no vein growing visit their next seed candidate
+        idle = np.flatnonzero(~growing & (next_candidate < n_candidates))
+        if idle.size:
+            slot = candidates[idle, next_candidate[idle]]
+            next_candidate[idle] += 1
+            px, py = reach + slot // CHUNK_SIZE, reach + slot % CHUNK_SIZE
+            free = ore_map[idle, px, py] == NO_ORE
+            idle, slot, px, py = idle[free], slot[free], px[free], py[free]
+
+            seeds = spawn[idle, slot].astype(np.int64)
+            vein_state = rng_seed(x[idle, slot] * 73856093 + y[idle, slot] * 19349663)
+            vein_size, vein_state = rng_randi_range(vein_state, vein_min[seeds], vein_max[seeds])
+            ore_map[idle, px, py] = seeds
+
+            ore[idle] = seeds
+            state[idle] = vein_state
+            size[idle] = vein_size
+            placed[idle, 0, 0], placed[idle, 0, 1] = px, py
+            placed_count[idle] = 1
+            attempts[idle] = 0
+            has_last[idle] = False
+            growing[idle] = vein_size > 1
+
+        active = np.flatnonzero(growing)
+        if not active.size:
+            if not (next_candidate < n_candidates).any():
+                return
+            continue
+
+        st = state[active]
+        n_placed = placed_count[active]
+
+        # Expand from one of the last three blocks (70%) or any block
+        roll, st = rng_randf(st)
+        recent = (roll < 0.7) & (n_placed > 1)
+        pick, st = rng_randi(st)
+        from_index = np.where(recent, n_placed - 1 - pick % np.minimum(3, n_placed), pick % n_placed)
+        source = placed[active, from_index]
+
+        # Keep going the same way (40%), else diagonal (15%) or cardinal
+        keeps = has_last[active]
+        keep_roll, drawn = rng_randf(st)
+        st = np.where(keeps, drawn, st)
+        keep = keeps & (keep_roll < 0.4)
+        diagonal_roll, drawn = rng_randf(st)
+        st = np.where(keep, st, drawn)
+        dir_pick, drawn = rng_randi(st)
+        st = np.where(keep, st, drawn)
+        fresh = np.where((diagonal_roll < 0.15)[:, None], DIAGONAL_DIRS[dir_pick % 4], CARDINAL_DIRS[dir_pick % 4])
+        direction = np.where(keep[:, None], last_dir[active], fresh)
+        state[active] = st
+
+        target = source + direction
+        depth = origin_y[active] + target[:, 1]
+        vein_ore = ore[active]
+        o_max = ore_max_depth[vein_ore]
+        ok = (
+            (depth >= 0) & (depth >= ore_min_depth[vein_ore]) & ((o_max == -1) | (depth <= o_max))
+            & (ore_map[active, target[:, 0], target[:, 1]] == NO_ORE)
+        )
+
+        won = active[ok]
+        ore_map[won, target[ok, 0], target[ok, 1]] = vein_ore[ok]
+        placed[won, placed_count[won]] = target[ok]
+        placed_count[won] += 1
+        last_dir[won] = direction[ok]
+        has_last[won] = True
+
+        attempts[active] += 1
+        growing[active] = (placed_count[active] < size[active]) & (attempts[active] < size[active] * 6)
+
+
+def generate_chunks(world: World, chunks, surface_row: int = SURFACE_ROW) -> ChunkBatch:
+    """Generate chunks as ThreadedChunkGenerator.generate_chunk_data() would
+    for a fresh world (no dug tiles)."""
+    chunks = np.asarray(chunks, dtype=np.int64).reshape(-1, 2)
+    n = len(chunks)
+    local_x, local_y = np.meshgrid(np.arange(CHUNK_SIZE), np.arange(CHUNK_SIZE), indexing="ij")
+    x = chunks[:, 0, None, None] * CHUNK_SIZE + local_x
+    y = chunks[:, 1, None, None] * CHUNK_SIZE + local_y
+    depth = y - surface_row
+
+    # First pass: caves and tiles
+    below = depth >= 0
+    bonus = np.minimum(depth * CAVE_DEPTH_FACTOR, 0.1)
+    cave = below & (depth >= CAVE_MIN_DEPTH) & (cave_noise(x, y) > CAVE_THRESHOLD - bonus)
+    tile = below & ~cave
+
+    layer = world.layer_index(np.maximum(depth, 0))
+    # get_hardness_at and get_color_at both seed with x * 1000 + y: one shared draw
+    roll, _ = rng_randf(rng_seed(x * 1000 + y))
+    hardness = np.where(tile, _hardness(world, layer, y, rng_randf_range(roll, 0.9, 1.1)), np.nan)
+    color = _colors(world, layer, np.maximum(depth, 0), roll)
+    color[~tile] = 0
+
+    # Second pass: veins, in the generator's tile order within each chunk
+    reach = world.vein_reach
+    span = CHUNK_SIZE + 2 * reach
+    ore_map = np.full((n, span, span), NO_ORE, dtype=np.int16)
+    spawn = np.where(tile, _spawn_ore(world, x, y, depth), NO_ORE)
+    _expand_veins(world, spawn, x, y, ore_map, reach, surface_row)
+
+    # Third pass: ore and near-ore flags for the chunk's own tiles
+    inner = ore_map[:, reach:reach + CHUNK_SIZE, reach:reach + CHUNK_SIZE]
+    claimed = ore_map != NO_ORE
+    near = (_dilate(claimed) & ~claimed)[:, reach:reach + CHUNK_SIZE, reach:reach + CHUNK_SIZE]
+    ore = np.where(tile, inner, NO_ORE)
+    return ChunkBatch(chunks, tile, cave, hardness, color, ore, near & tile, ore_map, reach, depth)
+
+
+# ============================================
+# Statistics
+# ============================================
+
+def depth_chunks(min_depth: int, max_depth: int, columns: int, first_column: int = 0,
+                 surface_row: int = SURFACE_ROW) -> np.ndarray:
+    """Chunk coordinates covering depths [min_depth, max_depth) over `columns` chunk columns."""
+    first_row = (surface_row + min_depth) // CHUNK_SIZE
+    last_row = (surface_row + max_depth - 1) // CHUNK_SIZE
+    cols, rows = np.meshgrid(
+        np.arange(first_column, first_column + columns), np.arange(first_row, last_row + 1), indexing="ij"
+    )
+    return np.stack([cols.ravel(), rows.ravel()], axis=1)
+
+
+def iter_batches(world: World, chunks, batch_size: int = BATCH_CHUNKS,
+                 surface_row: int = SURFACE_ROW) -> Iterator[ChunkBatch]:
+    chunks = np.asarray(chunks, dtype=np.int64).reshape(-1, 2)
+    for start in range(0, len(chunks), batch_size):
+        yield generate_chunks(world, chunks[start:start + batch_size], surface_row)
+
+
+def layer_counts(world: World, batches: Iterable[ChunkBatch],
+                 depth_range: Optional[tuple[int, int]] = None) -> dict:
+    """Blocks, caves and ore blocks per layer, accumulated batch by batch.
+
+    Returns:
+        {layer_id: {"blocks": int, "caves": int, "ores": {ore_id: int}}}
+    """
+    counts = {
+        layer.id: {"blocks": 0, "caves": 0, "ores": {ore.id: 0 for ore in world.ores}}
+        for layer in world.layers
+    }
+    n_layers, n_ores = len(world.layers), len(world.ores)
+    for batch in batches:
+        in_range = batch.depth >= 0
+        if depth_range:
+            in_range &= (batch.depth >= depth_range[0]) & (batch.depth < depth_range[1])
+        layer = world.layer_index(batch.depth)
+        blocks = np.bincount(layer[batch.tile & in_range], minlength=n_layers)
+        caves = np.bincount(layer[batch.cave & in_range], minlength=n_layers)
+        has_ore = (batch.ore != NO_ORE) & in_range
+        ores = np.bincount(
+            layer[has_ore] * n_ores + batch.ore[has_ore], minlength=n_layers * n_ores
+        ).reshape(n_layers, n_ores)
+        for i, data in enumerate(world.layers):
+            entry = counts[data.id]
+            entry["blocks"] += int(blocks[i])
+            entry["caves"] += int(caves[i])
+            for j, ore in enumerate(world.ores):
+                entry["ores"][ore.id] += int(ores[i, j])
+    return counts
+
+
+# ============================================
+# Parity
+# ============================================
+
+def compare_chunk(exported: dict, simulated: dict, tolerance: float = 1e-5) -> list[str]:
+    """Differences between a chunk exported from the game and the simulator's.
+
+    Both are ChunkGenerationResult.to_dict() layouts; hardness and color are
+    compared within tolerance (JSON rounding, float32 math).
+    """
+    name = f"chunk {tuple(exported['chunk'])}"
+    problems = []
+
+    def keyed(entries, width=2):
+        return {tuple(entry[:width]): entry[width:] for entry in entries}
+
+    for field_name, width in (("caves", 2), ("near_ore", 2), ("ore_map", 2)):
+        game, sim = keyed(exported[field_name], width), keyed(simulated[field_name], width)
+        for pos in sorted(game.keys() ^ sim.keys())[:5]:
+            where = "game only" if pos in game else "simulator only"
+            problems.append(f"{name}: {field_name} {pos} ({where})")
+        for pos in sorted(game.keys() & sim.keys()):
+            if game[pos] != sim[pos]:
+                problems.append(f"{name}: {field_name} {pos} game {game[pos]} != simulator {sim[pos]}")
+
+    game, sim = keyed(exported["tiles"]), keyed(simulated["tiles"])
+    for pos in sorted(game.keys() ^ sim.keys())[:5]:
+        problems.append(f"{name}: tile {pos} ({'game only' if pos in game else 'simulator only'})")
+    for pos in sorted(game.keys() & sim.keys()):
+        (g_hard, g_color, g_ore, g_near), (s_hard, s_color, s_ore, s_near) = game[pos], sim[pos]
+        if abs(g_hard - s_hard) > tolerance * max(1.0, abs(g_hard)):
+            problems.append(f"{name}: tile {pos} hardness {g_hard} != {s_hard}")
+        if any(abs(a - b) > tolerance for a, b in zip(g_color, s_color)):
+            problems.append(f"{name}: tile {pos} color {g_color} != {s_color}")
+        if (g_ore, bool(g_near)) != (s_ore, s_near):
+            problems.append(f"{name}: tile {pos} ore/near {g_ore!r}/{g_near} != {s_ore!r}/{s_near}")
+    return problems
+
+
+def check_parity(world: World, exported_chunks: list[dict], surface_row: int = SURFACE_ROW) -> list[str]:
+    """Regenerate every exported chunk and list the differences."""
+    if not exported_chunks:
+        return []
+    batch = generate_chunks(world, [chunk["chunk"] for chunk in exported_chunks], surface_row)
+    problems = []
+    for i, exported in enumerate(exported_chunks):
+        problems.extend(compare_chunk(exported, batch.to_dict(i, world)))
+    return problems
+
+
+# ============================================
+# CLI
+# ============================================
+
+def _parse_range(text: str) -> tuple[int, int]:
+    low, _, high = text.partition(":")
+    return int(low), int(high)
+
+
+def print_density(world: World, counts: dict, depth_range: tuple[int, int]):
+    ore_ids = [ore.id for ore in sorted(world.ores, key=lambda o: o.min_depth)
+               if any(entry["ores"][ore.id] for entry in counts.values())]
+    print(f"{'layer':<14} {'depths':>11} {'blocks':>9} {'caves':>6}  "
+          + "  ".join(f"{ore_id[:8]:>8}" for ore_id in ore_ids))
+    for layer in world.layers:
+        low, high = max(layer.min_depth, depth_range[0]), min(layer.max_depth, depth_range[1])
+        entry = counts[layer.id]
+        generated = entry["blocks"] + entry["caves"]
+        if not generated:
+            continue
+        per_k = [1000 * entry["ores"][ore_id] / entry["blocks"] if entry["blocks"] else 0 for ore_id in ore_ids]
+        print(f"{layer.id:<14} {f'{low}-{high}':>11} {entry['blocks']:>9,} "
+              f"{entry['caves'] / generated:>6.1%}  "
+              + "  ".join(f"{value:>8.1f}" for value in per_k))
+    print("\nOre columns: ore blocks per 1,000 solid blocks")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Offline ThreadedChunkGenerator simulator")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="World seed (the current generator's output does not depend on it)")
+    parser.add_argument("--depth", type=_parse_range, default=(0, 1600),
+                        help="Depth range MIN:MAX below the surface (default 0:1600)")
+    parser.add_argument("--columns", type=int, default=16, help="Chunk columns to sample (default 16)")
+    parser.add_argument("--first-column", type=int, default=0, help="First chunk column")
+    parser.add_argument("--batch", type=int, default=BATCH_CHUNKS, help="Chunks generated per batch")
+    parser.add_argument("--parity", type=Path,
+                        help="JSON list of exported ChunkGenerationResult.to_dict() chunks to compare")
+
+    args = parser.parse_args()
+    world = load_world()
+
+    if args.parity:
+        exported = json.loads(args.parity.read_text())
+        problems = check_parity(world, exported)
+        for problem in problems[:50]:
+            print(problem)
+        print(f"{len(exported)} chunks: {'OK' if not problems else f'{len(problems)} differences'}")
+        sys.exit(1 if problems else 0)
+
+    chunks = depth_chunks(*args.depth, args.columns, args.first_column)
+    start = time.perf_counter()
+    counts = layer_counts(world, iter_batches(world, chunks, args.batch), args.depth)
+    elapsed = time.perf_counter() - start
+
+    blocks = len(chunks) * CHUNK_SIZE * CHUNK_SIZE
+    print(f"Seed {args.seed}: {len(chunks):,} chunks, depth {args.depth[0]}-{args.depth[1]}, "
+          f"{elapsed:.2f}s ({blocks / elapsed / 1e6:.2f}M blocks/s)\n")
+    print_density(world, counts, args.depth)
@@ -8,22 +8,6 @@ signal slot_pressed(slot_index: int)
 
 const _TERRAIN_ATLAS := preload("res://resources/tileset/terrain_atlas.png")
 
-## Preloaded item icons for web export compatibility.
-## Runtime load() can fail in WASM builds; preload() ensures textures are packed.
-const _ITEM_ICONS := {
-	"ladder": preload("res://resources/icons/items/ladder.png"),
-	"rope": preload("res://resources/icons/items/rope.png"),
-	"teleport_scroll": preload("res://resources/icons/items/teleport_scroll.png"),
-	"fossil_common": preload("res://resources/icons/items/fossil_common.png"),
-	"fossil_rare": preload("res://resources/icons/items/fossil_rare.png"),
-	"fossil_legendary": preload("res://resources/icons/items/fossil_legendary.png"),
-	"fossil_amber": preload("res://resources/icons/items/fossil_amber.png"),
-	"artifact_ancient_coin": preload("res://resources/icons/items/artifact_ancient_coin.png"),
-	"artifact_crystal_skull": preload("res://resources/icons/items/artifact_crystal_skull.png"),
-	"artifact_fossilized_crown": preload("res://resources/icons/items/artifact_fossilized_crown.png"),
-	"artifact_obsidian_tablet": preload("res://resources/icons/items/artifact_obsidian_tablet.png"),
-}
-
 @export var slot_index: int = 0
 
 @onready var item_icon: TextureRect = $Icon
@@ -110,15 +94,15 @@ func _get_rarity_color(rarity) -> Color:
 
 func _resolve_item_icon(item) -> Texture2D:
 	## Return the best available icon for an item.
-	## Priority: explicit icon → preloaded icon dict → atlas tile (ores) → null
+	## Priority: explicit icon → packed sprite atlas → terrain atlas tile (ores) → null
 
 	if item.icon != null:
 		return item.icon
 
-	# Preloaded icon lookup (web-safe: avoids runtime load() in WASM)
-	var item_id: String = item.id
-	if _ITEM_ICONS.has(item_id):
-		return _ITEM_ICONS[item_id]
+	# Packed icon (web-safe: the atlas is preloaded, no runtime load() in WASM)
+	var icon: Texture2D = SpriteAtlas.get_item_icon(item.id)
+	if icon != null:
+		return icon
 
 	# Ores and other tiles with atlas coordinates
 	var coords = item.get("tile_atlas_coords")
@@ -68,6 +68,10 @@ var use_threaded_generation: bool = true
 var _threaded_generator: Node = null
 var _pending_threaded_chunks: Dictionary = {}  # Chunks awaiting threaded generation
 
+## Set by the chunk generation benchmark so player-driven streaming doesn't
+## load or unload chunks underneath it
+var test_streaming_paused: bool = false
+
 
 func _ready() -> void:
 	# Defer heavy initialization so _ready() completes quickly.
@@ -135,7 +139,7 @@ func initialize(player: Node2D, surface_row: int) -> void:
 
 
 func _process(_delta: float) -> void:
-	if _player == null:
+	if _player == null or test_streaming_paused:
 		return
 
 	var player_chunk := _world_to_chunk(_player.position)
@@ -2089,6 +2093,51 @@ func debug_threaded_stats() -> Dictionary:
 	return stats
 
 
+func test_reset() -> void:
+	## Drop every loaded chunk and all in-memory dig state so the terrain
+	## regenerates from the world seed around the player on the next frame.
+	## Used by the PlayGodot state reset - nothing is written to the save.
+	test_streaming_paused = false
+	_dirty_chunks.clear()
+	for chunk_pos: Vector2i in _loaded_chunks.keys():
+		_unload_chunk(chunk_pos)
+	_loaded_chunks.clear()
+
+	if _threaded_generator:
+		for chunk_pos: Vector2i in _pending_threaded_chunks.keys():
+			_threaded_generator.cancel_chunk_generation(chunk_pos)
+	_pending_threaded_chunks.clear()
+
+	for pos: Vector2i in _ladder_visuals.keys():
+		_remove_ladder_visual(pos)
+	_placed_objects.clear()
+	_dug_tiles.clear()
+	_ore_map.clear()
+	_near_ore_blocks.clear()
+
+
+func test_generate_chunk(chunk_pos: Vector2i, threaded: bool) -> bool:
+	## Load one chunk the way streaming does, through the threaded or the
+	## synchronous path. Returns false if it is already loaded or pending.
+	if _loaded_chunks.has(chunk_pos) or _pending_threaded_chunks.has(chunk_pos):
+		return false
+	if threaded:
+		if _threaded_generator == null or not _threaded_generator.generate_chunk_async(chunk_pos):
+			return false
+		_pending_threaded_chunks[chunk_pos] = true
+		return true
+	_generate_chunk(chunk_pos)
+	_loaded_chunks[chunk_pos] = true
+	return true
+
+
+func test_unload_chunk(chunk_pos: Vector2i) -> void:
+	## Unload a chunk loaded by test_generate_chunk()
+	if _loaded_chunks.has(chunk_pos):
+		_unload_chunk(chunk_pos)
+		_loaded_chunks.erase(chunk_pos)
+
+
 # ============================================
 # EXPLORATION/FOG SYSTEM
 # ============================================
@@ -45,6 +45,30 @@ class ChunkGenerationResult:
 	## Error message if generation failed
 	var error_message: String = ""
 
+	## Plain arrays/strings only (JSON-safe), for exporting chunks to tools
+	func to_dict() -> Dictionary:
+		var tile_list := []
+		for grid_pos in tiles:
+			var tile: TileGenerationData = tiles[grid_pos]
+			var c := tile.color
+			tile_list.append([grid_pos.x, grid_pos.y, tile.hardness, [c.r, c.g, c.b, c.a], tile.ore_id, tile.is_near_ore])
+		var ore_list := []
+		for grid_pos in ore_map:
+			ore_list.append([grid_pos.x, grid_pos.y, ore_map[grid_pos]])
+		var cave_list := []
+		for grid_pos in cave_tiles:
+			cave_list.append([grid_pos.x, grid_pos.y])
+		var near_list := []
+		for grid_pos in near_ore_blocks:
+			near_list.append([grid_pos.x, grid_pos.y])
+		return {
+			"chunk": [chunk_pos.x, chunk_pos.y],
+			"tiles": tile_list,
+			"ore_map": ore_list,
+			"caves": cave_list,
+			"near_ore": near_list,
+		}
+
 
 ## Per-tile generation data (no scene tree references)
 class TileGenerationData:
@@ -149,6 +173,18 @@ func get_pending_count() -> int:
 ## Thread-safe chunk generation (runs on WorkerThreadPool)
 ## This method MUST NOT access the scene tree
 func _generate_chunk_thread(context: Dictionary) -> void:
+	var result := generate_chunk_data(context)
+
+	# Store result thread-safely
+	_results_mutex.lock()
+	_completed_results.append(result)
+	_results_mutex.unlock()
+
+
+## Generate a chunk's tile data without queueing it for the main thread.
+## Safe to call from any thread; context has the keys generate_chunk_async() builds.
+## scripts/tools/worldgen_sim.py mirrors this function - keep the two in sync.
+func generate_chunk_data(context: Dictionary) -> ChunkGenerationResult:
 	var chunk_pos: Vector2i = context["chunk_pos"]
 	var surface_row: int = context["surface_row"]
 	var world_seed: int = context["world_seed"]
@@ -228,10 +264,7 @@ func _generate_chunk_thread(context: Dictionary) -> void:
 			var tile_data: TileGenerationData = result.tiles[grid_pos]
 			tile_data.is_near_ore = true
 
-	# Store result thread-safely
-	_results_mutex.lock()
-	_completed_results.append(result)
-	_results_mutex.unlock()
+	return result
 
 
 ## Process completed results on main thread
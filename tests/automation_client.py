@@ -0,0 +1,170 @@
+"""
+Filtered PlayGodot connection for the GoDig test harness.
+
+Godot's RemoteDebugger sends everything over the automation connection:
+automation responses, but also `output` (print), `error` (errors and warnings
+with full call stacks) and profiler messages. Loading test_level.tscn (400-node
+block pool, 300-instance MultiMesh sparkle pool) produces a burst of those.
+The stock NativeClient decodes and logs every message in order, so during the
+burst it falls behind, Godot's outgoing queue fills up and
+`automation:scene_changed` can be dropped or arrive long after the scene is in
+the tree.
+
+FilteredNativeClient reads each frame's message name straight from the
+encoded bytes and drops categories nobody subscribed to without decoding
+them. Only `automation:` responses are subscribed by default. The game side
+caps warning/error rates in project.godot (network/limits/debugger) so the
+burst is bounded as well.
+
+Usage::
+
+    async with launch_godot(GODOT_PROJECT, port=port, ...) as g:
+        g._client.subscribe("output")   # also receive print() output
+"""
+import asyncio
+import logging
+import struct
+import subprocess
+from collections import Counter
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Iterable, Optional
+
+from playgodot import Godot
+from playgodot.native_client import NativeClient
+from playgodot.variant import VariantType, decode_message
+
+
+logger = logging.getLogger(__name__)
+
+# Message name prefixes decoded by default. Everything else is dropped.
+DEFAULT_SUBSCRIPTIONS = ("automation:",)
+
+
+def peek_message_name(payload: bytes) -> Optional[str]:
+    """Read the name of an encoded debugger message without decoding it.
+
+    A message is an Array ``[name, thread_id, data]``, so the name is the
+    String at a fixed offset: array header, element count, string header,
+    byte length, UTF-8 bytes.
+
+    Returns:
+        The message name, or None if the payload doesn't have that layout
+    """
+    if len(payload) < 16:
+        return None
+    array_type, _count, name_type, length = struct.unpack_from("<IIII", payload)
+    if array_type & 0xFF != VariantType.ARRAY:
+        return None
+    if name_type & 0xFF not in (VariantType.STRING, VariantType.STRING_NAME):
+        return None
+    if len(payload) < 16 + length:
+        return None
+    return payload[16:16 + length].decode("utf-8", errors="replace")
+
+
+class FilteredNativeClient(NativeClient):
+    """NativeClient that only decodes subscribed message categories.
+
+    Subscriptions are name prefixes (e.g. "automation:", "output", "error").
+    Dropped messages are counted per name in `dropped` for diagnostics.
+    """
+
+    def __init__(self, host: str = "localhost", port: int = 6007,
+                 subscriptions: Iterable[str] = DEFAULT_SUBSCRIPTIONS):
+        super().__init__(host=host, port=port)
+        self.subscriptions = set(subscriptions)
+        self.dropped: Counter = Counter()
+
+    def subscribe(self, prefix: str) -> None:
+        """Start decoding messages whose name starts with prefix."""
+        self.subscriptions.add(prefix)
+
+    def unsubscribe(self, prefix: str) -> None:
+        """Stop decoding messages whose name starts with prefix."""
+        self.subscriptions.discard(prefix)
+
+    def is_subscribed(self, name: str) -> bool:
+        return any(name.startswith(prefix) for prefix in self.subscriptions)
+
+    async def _receive_loop(self) -> None:
+        """Receive frames, dropping unsubscribed ones before decoding."""
+        if not self._reader:
+            return
+
+        try:
+            while True:
+                size = struct.unpack("<I", await self._reader.readexactly(4))[0]
+                payload = await self._reader.readexactly(size)
+
+                # The first message carries Godot's main thread ID, which
+                # outgoing commands must use, so always decode until it's known.
+                name = peek_message_name(payload)
+                if (name is not None and self._godot_thread_id != 0
+                        and not self.is_subscribed(name)):
+                    self.dropped[name] += 1
+                    continue
+
+                try:
+                    name, thread_id, data = decode_message(payload)
+                except Exception as e:
+                    logger.warning("Failed to decode message: %s", e)
+                    continue
+
+                if self._godot_thread_id == 0 and thread_id != 0:
+                    self._godot_thread_id = thread_id
+                if self.is_subscribed(name):
+                    await self._handle_response(name, data)
+        except (asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        except Exception as e:
+            logger.exception("Receive loop error: %s", e)
+
+    async def _handle_response(self, name: str, data: list) -> None:
+        """Resolve the pending request for a response (without per-message logging)."""
+        future = self._pending.get(name)
+        if future and not future.done():
+            future.set_result(data)
+
+
+@asynccontextmanager
+async def launch_godot(
+    project_path,
+    *,
+    headless: bool = True,
+    resolution: Optional[tuple] = None,
+    port: int = 6007,
+    timeout: float = 30.0,
+    godot_path: Optional[str] = None,
+    subscriptions: Iterable[str] = DEFAULT_SUBSCRIPTIONS,
+):
+    """Launch a Godot project connected through a FilteredNativeClient.
+
+    Same arguments and behaviour as playgodot's Godot.launch().
+
+    Yields:
+        A connected Godot instance
+    """
+    cmd = [godot_path or Godot._find_godot(), "--path", str(Path(project_path).resolve())]
+    if headless:
+        cmd.append("--headless")
+    if resolution:
+        cmd.extend(["--resolution", f"{resolution[0]}x{resolution[1]}"])
+    cmd.extend(["--remote-debug", f"tcp://127.0.0.1:{port}"])
+
+    client = FilteredNativeClient(host="127.0.0.1", port=port, subscriptions=subscriptions)
+    process: Optional[subprocess.Popen] = None
+    try:
+        # Listen before Godot starts so its debugger connection is accepted
+        await client._start_server()
+        process = subprocess.Popen(cmd)
+        await client.connect(timeout=timeout)
+        yield Godot(client, process)
+    finally:
+        await client.disconnect()
+        if process and process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
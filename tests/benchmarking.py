@@ -0,0 +1,174 @@
+"""
+Baseline storage and regression checks for the PlayGodot benchmarks.
+
+Benchmarks record a few summary metrics per scenario (frame-time percentiles,
+spike counts, memory) and compare them with the values stored in
+benchmark_baselines.json. A metric regresses when it is worse than its
+baseline by more than the tolerance. A scenario without a baseline is
+skipped, with a reason that names it, until one is recorded with
+GODIG_BENCH_UPDATE=1.
+
+Baselines are machine-specific: record them on the machine that enforces
+them (e.g. the CI runner) and commit the file. Benchmarks run in separate
+cold_godot workers under xdist, so recording merges each scenario into the
+file under a lock and replaces it atomically.
+
+Configuration (environment variables):
+    GODIG_BENCHMARKS        Set to 1 to run benchmarks (skipped otherwise)
+    GODIG_BENCH_TOLERANCE   Allowed relative regression (default 0.25 = 25%)
+    GODIG_BENCH_UPDATE      Set to 1 to overwrite baselines with this run
+"""
+import json
+import math
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List
+
+import pytest
+
+
+BASELINE_FILE = Path(__file__).parent / "benchmark_baselines.json"
+LOCK_FILE = BASELINE_FILE.with_suffix(".lock")
+
+# A lock older than this is left over from a killed worker
+LOCK_STALE_SECONDS = 60.0
+
+DEFAULT_TOLERANCE = 0.25
+
+# Regressions smaller than this are ignored whatever the tolerance, so tiny
+# metrics (sub-millisecond frames, a spike or two) don't fail on noise.
+DEFAULT_SLACK = 1.0
+
+
+def benchmarks_enabled() -> bool:
+    """True when GODIG_BENCHMARKS=1 (benchmarks are slow and opt-in)."""
+    return os.environ.get("GODIG_BENCHMARKS", "") == "1"
+
+
+def get_tolerance() -> float:
+    """Allowed relative regression before a benchmark fails."""
+    return float(os.environ.get("GODIG_BENCH_TOLERANCE", DEFAULT_TOLERANCE))
+
+
+def percentile(values: Iterable[float], pct: float) -> float:
+    """Percentile with linear interpolation between closest ranks."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(values: Iterable[float], prefix: str = "") -> Dict[str, float]:
+    """p50/p95/p99 of a sample, rounded for stable baseline files."""
+    values = list(values)
+    return {
+        f"{prefix}p{pct}": round(percentile(values, pct), 3)
+        for pct in (50, 95, 99)
+    }
+
+
+def updating_baselines() -> bool:
+    """True when GODIG_BENCH_UPDATE=1 (record this run as the baseline)."""
+    return os.environ.get("GODIG_BENCH_UPDATE", "") == "1"
+
+
+def load_baselines() -> dict:
+    if not BASELINE_FILE.exists():
+        return {}
+    return json.loads(BASELINE_FILE.read_text())
+
+
+@contextmanager
+def _baseline_lock() -> Iterator[None]:
+    """Exclusive lock on the baseline file across worker processes."""
+    while True:
+        try:
+            fd = os.open(LOCK_FILE, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - LOCK_FILE.stat().st_mtime > LOCK_STALE_SECONDS:
+                    LOCK_FILE.unlink()
+                    continue
+            except FileNotFoundError:
+                continue
+            time.sleep(0.05)
+    try:
+        os.close(fd)
+        yield
+    finally:
+        LOCK_FILE.unlink(missing_ok=True)
+
+
+def save_baseline(suite: str, scenario: str, metrics: Dict[str, float]) -> None:
+    """Merge one scenario's metrics into the baseline file.
+
+    Re-reads the file under the lock so concurrent workers keep each other's
+    entries, and writes through a temp file so readers never see it half written.
+    """
+    with _baseline_lock():
+        baselines = load_baselines()
+        baselines.setdefault(suite, {})[scenario] = metrics
+        tmp = BASELINE_FILE.with_name(f"{BASELINE_FILE.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        tmp.replace(BASELINE_FILE)
+
+
+def check_baseline(
+    suite: str,
+    scenario: str,
+    metrics: Dict[str, float],
+    higher_is_better: Iterable[str] = (),
+    slack: float = DEFAULT_SLACK,
+) -> List[str]:
+    """Compare metrics with the stored baseline.
+
+    With GODIG_BENCH_UPDATE=1 the metrics are recorded as the new baseline
+    instead. A scenario with no baseline skips the test, naming the
+    command that records one.
+
+    Args:
+        suite: Baseline group (e.g. "frame_time")
+        scenario: Scenario name within the suite
+        metrics: Metric name -> value for this run
+        higher_is_better: Metrics where a drop is the regression (e.g. throughput)
+        slack: Absolute difference always tolerated
+
+    Returns:
+        One message per regressed metric (empty if within tolerance)
+    """
+    if updating_baselines():
+        save_baseline(suite, scenario, metrics)
+        return []
+
+    stored = load_baselines().get(suite, {}).get(scenario)
+    if stored is None:
+        pytest.skip(
+            f"No baseline for {suite}/{scenario} in {BASELINE_FILE.name}; record one with "
+            f"GODIG_BENCH_UPDATE=1 on the machine that enforces it and commit the file"
+        )
+
+    tolerance = get_tolerance()
+    higher_is_better = set(higher_is_better)
+    regressions = []
+    for name, value in metrics.items():
+        base = stored.get(name)
+        if base is None:
+            continue
+        if name in higher_is_better:
+            limit = base * (1 - tolerance) - slack
+            regressed = value < limit
+        else:
+            limit = base * (1 + tolerance) + slack
+            regressed = value > limit
+        if regressed:
+            regressions.append(
+                f"{suite}/{scenario} {name}: {value:.3f} vs baseline {base:.3f} "
+                f"(limit {limit:.3f}, tolerance {tolerance:.0%})"
+            )
+    return regressions
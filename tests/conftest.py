@@ -6,14 +6,21 @@ PlayGodot requires a custom Godot fork with automation support.
 
 See TESTING.md for setup instructions.
 """
+import asyncio
 import os
 import platform
 import socket
+from contextlib import AsyncExitStack
 from typing import Optional
+import pytest
 import pytest_asyncio
 from pathlib import Path
-from playgodot import Godot
-import playgodot.exceptions as pg_exc
+from pytest_asyncio import is_async_test
+
+from automation_client import launch_godot
+from godot_pool import GodotPool, get_max_leases, get_pool_size
+from scheduling import DURATION_SCHEDULE, DurationRecorder, DurationScheduling, order_by_fixture
+from helpers import PATHS, capture_baseline, reset_state
 
 GODOT_PROJECT = Path(__file__).parent.parent
 
@@ -168,14 +175,59 @@ def get_playgodot_port() -> int:
     return get_free_port()
 
 
-@pytest_asyncio.fixture
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    """Use duration-aware scheduling (see scheduling.py) for `-n` runs.
+
+    Runs before pytest-xdist fills in its `--dist load` default, so an
+    explicit `--dist` is left alone.
+    """
+    if getattr(config.option, "numprocesses", None) and config.option.dist == "no":
+        config.stash[DURATION_SCHEDULE] = True
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "cold_godot: launch a fresh Godot process instead of leasing a warm pooled instance",
+    )
+    config.addinivalue_line(
+        "markers",
+        "benchmark: performance benchmark compared against benchmark_baselines.json",
+    )
+    # Durations are recorded where all reports arrive: the xdist controller,
+    # or the only process in a non-distributed run.
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(DurationRecorder(config), "godig-durations")
+
+
+def pytest_xdist_make_scheduler(config, log):
+    if config.stash.get(DURATION_SCHEDULE, False):
+        return DurationScheduling(config, log)
+    return None
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test on the session event loop, grouped by fixture.
+
+    Pooled Godot instances own sockets bound to the loop they were launched
+    on, so tests and fixtures must share a single loop for the whole session.
+    Running `game` tests back-to-back keeps the warm pool busy.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+    order_by_fixture(items)
+
+
+@pytest_asyncio.fixture(loop_scope="session")
 async def main_menu():
     """Launch the game on the main menu and yield the Godot connection.
 
     This fixture has extended timeouts to handle parallel execution
     scenarios where multiple Godot instances may be running.
     """
-    import asyncio
     port = get_playgodot_port()
 
     # Extended timeouts for parallel execution scenarios
@@ -187,8 +239,8 @@ async def main_menu():
 
     for attempt in range(MAX_RETRIES + 1):
         try:
-            async with Godot.launch(
-                str(GODOT_PROJECT),
+            async with launch_godot(
+                GODOT_PROJECT,
                 headless=True,
                 resolution=(720, 1280),
                 timeout=LAUNCH_TIMEOUT,
@@ -210,16 +262,29 @@ async def main_menu():
                 raise last_error
 
 
-@pytest_asyncio.fixture
-async def game():
-    """Launch the game and navigate to the test level scene.
+async def change_to_test_level(g, timeout: float) -> None:
+    """Change to test_level.tscn and wait until the new /root/Main is in the tree.
 
-    This fixture has extended timeouts and retry logic to handle
-    parallel execution scenarios where multiple Godot instances
-    may be competing for system resources.
+    Scene initialization (400-node block pool, 300-instance MultiMesh sparkle
+    pool) bursts output/error messages over the debug protocol. The filtered
+    connection from launch_godot() drops those unread, so
+    automation:scene_changed is no longer lost behind them and the change
+    can be awaited directly.
     """
-    import asyncio
-    port = get_playgodot_port()
+    await g._client.send("change_scene", {"path": "res://scenes/test_level.tscn"}, timeout=timeout)
+    await g.wait_for_node(PATHS["main"], timeout=timeout)
+
+
+async def launch_game(stack: AsyncExitStack, port: Optional[int] = None):
+    """Launch Godot and navigate to the test level scene.
+
+    The Godot process is registered on ``stack`` and terminated when the
+    stack closes. Uses extended timeouts and retry logic to handle parallel
+    execution scenarios where multiple Godot instances may be competing
+    for system resources.
+    """
+    if port is None:
+        port = get_playgodot_port()
 
     # Extended timeouts for parallel execution scenarios
     LAUNCH_TIMEOUT = 90.0
@@ -227,46 +292,77 @@ async def game():
     SCENE_TIMEOUT = 90.0
     MAX_RETRIES = 2
 
-    last_error = None
-
     for attempt in range(MAX_RETRIES + 1):
+        attempt_stack = AsyncExitStack()
         try:
-            async with Godot.launch(
-                str(GODOT_PROJECT),
+            g = await attempt_stack.enter_async_context(launch_godot(
+                GODOT_PROJECT,
                 headless=True,
                 resolution=(720, 1280),
                 timeout=LAUNCH_TIMEOUT,
                 godot_path=GODOT_PATH,
                 port=port,
-            ) as g:
-                # Wait for main menu to load first
-                await g.wait_for_node("/root/MainMenu", timeout=MENU_TIMEOUT)
-                await asyncio.sleep(0.5)
-
-                # Send the scene change command. We don't wait for
-                # automation:scene_changed because on CI the scene initialization
-                # (400-node block pool, 300-instance MultiMesh sparkle pool)
-                # floods the debug protocol with messages, preventing the
-                # scene_changed response from arriving within any reasonable timeout.
-                # Instead, we fire-and-forget the command, then poll for /root/Main.
-                try:
-                    await g._client.send("change_scene", {"path": "res://scenes/test_level.tscn"}, timeout=5.0)
-                except pg_exc.TimeoutError:
-                    # Expected: scene_changed may not arrive due to protocol flooding.
-                    # We'll verify the scene loaded by waiting for /root/Main below.
-                    pass
-
-                # Wait for game scene to load - poll until /root/Main exists.
-                # This works even if automation:scene_changed was never received.
-                await g.wait_for_node("/root/Main", timeout=SCENE_TIMEOUT)
-                yield g
-                return  # Success - exit the retry loop
-        except Exception as e:
-            last_error = e
-            if attempt < MAX_RETRIES:
-                # Wait before retry to let system resources free up
-                await asyncio.sleep(2.0)
-                # Get a new port in case of port conflicts
-                port = get_free_port()
-            else:
-                raise last_error
+            ))
+            # Wait for main menu to load first
+            await g.wait_for_node("/root/MainMenu", timeout=MENU_TIMEOUT)
+            await asyncio.sleep(0.5)
+
+            await change_to_test_level(g, SCENE_TIMEOUT)
+            await capture_baseline(g)
+            stack.push_async_exit(attempt_stack)
+            return g
+        except Exception:
+            await attempt_stack.aclose()
+            if attempt >= MAX_RETRIES:
+                raise
+            # Wait before retry to let system resources free up
+            await asyncio.sleep(2.0)
+            # Get a new port in case of port conflicts
+            port = get_free_port()
+
+
+async def reset_game(g) -> None:
+    """Return a used instance to a clean test_level state without relaunching.
+
+    Restores the baseline captured after launch in a single round-trip.
+    If the test replaced the scene (so there is no baseline) the reset
+    fails and the pool relaunches the instance instead.
+    """
+    if not await reset_state(g):
+        raise RuntimeError("test_level has no reset baseline (scene was replaced)")
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def godot_pool():
+    """Per-worker pool of warm game instances (None when GODIG_POOL_SIZE=0)."""
+    size = get_pool_size()
+    if size <= 0:
+        yield None
+        return
+
+    async def launch(stack: AsyncExitStack, slot: int):
+        # Slot 0 keeps the worker's well-known port; extra slots need their own.
+        return await launch_game(stack, get_playgodot_port() if slot == 0 else get_free_port())
+
+    pool = GodotPool(launch=launch, reset=reset_game, size=size, max_leases=get_max_leases())
+    yield pool
+    await pool.aclose()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def game(request, godot_pool):
+    """Yield a Godot connection on a clean test level scene.
+
+    Leases a warm instance from the worker's pool. Tests marked
+    ``@pytest.mark.cold_godot`` (or runs with GODIG_POOL_SIZE=0) launch a
+    fresh Godot process instead.
+    """
+    if godot_pool is None or request.node.get_closest_marker("cold_godot"):
+        async with AsyncExitStack() as stack:
+            # The worker's port may be held by a pooled instance.
+            port = get_free_port() if godot_pool is not None else None
+            yield await launch_game(stack, port)
+        return
+
+    async with godot_pool.lease() as g:
+        yield g
@@ -0,0 +1,189 @@
+"""
+Warm Godot instance pool for the PlayGodot `game` fixture.
+
+Launching Godot, waiting for the main menu and loading test_level.tscn
+dominates the wall clock of the test suite. Instead of relaunching for every
+test, each pytest process (the controller, or each pytest-xdist worker) keeps
+a small pool of already-launched instances. A test leases an instance, and
+when the test finishes the instance is reset back to a clean test_level state
+in the background and returned to the pool.
+
+Tests that genuinely need a fresh process opt out with::
+
+    @pytest.mark.cold_godot
+
+Configuration (environment variables):
+    GODIG_POOL_SIZE        Warm instances per worker (default 2, 0 disables the pool)
+    GODIG_POOL_MAX_LEASES  Leases before an instance is recycled (default 50)
+"""
+import asyncio
+import os
+import warnings
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional
+
+
+# Default number of warm instances per worker. Two lets one instance reset in
+# the background while the next test runs on the other.
+DEFAULT_POOL_SIZE = 2
+
+# Recycle an instance after this many leases to bound slow leaks (orphaned
+# nodes, growing autoload dictionaries) that a reset can't undo.
+DEFAULT_MAX_LEASES = 50
+
+
+def get_pool_size() -> int:
+    """Number of warm instances to keep per worker (0 disables pooling)."""
+    return int(os.environ.get("GODIG_POOL_SIZE", DEFAULT_POOL_SIZE))
+
+
+def get_max_leases() -> int:
+    """Number of leases before an instance is relaunched."""
+    return int(os.environ.get("GODIG_POOL_MAX_LEASES", DEFAULT_MAX_LEASES))
+
+
+@dataclass(eq=False)
+class PooledInstance:
+    """A launched Godot instance owned by the pool."""
+    game: Any
+    stack: AsyncExitStack
+    slot: int
+    leases: int = 0
+
+    @property
+    def alive(self) -> bool:
+        """True while the Godot process is running and connected."""
+        process = getattr(self.game, "_process", None)
+        if process is not None and process.poll() is not None:
+            return False
+        return self.game._client.is_connected
+
+    async def close(self) -> None:
+        """Terminate the Godot process and close the connection."""
+        try:
+            await self.stack.aclose()
+        except Exception:
+            pass
+
+
+@dataclass
+class LaunchFailure:
+    """A slot whose instance failed to launch, queued in its place."""
+    slot: int
+    error: Exception
+
+
+@dataclass
+class GodotPool:
+    """Pool of warm Godot instances leased to tests one at a time.
+
+    Args:
+        launch: Coroutine ``launch(stack, slot)`` that launches Godot, loads
+            test_level and registers cleanup on ``stack``.
+        reset: Coroutine ``reset(game)`` that returns a used instance to a
+            clean test_level state. Raising marks the instance as broken.
+        size: Number of warm instances to keep.
+        max_leases: Leases before an instance is relaunched.
+    """
+    launch: Callable[[AsyncExitStack, int], Awaitable[Any]]
+    reset: Callable[[Any], Awaitable[None]]
+    size: int = DEFAULT_POOL_SIZE
+    max_leases: int = DEFAULT_MAX_LEASES
+    _ready: Optional[asyncio.Queue] = field(default=None, init=False)
+    _tasks: set = field(default_factory=set, init=False)
+    _instances: set = field(default_factory=set, init=False)
+    _closed: bool = field(default=False, init=False)
+
+    def _ensure_started(self) -> None:
+        """Start warming instances on first use.
+
+        Deferred until the first lease so runs that only use `main_menu`
+        never launch a pooled instance.
+        """
+        if self._ready is not None:
+            return
+        self._ready = asyncio.Queue()
+        for slot in range(self.size):
+            self._spawn(self._warm(slot))
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _warm(self, slot: int) -> None:
+        """Launch a new instance and make it available for leasing.
+
+        Launch failures are queued too, so the waiting test fails with the
+        real error instead of hanging.
+        """
+        stack = AsyncExitStack()
+        try:
+            game = await self.launch(stack, slot)
+        except Exception as e:
+            await stack.aclose()
+            await self._ready.put(LaunchFailure(slot, e))
+            return
+        instance = PooledInstance(game=game, stack=stack, slot=slot)
+        if self._closed:
+            await instance.close()
+            return
+        self._instances.add(instance)
+        await self._ready.put(instance)
+
+    async def _discard(self, instance: PooledInstance) -> None:
+        self._instances.discard(instance)
+        await instance.close()
+
+    async def _recycle(self, instance: PooledInstance) -> None:
+        """Reset a returned instance, or replace it if it can't be reused."""
+        if not self._closed and instance.alive and instance.leases < self.max_leases:
+            try:
+                await self.reset(instance.game)
+            except Exception as e:
+                warnings.warn(
+                    f"Godot pool reset failed on slot {instance.slot}, relaunching: {e}",
+                    RuntimeWarning,
+                )
+            else:
+                await self._ready.put(instance)
+                return
+
+        await self._discard(instance)
+        if not self._closed:
+            await self._warm(instance.slot)
+
+    @asynccontextmanager
+    async def lease(self):
+        """Lease a warm instance for the duration of one test."""
+        self._ensure_started()
+
+        while True:
+            item = await self._ready.get()
+            if isinstance(item, LaunchFailure):
+                # Relaunch the failed slot to keep the pool at full size.
+                self._spawn(self._warm(item.slot))
+                raise item.error
+            if item.alive:
+                break
+            await self._discard(item)
+            self._spawn(self._warm(item.slot))
+
+        item.leases += 1
+        try:
+            yield item.game
+        finally:
+            self._spawn(self._recycle(item))
+
+    async def aclose(self) -> None:
+        """Shut down every pooled instance."""
+        self._closed = True
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        # Covers queued instances as well as ones whose reset was cancelled.
+        for instance in list(self._instances):
+            await self._discard(instance)
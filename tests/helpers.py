@@ -121,15 +121,26 @@ PATHS = {
     "depth_bonus_label": "/root/Main/UI/HUD/DepthBonusLabel",
     "copy_logs_button": "/root/Main/PauseMenu/Panel/VBox/CopyLogsButton",
     "inventory_panel": "/root/Main/UI/InventoryPanel",
+    "playgodot_server": "/root/PlayGodotServer",
 }
 
 
 # =============================================================================
 # WAIT HELPERS
 # =============================================================================
+# Polling backoff for wait_for_condition (seconds). Starts short so fast
+# conditions return quickly, then backs off to limit round-trips.
+POLL_INTERVAL_MIN = 0.01
+POLL_INTERVAL_MAX = 0.1
+
+
 async def wait_for_condition(game, check_fn, timeout=WAIT_TIMEOUT):
     """Wait for a condition function to return True with timeout.
 
+    Polls with a short, growing interval. Prefer wait_for_property,
+    wait_for_node or wait_for_signal when the condition is a single property,
+    node or signal - those are pushed by the game instead of polled.
+
     Args:
         game: The PlayGodot game instance
         check_fn: Async function that returns True when condition is met
@@ -138,13 +149,65 @@ async def wait_for_condition(game, check_fn, timeout=WAIT_TIMEOUT):
     Returns:
         True if condition was met, False if timeout
     """
-    elapsed = 0
-    while elapsed < timeout:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    interval = POLL_INTERVAL_MIN
+    while True:
         if await check_fn():
             return True
-        await asyncio.sleep(0.1)
-        elapsed += 0.1
-    return False
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(interval, remaining))
+        interval = min(interval * 2, POLL_INTERVAL_MAX)
+
+
+async def _wait_for_watch(game, method, args, timeout):
+    """Register a PlayGodotServer watch and wait for it to trigger.
+
+    The server emits watch_triggered every frame while the watch holds, so
+    the wait can't miss a condition that became true before it was armed.
+
+    Returns:
+        (True, value) when triggered, (False, None) on timeout, or None if
+        the watch couldn't be registered (caller should fall back to polling)
+    """
+    server = PATHS["playgodot_server"]
+    try:
+        watch_id = await game.call(server, method, args)
+    except Exception:
+        return None
+    if watch_id is None or watch_id < 0:
+        return None
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    try:
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False, None
+            try:
+                result = await game._client.send(
+                    "wait_signal",
+                    {
+                        "signal": "watch_triggered",
+                        "source": server,
+                        "timeout": max(1, int(remaining * 1000)),
+                    },
+                    timeout=remaining + 5.0,
+                )
+            except Exception:
+                return False, None
+            # Other watches may be triggering concurrently
+            args_out = (result or {}).get("args") or []
+            if args_out and args_out[0] == watch_id:
+                return True, args_out[1] if len(args_out) > 1 else None
+    finally:
+        try:
+            await game.call(server, "clear_watch", [watch_id])
+        except Exception:
+            pass
 
 
 async def wait_for_node(game, path, timeout=WAIT_TIMEOUT):
@@ -158,8 +221,200 @@ async def wait_for_node(game, path, timeout=WAIT_TIMEOUT):
     Returns:
         True if node exists, False if timeout
     """
+    watched = await _wait_for_watch(game, "watch_node", [path], timeout)
+    if watched is not None:
+        return watched[0]
+
     async def node_exists():
         result = await game.node_exists(path)
         return result.get("exists", False)
 
     return await wait_for_condition(game, node_exists, timeout)
+
+
+async def wait_for_property(game, path, prop, expected, timeout=WAIT_TIMEOUT):
+    """Wait for a node property to equal an expected value.
+
+    The comparison runs in the game every frame, so this returns within a
+    frame of the change and costs no polling round-trips.
+
+    Args:
+        game: The PlayGodot game instance
+        path: Node path (or PATHS key)
+        prop: Property name
+        expected: Value to wait for (ints and floats compare equal)
+        timeout: Maximum wait time in seconds
+
+    Returns:
+        True if the property reached the value, False if timeout
+    """
+    path = PATHS.get(path, path)
+    watched = await _wait_for_watch(game, "watch_property", [path, prop, expected], timeout)
+    if watched is not None:
+        return watched[0]
+
+    async def property_matches():
+        return await game.get_property(path, prop) == expected
+
+    return await wait_for_condition(game, property_matches, timeout)
+
+
+async def wait_for_signal(game, path, signal_name, timeout=WAIT_TIMEOUT):
+    """Wait for a node to emit a signal.
+
+    Only emissions after the call are seen, so start the wait before
+    triggering the action (e.g. with asyncio.create_task).
+
+    Args:
+        game: The PlayGodot game instance
+        path: Node path (or PATHS key) of the emitter
+        signal_name: Signal to wait for
+        timeout: Maximum wait time in seconds
+
+    Returns:
+        List of signal arguments, or None if timeout
+    """
+    path = PATHS.get(path, path)
+    watched = await _wait_for_watch(game, "watch_signal", [path, signal_name], timeout)
+    if watched is not None:
+        triggered, args = watched
+        return list(args or []) if triggered else None
+
+    try:
+        result = await game.wait_for_signal(signal_name, source=path, timeout=timeout)
+    except Exception:
+        return None
+    return list((result or {}).get("args") or [])
+
+
+# =============================================================================
+# BATCHED QUERIES
+# =============================================================================
+class QueryBatch:
+    """Collect property reads and method calls and send them in one round-trip.
+
+    Paths may be PATHS keys or absolute node paths. Each queued operation is
+    stored under a key (by default "<path key>.<property>" or
+    "<path key>.<method>()"), and run() returns a dict of key -> value.
+
+    Example:
+        batch = QueryBatch(game)
+        batch.get_property("game_manager", "coins")
+        batch.get_property("game_manager", "current_depth")
+        batch.call("inventory_manager", "get_used_slots")
+        results = await batch.run()
+        assert results["game_manager.coins"] == 0
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.errors = {}
+        self._keys = []
+        self._requests = []
+
+    def _add(self, key, request):
+        self._keys.append(key)
+        self._requests.append(request)
+        return self
+
+    def get_property(self, path, prop, key=None):
+        """Queue a property read."""
+        return self._add(
+            key or f"{path}.{prop}",
+            {"op": "get_property", "path": PATHS.get(path, path), "property": prop},
+        )
+
+    def set_property(self, path, prop, value, key=None):
+        """Queue a property write (result is True on success)."""
+        return self._add(
+            key or f"{path}.{prop}=",
+            {"op": "set_property", "path": PATHS.get(path, path), "property": prop, "value": value},
+        )
+
+    def call(self, path, method, args=None, key=None):
+        """Queue a method call."""
+        return self._add(
+            key or f"{path}.{method}()",
+            {"op": "call_method", "path": PATHS.get(path, path), "method": method, "args": args or []},
+        )
+
+    def node_exists(self, path, key=None):
+        """Queue an existence check (result is a bool)."""
+        return self._add(
+            key or f"{path}?",
+            {"op": "node_exists", "path": PATHS.get(path, path)},
+        )
+
+    async def run(self):
+        """Send every queued operation in a single request.
+
+        Returns:
+            Dict of key -> value. Failed operations map to None and their
+            messages are recorded in self.errors.
+        """
+        if not self._requests:
+            return {}
+
+        results = await self.game.call(PATHS["playgodot_server"], "batch", [self._requests])
+
+        values = {}
+        self.errors = {}
+        for key, result in zip(self._keys, results or []):
+            if "error" in result:
+                self.errors[key] = result["error"]
+                values[key] = None
+            else:
+                values[key] = result.get("value")
+        return values
+
+
+async def get_properties(game, path, props):
+    """Read several properties of one node in a single round-trip.
+
+    Args:
+        game: The PlayGodot game instance
+        path: PATHS key or node path
+        props: Property names to read
+
+    Returns:
+        Dict of property name -> value
+    """
+    batch = QueryBatch(game)
+    for prop in props:
+        batch.get_property(path, prop, key=prop)
+    return await batch.run()
+
+
+# =============================================================================
+# STATE RESET
+# =============================================================================
+async def capture_baseline(game):
+    """Snapshot the freshly loaded test level as the baseline for reset_state().
+
+    Args:
+        game: The PlayGodot game instance (on test_level)
+    """
+    await game._client.send(
+        "call_method",
+        {"path": PATHS["main"], "method": "test_capture_baseline", "args": []},
+    )
+
+
+async def reset_state(game):
+    """Restore autoloads, the player and DirtGrid to the captured baseline.
+
+    Runs in-process (test_level.gd test_reset_state), so it costs a single
+    round-trip instead of a scene reload or a Godot relaunch.
+
+    Args:
+        game: The PlayGodot game instance (on test_level)
+
+    Returns:
+        True if the state was reset, False if no baseline was captured
+    """
+    result = await game._client.send(
+        "call_method",
+        {"path": PATHS["main"], "method": "test_reset_state", "args": []},
+    )
+    value = (result or {}).get("value") or {}
+    return bool(value.get("success", False))
@@ -0,0 +1,196 @@
+"""
+Duration-aware pytest-xdist scheduling for the PlayGodot suite.
+
+pytest-xdist's default `load` mode hands tests out in collection order, so a
+worker can end up with test_mining.py and test_game_manager.py while another
+only runs quick existence checks. This module:
+
+1. Records how long every test takes (setup + call + teardown) and which
+   Godot fixture it uses into the pytest cache (.pytest_cache, key
+   `godig/durations`), along with per-module totals used to estimate tests
+   that have never run.
+2. Packs tests onto workers longest-processing-time-first (LPT), preferring a
+   worker that already runs the same fixture type (`main_menu` vs `game`) so
+   workers that never lease from the Godot pool never start one.
+3. Orders tests by fixture type, keeping `game` tests together so they run
+   back-to-back on warm pooled instances.
+
+conftest.py enables this for `-n` runs without an explicit `--dist`; pass
+any `--dist` mode to opt out.
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+import pytest
+from xdist.scheduler import LoadScopeScheduling
+
+
+CACHE_KEY = "godig/durations"
+
+# Weight of the newest run when smoothing recorded durations (0-1).
+SMOOTHING = 0.5
+
+# Estimate for tests with no history in a module with no history (seconds).
+DEFAULT_DURATION = 5.0
+
+# Fixture types, in the order they run on each worker. `main_menu` tests
+# launch their own Godot, `game` tests lease warm instances from the pool.
+FIXTURE_KINDS = ("none", "main_menu", "game")
+
+
+def module_of(nodeid: str) -> str:
+    """Module path of a nodeid (e.g. tests/test_mining.py)."""
+    return nodeid.split("::", 1)[0]
+
+
+# Set by conftest.py when the duration-aware scheduler should be used.
+DURATION_SCHEDULE = pytest.StashKey[bool]()
+
+
+def fixture_kind(item: pytest.Item) -> str:
+    """Classify a test by the Godot fixture it uses."""
+    names = getattr(item, "fixturenames", ())
+    if "game" in names:
+        return "game"
+    if "main_menu" in names:
+        return "main_menu"
+    return "none"
+
+
+class DurationRecorder:
+    """Collects per-test durations during a run and merges them into the cache.
+
+    Registered only on the controller (or a plain non-xdist run), where
+    pytest-xdist forwards every worker report to pytest_runtest_logreport.
+    """
+
+    def __init__(self, config: pytest.Config):
+        self.config = config
+        self.durations: Dict[str, float] = defaultdict(float)
+        self.kinds: Dict[str, str] = {}
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        self.durations[report.nodeid] += report.duration
+        for name, value in report.user_properties:
+            if name == "fixture_kind":
+                self.kinds[report.nodeid] = value
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        if not self.durations or self.config.cache is None:
+            return
+        data = merge_durations(load_durations(self.config), self.durations, self.kinds)
+        self.config.cache.set(CACHE_KEY, data)
+
+
+def load_durations(config: pytest.Config) -> dict:
+    """Read recorded durations.
+
+    Returns:
+        {"tests": {nodeid: seconds}, "kinds": {nodeid: fixture kind},
+        "modules": {path: {"total": seconds, "count": n}}}
+    """
+    data = config.cache.get(CACHE_KEY, None) if config.cache is not None else None
+    if not isinstance(data, dict):
+        data = {}
+    for key in ("tests", "kinds", "modules"):
+        data.setdefault(key, {})
+    return data
+
+
+def merge_durations(data: dict, durations: Dict[str, float], kinds: Dict[str, str]) -> dict:
+    """Blend this run's durations into the recorded ones and rebuild module totals."""
+    tests = dict(data["tests"])
+    for nodeid, duration in durations.items():
+        previous = tests.get(nodeid)
+        if previous is None:
+            tests[nodeid] = round(duration, 3)
+        else:
+            tests[nodeid] = round(previous + SMOOTHING * (duration - previous), 3)
+
+    modules: Dict[str, dict] = {}
+    for nodeid, duration in tests.items():
+        entry = modules.setdefault(module_of(nodeid), {"total": 0.0, "count": 0})
+        entry["total"] = round(entry["total"] + duration, 3)
+        entry["count"] += 1
+
+    return {"tests": tests, "kinds": {**data["kinds"], **kinds}, "modules": modules}
+
+
+def estimate(nodeid: str, data: dict) -> float:
+    """Expected duration of a test: its own history, its module's mean, or a default."""
+    if nodeid in data["tests"]:
+        return data["tests"][nodeid]
+    module = data["modules"].get(module_of(nodeid))
+    if module and module["count"]:
+        return module["total"] / module["count"]
+    return DEFAULT_DURATION
+
+
+def pack(jobs: Iterable[tuple], workers: int) -> List[int]:
+    """Assign (duration, kind) jobs to workers, longest first.
+
+    Each job goes to the least-loaded worker, unless a worker already running
+    the same fixture kind (or an empty one) can take it without ending up
+    more loaded than the least-loaded worker would after taking the job.
+
+    Returns:
+        Worker index for each job, in input order
+    """
+    jobs = list(jobs)
+    order = sorted(range(len(jobs)), key=lambda i: (-jobs[i][0], i))
+    loads = [0.0] * workers
+    kinds: List[set] = [set() for _ in range(workers)]
+    assignment: List[Optional[int]] = [None] * len(jobs)
+
+    for i in order:
+        duration, kind = jobs[i]
+        least = min(range(workers), key=lambda w: (loads[w], w))
+        limit = loads[least] + duration
+        candidates = [
+            w for w in range(workers)
+            if kinds[w] <= {kind} and loads[w] + duration <= limit
+        ]
+        best = min(candidates, key=lambda w: (kinds[w] != {kind}, loads[w], w), default=least)
+
+        loads[best] += duration
+        kinds[best].add(kind)
+        assignment[i] = best
+
+    return assignment
+
+
+def order_by_fixture(items: List[pytest.Item]) -> None:
+    """Stable-sort items by fixture kind and tag them for DurationRecorder.
+
+    Every worker applies the same order, so xdist still sees identical
+    collections, and each worker runs its `game` tests back-to-back.
+    """
+    kind_rank = {kind: i for i, kind in enumerate(FIXTURE_KINDS)}
+    for item in items:
+        item.user_properties.append(("fixture_kind", fixture_kind(item)))
+    items.sort(key=lambda item: kind_rank[fixture_kind(item)])
+
+
+class DurationScheduling(LoadScopeScheduling):
+    """xdist scheduler that sends one LPT-packed bucket of tests to each worker.
+
+    Buckets are computed on the controller from the final (post-deselection)
+    collection and the recorded durations, then handed to LoadScopeScheduling
+    as scopes. Tests within a bucket run in collection order.
+    """
+
+    def __init__(self, config: pytest.Config, log=None):
+        super().__init__(config, log)
+        self.buckets: Dict[str, str] = {}
+
+    def schedule(self) -> None:
+        if self.collection is None and self.collection_is_completed:
+            collection = next(iter(self.registered_collections.values()), [])
+            data = load_durations(self.config)
+            jobs = [(estimate(nodeid, data), data["kinds"].get(nodeid, "none")) for nodeid in collection]
+            assignment = pack(jobs, len(self.nodes))
+            self.buckets = {nodeid: f"worker{w}" for nodeid, w in zip(collection, assignment)}
+        super().schedule()
+
+    def _split_scope(self, nodeid: str) -> str:
+        return self.buckets.get(nodeid, nodeid)
@@ -0,0 +1,61 @@
+"""
+Incremental asset build tests for GoDig.
+
+scripts/tools/build_assets.py rebuilds generated art only when a target's
+fingerprint (inputs, arguments, generator code and data) changes. These
+tests build a copy of the tools and resources in a fresh process and check
+a second cold process finds every target up to date, so fingerprints can't
+depend on state left behind by targets that already ran.
+"""
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("PIL")
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Runs the build graph once and prints the names of the rebuilt targets
+BUILD_SCRIPT = """
+import json, sys
+from pathlib import Path
+sys.path.insert(0, sys.argv[1])
+from build_assets import load_graph
+rebuilt = load_graph(Path(sys.argv[2])).build()
+print(json.dumps(rebuilt))
+"""
+
+
+def _copy_project(root: Path) -> Path:
+    """Copy what the generators read and write; returns the tools directory."""
+    ignore = shutil.ignore_patterns(".cache", "__pycache__", "*.import")
+    for name in ("scripts", "resources"):
+        shutil.copytree(PROJECT_ROOT / name, root / name, ignore=ignore)
+    shutil.copy2(PROJECT_ROOT / "project.godot", root / "project.godot")
+    return root / "scripts" / "tools"
+
+
+def _build(tools_dir: Path, state_file: Path) -> list[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", BUILD_SCRIPT, str(tools_dir), str(state_file)],
+        capture_output=True, text=True, timeout=600,
+    )
+    assert result.returncode == 0, f"Build failed:\n{result.stdout}\n{result.stderr}"
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_second_cold_build_rebuilds_nothing(tmp_path):
+    """A build followed by a fresh process should leave nothing stale."""
+    tools_dir = _copy_project(tmp_path / "project")
+    state_file = tmp_path / "build_graph.json"
+
+    first = _build(tools_dir, state_file)
+    assert first, "First build should build every target"
+
+    second = _build(tools_dir, state_file)
+    assert second == [], f"Second build rebuilt up-to-date targets: {second}"
@@ -0,0 +1,67 @@
+"""
+Chunk generation throughput benchmarks for GoDig.
+
+Compares ThreadedChunkGenerator.generate_chunk_async against the synchronous
+DirtGrid._generate_chunk path. scripts/test/chunk_benchmark.gd loads a block
+of chunks at several depths in each mode and reports chunks/sec, per-chunk
+latency and the generator's pending queue depth over time. Results are
+compared against benchmark_baselines.json (see benchmarking.py).
+
+Opt-in (slow): GODIG_BENCHMARKS=1 pytest tests/test_chunk_benchmarks.py -v
+"""
+import pytest
+from benchmarking import benchmarks_enabled, check_baseline, summarize
+from helpers import PATHS, wait_for_property
+
+
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.cold_godot,
+    pytest.mark.skipif(not benchmarks_enabled(), reason="Set GODIG_BENCHMARKS=1 to run benchmarks"),
+]
+
+BENCHMARK_PATH = "/root/Main/ChunkBenchmark"
+
+# Depths below the surface: shallow dirt, caves at full density, deep ores
+DEPTHS = [0, 150, 650]
+
+# Chunks per run (N x M block)
+WIDTH = 4
+HEIGHT = 4
+
+
+async def run_chunk_benchmark(game):
+    """Run the chunk benchmark once and return its per-run results."""
+    started = await game.call(PATHS["main"], "test_start_chunk_benchmark", [DEPTHS, WIDTH, HEIGHT])
+    assert started, "Chunk benchmark failed to start"
+
+    finished = await wait_for_property(game, BENCHMARK_PATH, "done", True, timeout=180.0)
+    assert finished, "Chunk benchmark did not finish"
+    return await game.call(PATHS["main"], "test_get_chunk_benchmark_results")
+
+
+@pytest.mark.asyncio
+async def test_chunk_generation_throughput(game):
+    """Chunks/sec, latency percentiles and queue depth should stay within tolerance of baseline."""
+    chunk_results = await run_chunk_benchmark(game)
+    assert len(chunk_results) == len(DEPTHS) * 2, "Expected a sync and a threaded run per depth"
+
+    regressions = []
+    for run in chunk_results:
+        name = f"{run['mode']}_depth{run['depth']}"
+        assert run["completed"] == run["chunks"], (
+            f"{name}: only {run['completed']}/{run['chunks']} chunks completed"
+        )
+
+        queue = [depth for _elapsed, depth in run["queue_depth"]]
+        metrics = {
+            "chunks_per_sec": round(run["chunks_per_sec"], 1),
+            **summarize(run["latencies_ms"], prefix="latency_ms_"),
+            "queue_depth_max": max(queue, default=0),
+        }
+        print(f"[benchmark] {name}: {metrics}")
+        regressions += check_baseline(
+            "chunk_generation", name, metrics, higher_is_better=["chunks_per_sec"]
+        )
+
+    assert not regressions, "Chunk generation regression:\n" + "\n".join(regressions)
@@ -0,0 +1,63 @@
+"""
+Chunk save format tests for GoDig.
+
+scripts/tools/godot_variant.py reimplements Godot's Variant binary
+serialization so SaveManager chunk files (FileAccess.store_var) can be read
+and written offline by scripts/tools/chunk_saves.py. These tests have the
+running game store sample values (test_level.gd test_store_var_samples) and
+check the codec decodes each file and re-encodes it byte for byte.
+"""
+import base64
+import sys
+from pathlib import Path
+
+import pytest
+from helpers import PATHS
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts" / "tools"))
+from chunk_saves import dug_tiles  # noqa: E402
+from godot_variant import (  # noqa: E402
+    Color, PackedInt32Array, PackedStringArray, StringName, Vector2, Vector2i, decode, encode,
+)
+
+
+# Same order as test_store_var_samples
+EXPECTED = [
+    None, True, 7, -(1 << 40), 0.5, 0.1, "grün", StringName("ore"),
+    Vector2i(3, -4), Vector2(1.5, -2.0), Color(1.0, 0.5, 0.0, 1.0),
+    [1, "x", [2.0]], {Vector2i(1, 2): "a", "n": 3},
+    b"\x01\x02\x03", PackedInt32Array([-1, 65536]), PackedStringArray(["a", "bc"]),
+    {"0,5": True, "0,6": True, "1,5": True},
+]
+
+
+async def _stored_samples(game) -> list[bytes]:
+    encoded = await game.call(PATHS["main"], "test_store_var_samples")
+    assert len(encoded) == len(EXPECTED), "Could not write the sample file"
+    return [base64.b64decode(data) for data in encoded]
+
+
+@pytest.mark.asyncio
+async def test_codec_decodes_game_files(game):
+    """Every value the game stores should decode to the same Python value."""
+    for data, expected in zip(await _stored_samples(game), EXPECTED):
+        length = int.from_bytes(data[:4], "little")
+        assert length == len(data) - 4, "store_var should prefix the Variant with its length"
+        value = decode(data[4:], allow_objects=True)
+        assert value == expected and type(value) is type(expected), (
+            f"Decoded {value!r}, expected {expected!r}"
+        )
+
+
+@pytest.mark.asyncio
+async def test_codec_encodes_like_the_game(game):
+    """Re-encoding each value should reproduce the game's bytes exactly."""
+    for data, expected in zip(await _stored_samples(game), EXPECTED):
+        assert encode(expected, full_objects=True) == data[4:], f"Encoding of {expected!r} differs"
+
+
+@pytest.mark.asyncio
+async def test_chunk_dictionary_tiles(game):
+    """A chunk's modified_tiles should parse into its dug world tiles."""
+    data = (await _stored_samples(game))[-1]
+    assert dug_tiles(decode(data[4:], allow_objects=True)) == [(0, 5), (0, 6), (1, 5)]
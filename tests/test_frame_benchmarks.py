@@ -0,0 +1,61 @@
+"""
+Frame-time benchmarks for GoDig.
+
+Each scenario is driven in-game by scripts/test/frame_benchmark.gd: the
+player advances one tile per frame along a fixed route, clearing blocks as
+it goes, while PerformanceMonitor.get_stats() is sampled every frame.
+Results are compared against benchmark_baselines.json (see benchmarking.py).
+
+Opt-in (slow): GODIG_BENCHMARKS=1 pytest tests/test_frame_benchmarks.py -v
+"""
+import pytest
+from benchmarking import benchmarks_enabled, check_baseline, summarize
+from helpers import PATHS, wait_for_property
+
+
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.cold_godot,  # Fresh process: no state carried over from other tests
+    pytest.mark.skipif(not benchmarks_enabled(), reason="Set GODIG_BENCHMARKS=1 to run benchmarks"),
+]
+
+BENCHMARK_PATH = "/root/Main/FrameBenchmark"
+
+# Tiles travelled per scenario (one tile per frame)
+SCENARIO_STEPS = {
+    "deep_shaft": 600,
+    "long_tunnel": 400,
+    "cave_dense": 400,
+    "ore_dense": 400,
+}
+
+
+async def run_benchmark(game, scenario, steps):
+    """Run a scenario in-game and return its raw result dictionary."""
+    started = await game.call(PATHS["main"], "test_start_benchmark", [scenario, steps])
+    assert started, f"Benchmark scenario '{scenario}' failed to start"
+
+    # Headless frames are uncapped, but allow for slow CI machines
+    finished = await wait_for_property(game, BENCHMARK_PATH, "done", True, timeout=30.0 + steps * 0.1)
+    assert finished, f"Benchmark scenario '{scenario}' did not finish"
+    return await game.call(PATHS["main"], "test_get_benchmark_result")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("scenario", list(SCENARIO_STEPS))
+async def test_frame_time(game, scenario):
+    """Frame-time percentiles, spikes and memory should stay within tolerance of baseline."""
+    result = await run_benchmark(game, scenario, SCENARIO_STEPS[scenario])
+    frame_times = result["frame_times_ms"]
+    assert len(frame_times) >= SCENARIO_STEPS[scenario], "Every step should produce a frame sample"
+
+    metrics = {
+        **summarize(frame_times, prefix="frame_ms_"),
+        "frame_spikes": result["frame_spikes"],
+        "chunks_loaded_max": result["chunks_loaded_max"],
+        "memory_peak_mb": round(result["memory_peak_mb"], 1),
+    }
+    print(f"[benchmark] {scenario}: {metrics}")
+
+    regressions = check_baseline("frame_time", scenario, metrics)
+    assert not regressions, "Frame-time regression:\n" + "\n".join(regressions)
@@ -9,7 +9,7 @@ Tests verify that PerformanceMonitor:
 5. Returns valid statistics
 """
 import pytest
-from helpers import PATHS
+from helpers import PATHS, QueryBatch, get_properties
 
 
 # Path to performance monitor
@@ -393,17 +393,18 @@ async def test_low_preset_has_smallest_chunk_radius(game):
     # Save current preset
     original = await game.get_property(PERFORMANCE_PATH, "quality_preset")
 
-    # Set to LOW and get chunk radius
-    await game.call(PERFORMANCE_PATH, "set_quality_preset", [0])  # LOW
-    low_radius = await game.call(PERFORMANCE_PATH, "get_chunk_radius")
-
-    # Set to ULTRA and get chunk radius
-    await game.call(PERFORMANCE_PATH, "set_quality_preset", [3])  # ULTRA
-    ultra_radius = await game.call(PERFORMANCE_PATH, "get_chunk_radius")
-
-    # Restore original
-    await game.call(PERFORMANCE_PATH, "set_quality_preset", [original])
-
+    # Set LOW, read radius, set ULTRA, read radius, restore - one round-trip
+    batch = QueryBatch(game)
+    batch.call(PERFORMANCE_PATH, "set_quality_preset", [0], key="set_low")  # LOW
+    batch.call(PERFORMANCE_PATH, "get_chunk_radius", key="low")
+    batch.call(PERFORMANCE_PATH, "set_quality_preset", [3], key="set_ultra")  # ULTRA
+    batch.call(PERFORMANCE_PATH, "get_chunk_radius", key="ultra")
+    batch.call(PERFORMANCE_PATH, "set_quality_preset", [original], key="restore")
+    results = await batch.run()
+    assert not batch.errors, f"Batch should succeed, got errors: {batch.errors}"
+
+    low_radius = results["low"]
+    ultra_radius = results["ultra"]
     assert low_radius <= ultra_radius, f"LOW radius ({low_radius}) should be <= ULTRA ({ultra_radius})"
 
 
@@ -412,12 +413,34 @@ async def test_low_preset_has_smallest_sparkles(game):
     """LOW preset should have the fewest sparkles."""
     original = await game.get_property(PERFORMANCE_PATH, "quality_preset")
 
-    await game.call(PERFORMANCE_PATH, "set_quality_preset", [0])
-    low_sparkles = await game.call(PERFORMANCE_PATH, "get_max_sparkles")
+    batch = QueryBatch(game)
+    batch.call(PERFORMANCE_PATH, "set_quality_preset", [0], key="set_low")
+    batch.call(PERFORMANCE_PATH, "get_max_sparkles", key="low")
+    batch.call(PERFORMANCE_PATH, "set_quality_preset", [3], key="set_ultra")
+    batch.call(PERFORMANCE_PATH, "get_max_sparkles", key="ultra")
+    batch.call(PERFORMANCE_PATH, "set_quality_preset", [original], key="restore")
+    results = await batch.run()
+    assert not batch.errors, f"Batch should succeed, got errors: {batch.errors}"
+
+    low_sparkles = results["low"]
+    ultra_sparkles = results["ultra"]
+    assert low_sparkles <= ultra_sparkles, f"LOW sparkles ({low_sparkles}) should be <= ULTRA ({ultra_sparkles})"
 
-    await game.call(PERFORMANCE_PATH, "set_quality_preset", [3])
-    ultra_sparkles = await game.call(PERFORMANCE_PATH, "get_max_sparkles")
 
-    await game.call(PERFORMANCE_PATH, "set_quality_preset", [original])
+# =============================================================================
+# BATCHED METRICS TESTS
+# =============================================================================
 
-    assert low_sparkles <= ultra_sparkles, f"LOW sparkles ({low_sparkles}) should be <= ULTRA ({ultra_sparkles})"
+@pytest.mark.asyncio
+async def test_all_metrics_in_one_round_trip(game):
+    """All metric properties should be readable with a single batched request."""
+    props = [
+        "current_fps", "current_frame_time_ms", "average_fps", "min_fps", "max_fps",
+        "frame_spikes", "static_memory_mb", "dynamic_memory_mb", "peak_memory_mb",
+        "chunks_loaded", "chunks_pending", "active_sparkles",
+    ]
+    values = await get_properties(game, PERFORMANCE_PATH, props)
+
+    for prop in props:
+        assert values.get(prop) is not None, f"{prop} should exist"
+        assert isinstance(values[prop], (int, float)), f"{prop} should be number, got {type(values[prop])}"
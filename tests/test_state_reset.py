@@ -0,0 +1,47 @@
+"""
+In-process state reset tests for the PlayGodot harness.
+
+Verifies that test_level.gd test_reset_state() restores autoloads, the
+player and DirtGrid to the baseline captured after the scene loaded, so
+pooled Godot instances can be shared between tests.
+"""
+import pytest
+from helpers import PATHS, reset_state
+
+
+@pytest.mark.asyncio
+async def test_reset_state_reports_success(game):
+    """Reset should succeed on a freshly leased instance."""
+    assert await reset_state(game), "test_reset_state should succeed after baseline capture"
+
+
+@pytest.mark.asyncio
+async def test_reset_state_restores_coins(game):
+    """Coins added during a test should be gone after a reset."""
+    before = await game.call(PATHS["game_manager"], "get_coins")
+    await game.call(PATHS["game_manager"], "add_coins", [500])
+
+    assert await reset_state(game)
+    after = await game.call(PATHS["game_manager"], "get_coins")
+    assert after == before, f"Coins should reset to {before}, got {after}"
+
+
+@pytest.mark.asyncio
+async def test_reset_state_restores_inventory(game):
+    """Items added during a test should be gone after a reset."""
+    before = await game.call(PATHS["inventory_manager"], "get_used_slots")
+    await game.call(PATHS["inventory_manager"], "add_item_by_id", ["coal", 3])
+
+    assert await reset_state(game)
+    after = await game.call(PATHS["inventory_manager"], "get_used_slots")
+    assert after == before, f"Used slots should reset to {before}, got {after}"
+
+
+@pytest.mark.asyncio
+async def test_reset_state_restores_dug_tiles(game):
+    """Dig state in DirtGrid should be cleared by a reset."""
+    await game.call(PATHS["player"], "test_mine_direction", [0, 1])
+
+    assert await reset_state(game)
+    dug = await game.call(PATHS["dirt_grid"], "get_dug_tile_count")
+    assert dug == 0, f"DirtGrid should have no dug tiles after reset, got {dug}"
@@ -0,0 +1,43 @@
+"""
+Event-driven wait helper tests for the PlayGodot harness.
+
+Verifies that wait_for_property, wait_for_node and wait_for_signal are
+triggered by PlayGodotServer watches instead of fixed-interval polling.
+"""
+import asyncio
+
+import pytest
+from helpers import PATHS, wait_for_node, wait_for_property, wait_for_signal
+
+
+@pytest.mark.asyncio
+async def test_wait_for_property_sees_change(game):
+    """A property wait should return once the value changes."""
+    coins = await game.get_property(PATHS["game_manager"], "coins")
+    await game.call(PATHS["game_manager"], "add_coins", [25])
+
+    assert await wait_for_property(game, "game_manager", "coins", coins + 25)
+
+
+@pytest.mark.asyncio
+async def test_wait_for_property_times_out(game):
+    """A property wait should report a timeout for a value never reached."""
+    assert not await wait_for_property(game, "game_manager", "coins", -1, timeout=0.5)
+
+
+@pytest.mark.asyncio
+async def test_wait_for_existing_node(game):
+    """Waiting for a node that already exists should return immediately."""
+    assert await wait_for_node(game, PATHS["player"], timeout=1.0)
+
+
+@pytest.mark.asyncio
+async def test_wait_for_signal_returns_args(game):
+    """A signal wait should return the emitted arguments."""
+    coins = await game.get_property(PATHS["game_manager"], "coins")
+    waiter = asyncio.create_task(wait_for_signal(game, "game_manager", "coins_changed"))
+    await asyncio.sleep(0.2)  # Let the watch register before emitting
+    await game.call(PATHS["game_manager"], "add_coins", [10])
+
+    args = await waiter
+    assert args == [coins + 10], f"coins_changed should carry the new total, got {args}"
@@ -0,0 +1,46 @@
+"""
+World-generation parity tests for GoDig.
+
+scripts/tools/worldgen_sim.py reimplements ThreadedChunkGenerator's terrain
+pass in Python so ore and cave tuning can be surveyed offline. These tests
+export chunks from the running game (test_level.gd test_export_chunks,
+which calls generate_chunk_data without applying the result) and check the
+simulator reproduces every tile, cave, vein block and near-ore mark.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+from helpers import PATHS
+
+pytest.importorskip("numpy")
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts" / "tools"))
+from worldgen_sim import check_parity, load_world  # noqa: E402
+
+
+# Chunk coordinates: the surface row, negative x, cave depths, a layer
+# transition, deep ores and gems, void depths and a far-off column
+PARITY_CHUNKS = [
+    [0, 0], [-1, 0], [3, 1], [-5, 4], [0, 11], [2, 21],
+    [-3, 45], [1, 70], [0, 90], [1000, 30], [-2500, 60],
+]
+
+
+@pytest.mark.asyncio
+async def test_export_chunks_returns_every_chunk(game):
+    """test_export_chunks should return one result per requested chunk."""
+    exported = await game.call(PATHS["main"], "test_export_chunks", [PARITY_CHUNKS[:2]])
+    assert [chunk["chunk"] for chunk in exported] == PARITY_CHUNKS[:2], (
+        "Expected one exported chunk per request, in order"
+    )
+    assert exported[0]["tiles"], "Surface chunk should have tiles"
+
+
+@pytest.mark.asyncio
+async def test_simulator_matches_game_chunks(game):
+    """worldgen_sim should reproduce the game's chunks exactly."""
+    exported = await game.call(PATHS["main"], "test_export_chunks", [PARITY_CHUNKS])
+    assert len(exported) == len(PARITY_CHUNKS), "Threaded generator unavailable"
+
+    problems = check_parity(load_world(), exported)
+    assert not problems, "Simulator differs from the game:\n" + "\n".join(problems[:20])